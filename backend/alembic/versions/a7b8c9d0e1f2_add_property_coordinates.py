@@ -0,0 +1,34 @@
+"""add_property_coordinates
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add latitude/longitude and a GiST index on their point for map searches."""
+    op.add_column('properties', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('longitude', sa.Float(), nullable=True))
+    op.execute(
+        "CREATE INDEX ix_properties_location ON properties USING gist (point(longitude, latitude))"
+    )
+
+
+def downgrade() -> None:
+    """Remove coordinates and their spatial index."""
+    op.drop_index('ix_properties_location', table_name='properties')
+    op.drop_column('properties', 'longitude')
+    op.drop_column('properties', 'latitude')
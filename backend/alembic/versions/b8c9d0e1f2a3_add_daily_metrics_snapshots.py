@@ -0,0 +1,44 @@
+"""add_daily_metrics_snapshots
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, Sequence[str], None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-day dashboard KPI snapshot table."""
+    op.create_table(
+        'daily_metrics_snapshots',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('total_properties', sa.Integer(), nullable=False),
+        sa.Column('available_properties', sa.Integer(), nullable=False),
+        sa.Column('sold_properties', sa.Integer(), nullable=False),
+        sa.Column('rented_properties', sa.Integer(), nullable=False),
+        sa.Column('total_clients', sa.Integer(), nullable=False),
+        sa.Column('pending_visits', sa.Integer(), nullable=False),
+        sa.Column('operations_interest', sa.Integer(), nullable=False),
+        sa.Column('operations_negotiation', sa.Integer(), nullable=False),
+        sa.Column('operations_reserved', sa.Integer(), nullable=False),
+        sa.Column('operations_closed', sa.Integer(), nullable=False),
+        sa.Column('operations_cancelled', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('day')
+    )
+
+
+def downgrade() -> None:
+    """Drop the snapshot table."""
+    op.drop_table('daily_metrics_snapshots')
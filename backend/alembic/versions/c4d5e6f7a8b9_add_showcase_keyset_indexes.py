@@ -0,0 +1,55 @@
+"""add_showcase_keyset_indexes
+
+Revision ID: c4d5e6f7a8b9
+Revises: d3d6fe7a1cb1
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d5e6f7a8b9'
+down_revision: Union[str, Sequence[str], None] = 'd3d6fe7a1cb1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SHOWCASE_PREDICATE = sa.text("is_active AND is_published AND status = 'AVAILABLE'")
+
+
+def upgrade() -> None:
+    """Add partial indexes matching the showcase keyset orderings."""
+    # sort=newest -> ORDER BY created_at DESC, id DESC
+    op.create_index(
+        'ix_properties_showcase_newest',
+        'properties',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=SHOWCASE_PREDICATE
+    )
+    # sort=price_asc -> ORDER BY price_amount ASC NULLS LAST, id ASC
+    op.create_index(
+        'ix_properties_showcase_price_asc',
+        'properties',
+        [sa.text('price_amount ASC NULLS LAST'), sa.text('id ASC')],
+        unique=False,
+        postgresql_where=SHOWCASE_PREDICATE
+    )
+    # sort=price_desc -> ORDER BY price_amount DESC NULLS LAST, id DESC
+    op.create_index(
+        'ix_properties_showcase_price_desc',
+        'properties',
+        [sa.text('price_amount DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=SHOWCASE_PREDICATE
+    )
+
+
+def downgrade() -> None:
+    """Remove showcase keyset indexes."""
+    op.drop_index('ix_properties_showcase_price_desc', table_name='properties')
+    op.drop_index('ix_properties_showcase_price_asc', table_name='properties')
+    op.drop_index('ix_properties_showcase_newest', table_name='properties')
@@ -0,0 +1,53 @@
+"""add_property_search_vector
+
+Revision ID: e5f6a7b8c9d0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'c4d5e6f7a8b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('spanish', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(city, '')), 'B') || "
+    "setweight(to_tsvector('spanish', coalesce(address_line1, '')), 'C') || "
+    "setweight(to_tsvector('spanish', coalesce(public_description, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    """Add generated Spanish tsvector column and its GIN index."""
+    # Generated column: Postgres keeps it in sync on every insert/update
+    op.add_column(
+        'properties',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_properties_search_vector',
+        'properties',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Remove full-text search column and index."""
+    op.drop_index('ix_properties_search_vector', table_name='properties')
+    op.drop_column('properties', 'search_vector')
@@ -0,0 +1,44 @@
+"""add_property_trigram_indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add pg_trgm GIN indexes for substring and fuzzy city/postal code filters."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_properties_city_trgm',
+        'properties',
+        ['city'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'city': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_properties_postal_code_trgm',
+        'properties',
+        ['postal_code'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'postal_code': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Remove trigram indexes (the extension is left installed)."""
+    op.drop_index('ix_properties_postal_code_trgm', table_name='properties')
+    op.drop_index('ix_properties_city_trgm', table_name='properties')
@@ -1,11 +1,15 @@
 import uuid
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.infrastructure.database.models.operation import Operation
 from app.infrastructure.database.models.operation_note import OperationNote
+from app.infrastructure.database.models.operation_status_history import OperationStatusHistory
+from app.infrastructure.database.models.visit import Visit
 from app.infrastructure.repositories.operation_repository import OperationRepository
 from app.infrastructure.repositories.property_repository import PropertyRepository
 from app.domain.schemas.operation import OperationCreate, OperationUpdate
 from app.domain.enums import OperationStatus, PropertyStatus, OperationType
+from app.infrastructure.database.unit_of_work import unit_of_work
 
 class OperationUseCase:
     def __init__(
@@ -17,26 +21,20 @@ class OperationUseCase:
         self.property_repo = property_repo
 
     def create_operation(self, db: Session, operation_in: OperationCreate) -> Operation:
-        operation = Operation(
-            type=operation_in.type,
-            status=operation_in.status,
-            client_id=operation_in.client_id,
-            property_id=operation_in.property_id,
-            agent_id=operation_in.agent_id
-        )
-        db.add(operation)
-        db.flush() # To get ID
+        with unit_of_work(db):
+            operation = self.operation_repo.create(db, Operation(
+                type=operation_in.type,
+                status=operation_in.status,
+                client_id=operation_in.client_id,
+                property_id=operation_in.property_id,
+                agent_id=operation_in.agent_id
+            ))
+
+            if operation_in.note:
+                self.operation_repo.create_note(
+                    db, operation_id=operation.id, author_id=operation_in.agent_id, text=operation_in.note
+                )
 
-        if operation_in.note:
-            note = OperationNote(
-                operation_id=operation.id,
-                author_user_id=operation_in.agent_id,
-                text=operation_in.note
-            )
-            db.add(note)
-        
-        db.commit()
-        db.refresh(operation)
         return operation
 
     def update_operation_status(
@@ -50,25 +48,27 @@ class OperationUseCase:
         if not operation:
             return None
         
-        # Update operation
-        updated_op = self.operation_repo.update(
-            db, 
-            operation_obj=operation, 
-            operation_in=operation_in,
-            user_id=user_id
-        )
+        # Operation and property status change are committed together
+        with unit_of_work(db):
+            # Update operation
+            updated_op = self.operation_repo.update(
+                db,
+                operation_obj=operation,
+                operation_in=operation_in,
+                user_id=user_id
+            )
 
-        # Logic: If CLOSED, update property status
-        if updated_op.status == OperationStatus.CLOSED:
-            property_obj = self.property_repo.get_by_id(db, updated_op.property_id)
-            if property_obj:
-                new_prop_status = PropertyStatus.SOLD if updated_op.type == OperationType.SALE else PropertyStatus.RENTED
-                self.property_repo.update(
-                    db, 
-                    property_obj=property_obj, 
-                    property_in={"status": new_prop_status},
-                    user_id=user_id
-                )
+            # Logic: If CLOSED, update property status
+            if updated_op.status == OperationStatus.CLOSED:
+                property_obj = self.property_repo.get_by_id(db, updated_op.property_id)
+                if property_obj:
+                    new_prop_status = PropertyStatus.SOLD if updated_op.type == OperationType.SALE else PropertyStatus.RENTED
+                    self.property_repo.update(
+                        db,
+                        property_obj=property_obj,
+                        property_in={"status": new_prop_status},
+                        user_id=user_id
+                    )
 
         return updated_op
 
@@ -78,5 +78,25 @@ class OperationUseCase:
     def get_operation(self, db: Session, operation_id: uuid.UUID):
         return self.operation_repo.get_by_id(db, operation_id)
 
+    def list_notes(
+        self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50
+    ) -> Optional[List[OperationNote]]:
+        if not self.operation_repo.exists(db, operation_id):
+            return None
+        return self.operation_repo.list_notes(db, operation_id, skip=skip, limit=limit)
+
+    def list_visits(self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50) -> Optional[List[Visit]]:
+        if not self.operation_repo.exists(db, operation_id):
+            return None
+        return self.operation_repo.list_visits(db, operation_id, skip=skip, limit=limit)
+
+    def list_status_history(
+        self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50
+    ) -> Optional[List[OperationStatusHistory]]:
+        if not self.operation_repo.exists(db, operation_id):
+            return None
+        return self.operation_repo.list_status_history(db, operation_id, skip=skip, limit=limit)
+
     def add_note(self, db: Session, operation_id: uuid.UUID, text: str, user_id: uuid.UUID) -> OperationNote:
-        return self.operation_repo.create_note(db, operation_id=operation_id, author_id=user_id, text=text)
+        with unit_of_work(db):
+            return self.operation_repo.create_note(db, operation_id=operation_id, author_id=user_id, text=text)
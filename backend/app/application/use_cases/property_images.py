@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 from app.domain.services.storage_service import StorageService
 from app.infrastructure.database.models.property_image import PropertyImage
 from app.infrastructure.repositories.property_image_repository import PropertyImageRepository
+from app.infrastructure.cache.response_cache import showcase_cache, property_tag
+from app.infrastructure.database.unit_of_work import unit_of_work, after_commit
 
 class PropertyImageUseCase:
     def __init__(self, storage_service: StorageService, repository: PropertyImageRepository):
@@ -25,28 +27,31 @@ class PropertyImageUseCase:
         if count == 0:
             is_cover = True
         
-        # 2. If it is a cover, unset other covers
-        if is_cover:
-            self.repository.unset_all_covers(db, property_id)
-        
-        # 3. Upload to storage
+        # 2. Upload to storage, before the transaction: no row locks held during the transfer
         # Path: properties/{property_id}
         folder = f"properties/{property_id}"
         storage_key = await self.storage_service.upload(file, filename, folder=folder)
         public_url = self.storage_service.get_url(storage_key)
         
-        # 4. Save to DB
-        image = PropertyImage(
-            property_id=property_id,
-            storage_key=storage_key,
-            public_url=public_url,
-            caption=caption,
-            alt_text=alt_text,
-            is_cover=is_cover,
-            position=count # Add to the end
-        )
-        
-        return self.repository.create(db, image)
+        with unit_of_work(db):
+            # 3. If it is a cover, unset other covers
+            if is_cover:
+                self.repository.unset_all_covers(db, property_id)
+
+            # 4. Save to DB
+            image = PropertyImage(
+                property_id=property_id,
+                storage_key=storage_key,
+                public_url=public_url,
+                caption=caption,
+                alt_text=alt_text,
+                is_cover=is_cover,
+                position=count # Add to the end
+            )
+
+            image = self.repository.create(db, image)
+            self._invalidate_after_commit(db, property_id)
+        return image
 
     async def delete_image(self, db: Session, image_id: uuid.UUID) -> bool:
         image = self.repository.get_by_id(db, image_id)
@@ -61,7 +66,9 @@ class PropertyImageUseCase:
             # We continue to mark as inactive in DB even if file delete fails
         
         # 2. Physical delete in DB
-        self.repository.delete(db, image)
+        with unit_of_work(db):
+            self.repository.delete(db, image)
+            self._invalidate_after_commit(db, image.property_id)
         
         return True
 
@@ -70,11 +77,19 @@ class PropertyImageUseCase:
         if not image or image.property_id != property_id:
             return False
         
-        self.repository.set_as_cover(db, property_id, image_id)
+        with unit_of_work(db):
+            self.repository.set_as_cover(db, property_id, image_id)
+            self._invalidate_after_commit(db, property_id)
         return True
 
     async def reorder_images(self, db: Session, property_id: uuid.UUID, image_ids: list[uuid.UUID]):
-        # Just simple sequential update based on the list order
-        for idx, img_id in enumerate(image_ids):
-            self.repository.update_position(db, img_id, idx)
+        # Just simple sequential update based on the list order, in a single transaction
+        with unit_of_work(db):
+            for idx, img_id in enumerate(image_ids):
+                self.repository.update_position(db, img_id, idx)
+            self._invalidate_after_commit(db, property_id)
         return True
+
+    @staticmethod
+    def _invalidate_after_commit(db: Session, property_id: uuid.UUID) -> None:
+        after_commit(db, lambda: showcase_cache.invalidate(property_tag(property_id)))
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, Optional
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from pydantic import model_validator
 
 class Settings(BaseSettings):
@@ -19,6 +19,15 @@ class Settings(BaseSettings):
                 i.strip() for i in data["BACKEND_CORS_ORIGINS"].split(",")
             ]
         return data
+
+    @model_validator(mode="before")
+    @classmethod
+    def assemble_replica_urls(cls, data: dict) -> dict:
+        if isinstance(data.get("DATABASE_REPLICA_URLS"), str):
+            data["DATABASE_REPLICA_URLS"] = [
+                i.strip() for i in data["DATABASE_REPLICA_URLS"].split(",") if i.strip()
+            ]
+        return data
     
     # Database Settings
     POSTGRES_USER: str = "postgres"
@@ -27,11 +36,63 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int = 5432
     DATABASE_URL: Optional[str] = None
+    ASYNC_DATABASE_URL: Optional[str] = None  # Defaults to DATABASE_URL with the asyncpg driver
+    DB_POOL_SIZE: int = 5  # Per worker process
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Wait for a free connection before failing the request
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # -1 keeps connections forever
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100.0  # Checkouts waiting longer are logged
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # Server-side statement_timeout, 0 disables
+    DB_APPLICATION_NAME: str = "mdevia-tfm-api"  # Shown in pg_stat_activity
+    DB_QUERY_CACHE_SIZE: int = 1000  # Compiled statements kept per engine (showcase filter combinations add up)
+    DATABASE_REPLICA_URLS: Annotated[list[str], NoDecode] = []  # Read replicas for GET endpoints, comma-separated
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0  # After a commit, reads sending back its X-Read-After token stay on the primary
+    DB_REPLICA_WRITE_GRACE_SECONDS: float = 1.0  # After any commit in this worker, every read stays on the primary
+    DB_REPLICA_RETRY_SECONDS: float = 30.0  # A replica that failed to connect is skipped for this long
+    DB_QUERY_STATS_ENABLED: bool = True  # Per-request statement count and DB time (Server-Timing header, logs)
+    DB_N_PLUS_ONE_THRESHOLD: int = 5  # Identical statements per request logged as a possible N+1
+    DB_SLOW_QUERY_MS: float = 500.0  # Statements slower than this are logged with their plan, 0 disables
+    DB_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = 300.0  # EXPLAIN ANALYZE re-runs a slow SELECT at most this often, 0 disables
+    DB_SLOW_QUERY_LOG_PATH: Optional[str] = None  # Rotating JSON-lines log (e.g. logs/slow_queries.log), unset disables
+    DB_SLOW_QUERY_LOG_MAX_BYTES: int = 10_000_000
+    DB_SLOW_QUERY_LOG_BACKUPS: int = 5
+    DB_SLOW_QUERY_MAX_ENTRIES: int = 200  # Distinct statements kept per worker for /system/slow-queries
+
+    # Showcase
+    SHOWCASE_TOTAL_CAP: int = 10000  # Max rows counted for keyset pages' total
+    SHOWCASE_CITY_SIMILARITY_THRESHOLD: float = 0.25  # pg_trgm cut-off for typo-tolerant city matches
+    SHOWCASE_CACHE_ENABLED: bool = True
+    SHOWCASE_CACHE_TTL_SECONDS: float = 60.0
+    SHOWCASE_CACHE_MAX_ENTRIES: int = 1024
+    SHOWCASE_DEFAULT_RADIUS_KM: float = 5.0  # near= searches without radius_km
+    SHOWCASE_CLUSTER_CELLS_PER_TILE: int = 8  # Map cluster grid resolution per tile side
+    SHOWCASE_CLUSTER_MAX_TILES: int = 64  # Largest bbox (in tiles) a clusters request may cover
+    SHOWCASE_INDEX_ENABLED: bool = False  # In-memory columnar index (requires numpy)
+    SHOWCASE_INDEX_SNAPSHOT_PATH: Optional[str] = None  # Shared mmap snapshot across workers
+    SHOWCASE_INDEX_REBUILD_SECONDS: float = 60.0  # Without a snapshot, each worker rebuilds its index this often to see other workers' writes
+
+    # Dashboard
+    DASHBOARD_CACHE_TTL_SECONDS: float = 30.0
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 512
+    METRICS_SNAPSHOT_JOB_ENABLED: bool = True  # Background refresh of daily KPI snapshots
+    METRICS_SNAPSHOT_INTERVAL_SECONDS: float = 3600.0
+    CHANGE_BUS_BACKEND: str = "local"  # local | postgres (LISTEN/NOTIFY across workers)
+    CHANGE_BUS_MAX_QUEUE: int = 100  # Pending events per live stream before asking it to resync
+    CHANGE_BUS_NOTIFY_QUEUE: int = 1000  # Change batches waiting to be NOTIFYed before new ones are dropped
+    CHANGE_BUS_CONNECT_TIMEOUT_SECONDS: int = 5  # LISTEN/NOTIFY connection attempts
+    DASHBOARD_STREAM_HEARTBEAT_SECONDS: float = 15.0
 
     # Security
     SECRET_KEY: str = "changeme"  # Should be changed in production
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0  # Bounds how long other workers serve a stale role/active flag
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 4096
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # Older hashes are upgraded on the next successful login
+    PASSWORD_HASH_WORKERS: int = 4  # Dedicated bcrypt threads, off the shared threadpool
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # Waiting hashes before logins are rejected with 503
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000  # Verified tokens kept until their exp (0 disables)
 
     # Storage Settings
     STORAGE_TYPE: str = "local" # local | cloudinary
@@ -53,6 +114,10 @@ class Settings(BaseSettings):
                 self.DATABASE_URL = self.DATABASE_URL.replace("postgres://", "postgresql://", 1)
         else:
             self.DATABASE_URL = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        self.DATABASE_REPLICA_URLS = [
+            url.replace("postgres://", "postgresql://", 1) if url.startswith("postgres://") else url
+            for url in self.DATABASE_REPLICA_URLS
+        ]
         return self
 
     model_config = SettingsConfigDict(
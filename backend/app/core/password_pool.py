@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.config import settings
+
+
+class PasswordPoolSaturated(RuntimeError):
+    """
+    Every worker is busy and the queue is full: the caller should answer 503
+    right away instead of waiting behind the burst.
+    """
+
+
+class PasswordHashingPool:
+    """
+    Dedicated, size-limited executor for bcrypt hashing and verification.
+
+    bcrypt costs tens of milliseconds of CPU per call. Running it here rather
+    than on the shared Starlette threadpool means a burst of logins queues up
+    behind `workers` threads instead of starving every sync endpoint, and once
+    `max_queue` calls are waiting new ones are rejected immediately.
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 32):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolSaturated("Password hashing queue is full")
+            self._in_flight += 1
+            self.peak_queued = max(self.peak_queued, self._in_flight - self.workers)
+        try:
+            return self._executor.submit(self._execute, time.monotonic(), fn, args)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs `fn(*args)` on the pool without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs `fn(*args)` on the pool and waits for it (for sync callers).
+        """
+        return self.submit(fn, *args).result()
+
+    def _execute(self, submitted_at: float, fn: Callable[..., Any], args: tuple) -> Any:
+        started_at = time.monotonic()
+        waited = started_at - submitted_at
+        with self._lock:
+            self._running += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._in_flight -= 1
+                self.completed += 1
+                self._run_total += time.monotonic() - started_at
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self.completed + self._running
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._in_flight - self._running,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self._wait_total / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 2),
+                "avg_run_ms": round(self._run_total / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+
+password_pool = PasswordHashingPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import Optional, List
 import uuid
 from decimal import Decimal
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from app.domain.enums import PropertyStatus, PropertyType, OperationType
 from app.domain.schemas.property_image import PropertyImage, PropertyImagePublic
@@ -40,6 +40,8 @@ class PropertyBase(BaseModel):
     address_line2: Optional[str] = None
     city: str
     postal_code: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     sqm: int
     rooms: int
     baths: int = 1
@@ -64,6 +66,8 @@ class PropertyUpdate(BaseModel):
     address_line2: Optional[str] = None
     city: Optional[str] = None
     postal_code: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     sqm: Optional[int] = None
     rooms: Optional[int] = None
     baths: Optional[int] = None
@@ -95,6 +99,8 @@ class PropertyPublic(BaseModel):
     address_line2: Optional[str] = None
     city: str
     postal_code: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     sqm: int
     rooms: int
     baths: int
@@ -111,12 +117,47 @@ class PropertyPublic(BaseModel):
     captor_agent: Optional[PropertyAgentPublic] = None
     created_at: datetime
     updated_at: datetime
+    # Only set on full-text search results (q=...)
+    search_rank: Optional[float] = None
+    search_headline: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 class PropertyPublicList(BaseModel):
     items: List[PropertyPublic]
+    total: Optional[int] = None
+    total_exact: bool = True
+    next_cursor: Optional[str] = None
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class PriceBucket(BaseModel):
+    min: Decimal
+    max: Decimal
+    count: int
+
+class PropertyFacets(BaseModel):
     total: int
+    property_type: List[FacetCount] = []
+    operation_type: List[FacetCount] = []
+    rooms: List[FacetCount] = []
+    baths: List[FacetCount] = []
+    has_elevator: List[FacetCount] = []
+    price_histogram: List[PriceBucket] = []
+
+class PropertyCluster(BaseModel):
+    lat: float
+    lon: float
+    count: int
+    price_min: Optional[Decimal] = None
+    price_max: Optional[Decimal] = None
+    property_id: uuid.UUID
+
+class PropertyClusterList(BaseModel):
+    zoom: int
+    clusters: List[PropertyCluster] = []
 
 class Property(PropertyBase):
     id: uuid.UUID
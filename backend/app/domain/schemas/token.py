@@ -1,8 +1,15 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from app.domain.enums import UserRole
 
 class Token(BaseModel):
     access_token: str
     token_type: str
 
 class TokenPayload(BaseModel):
+    # Shared between requests by the verified-token cache
+    model_config = ConfigDict(frozen=True)
+
     sub: str | None = None
+    exp: int | None = None
+    role: UserRole | None = None
+    full_name: str | None = None
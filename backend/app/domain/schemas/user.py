@@ -29,3 +29,11 @@ class User(UserBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class Principal(User):
+    """
+    Authenticated user as cached between requests: a read-only snapshot,
+    not bound to any session.
+    """
+    model_config = ConfigDict(from_attributes=True, frozen=True)
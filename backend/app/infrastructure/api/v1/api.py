@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.infrastructure.api.v1.endpoints import login, users, properties, clients, calendar_events, operations, visits, dashboard
+from app.infrastructure.api.v1.endpoints import login, users, properties, clients, calendar_events, operations, visits, dashboard, system
 
 api_router = APIRouter()
 api_router.include_router(login.router, tags=["login"])
@@ -11,3 +11,4 @@ api_router.include_router(operations.router, prefix="/operations", tags=["operat
 api_router.include_router(visits.router, prefix="/visits", tags=["visits"])
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 
+api_router.include_router(system.router, prefix="/system", tags=["system"])
@@ -7,19 +7,29 @@ from sqlalchemy.orm import Session
 from app.core import security
 from app.core.config import settings
 from app.domain.schemas.token import TokenPayload
+from app.domain.schemas.user import Principal
 from app.domain.enums import UserRole
-from app.infrastructure.database.models.user import User
 from app.infrastructure.database.session import get_db
+from app.infrastructure.database.async_session import get_async_db
+from app.infrastructure.database.replicas import get_read_db, get_async_read_db
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.cache.response_cache import principal_cache, principal_key, user_tag
+from app.infrastructure.cache.token_cache import token_cache
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(reusable_oauth2)
-) -> User:
+def get_token_payload(token: str = Depends(reusable_oauth2)) -> TokenPayload:
+    """
+    Claims of a valid token, without touching the database; tokens seen
+    before skip the signature check (see VerifiedTokenCache). `role` and
+    `full_name` are as of login: enough for endpoints that only display them,
+    not for authorization.
+    """
+    token_data = token_cache.get(token)
+    if token_data is not None:
+        return token_data
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -30,18 +40,33 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    
-    repo = UserRepository()
-    user = repo.get_by_email(db, email=token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
+    token_cache.set(token, token_data, expires_at=token_data.exp)
+    return token_data
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    token_data: TokenPayload = Depends(get_token_payload)
+) -> Principal:
+    """
+    The authenticated user, from the principal cache when possible: only a
+    miss (first request, expiry or after UserRepository.update) queries it.
+    """
+    key = principal_key(token_data.sub)
+    principal = principal_cache.get(key)
+    if principal is None:
+        repo = UserRepository()
+        user = repo.get_by_email(db, email=token_data.sub)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = Principal.model_validate(user)
+        principal_cache.set(key, principal, tags=[user_tag(principal.id)])
+    if not principal.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return user
+    return principal
 
 def get_current_active_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -50,8 +75,8 @@ def get_current_active_admin(
     return current_user
 
 def get_current_active_agent(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     # Admin inherits agent permissions
     if current_user.role not in [UserRole.AGENT, UserRole.ADMIN]:
         raise HTTPException(
@@ -72,7 +97,8 @@ def get_storage_service() -> StorageService:
     print("DEBUG: Using LocalStorageService")
     return LocalStorageService()
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentAdmin = Annotated[User, Depends(get_current_active_admin)]
-CurrentAgent = Annotated[User, Depends(get_current_active_agent)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
+CurrentAdmin = Annotated[Principal, Depends(get_current_active_admin)]
+CurrentAgent = Annotated[Principal, Depends(get_current_active_agent)]
+TokenClaims = Annotated[TokenPayload, Depends(get_token_payload)]
 Storage = Annotated[StorageService, Depends(get_storage_service)]
@@ -4,12 +4,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.session import get_db
-from app.infrastructure.database.models import User, CalendarEvent
-from app.infrastructure.api.v1.deps import get_current_user
+from app.infrastructure.database.replicas import get_async_read_db
+from app.infrastructure.database.unit_of_work import unit_of_work
+from app.infrastructure.database.models import CalendarEvent
+from app.infrastructure.api.v1.deps import CurrentUser
 from app.domain.schemas.calendar_event import CalendarEventCreate, CalendarEventUpdate, CalendarEventResponse
-from app.infrastructure.repositories.calendar_event_repository import CalendarEventRepository
+from app.infrastructure.repositories.calendar_event_repository import CalendarEventRepository, AsyncCalendarEventRepository
 from app.domain.enums import UserRole, EventType
 
 router = APIRouter()
@@ -19,7 +22,7 @@ def create_calendar_event(
     *,
     db: Session = Depends(get_db),
     event_in: CalendarEventCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Create a new calendar event.
@@ -36,29 +39,30 @@ def create_calendar_event(
         event_in.agent_id = current_user.id
         
     repo = CalendarEventRepository(db)
-    event = repo.create(event_in, event_in.agent_id)
+    with unit_of_work(db):
+        event = repo.create(event_in, event_in.agent_id)
     return event
 
 @router.get("/", response_model=List[CalendarEventResponse])
-def read_calendar_events(
-    db: Session = Depends(get_db),
+async def read_calendar_events(
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = 0,
     limit: int = 100,
     start_date: Optional[datetime] = Query(None, description="Filter events starting after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter events ending before this date"),
     agent_id: Optional[UUID] = Query(None, description="Filter by agent ID (Admin only)"),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     Retrieve calendar events.
     Agents can only see their own events.
     Admins can see all events or filter by agent.
     """
-    repo = CalendarEventRepository(db)
+    repo = AsyncCalendarEventRepository(db)
     
     if current_user.role == UserRole.AGENT:
         # Agent enforces strict filtering to self
-        events = repo.get_multi(
+        events = await repo.get_multi(
             skip=skip, 
             limit=limit, 
             agent_id=current_user.id,
@@ -67,7 +71,7 @@ def read_calendar_events(
         )
     else:
         # Admin can filter by agent_id or see all
-        events = repo.get_multi(
+        events = await repo.get_multi(
             skip=skip, 
             limit=limit, 
             agent_id=agent_id,
@@ -78,18 +82,18 @@ def read_calendar_events(
     return events
 
 @router.get("/{event_id}", response_model=CalendarEventResponse)
-def read_calendar_event(
+async def read_calendar_event(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     event_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Get calendar event by ID.
     Agents can only access their own events.
     """
-    repo = CalendarEventRepository(db)
-    event = repo.get(event_id)
+    repo = AsyncCalendarEventRepository(db)
+    event = await repo.get(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
         
@@ -104,7 +108,7 @@ def update_calendar_event(
     db: Session = Depends(get_db),
     event_id: UUID,
     event_in: CalendarEventUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Update a calendar event.
@@ -118,7 +122,8 @@ def update_calendar_event(
     if current_user.role == UserRole.AGENT and event.agent_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
         
-    event = repo.update(event, event_in)
+    with unit_of_work(db):
+        event = repo.update(event, event_in)
     return event
 
 @router.delete("/{event_id}", response_model=CalendarEventResponse)
@@ -126,7 +131,7 @@ def delete_calendar_event(
     *,
     db: Session = Depends(get_db),
     event_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Delete a calendar event.
@@ -140,5 +145,6 @@ def delete_calendar_event(
     if current_user.role == UserRole.AGENT and event.agent_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
         
-    repo.delete(event_id)
+    with unit_of_work(db):
+        repo.delete(event_id)
     return event
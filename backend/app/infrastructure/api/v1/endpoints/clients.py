@@ -1,8 +1,8 @@
 from typing import Any, List
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from app.infrastructure.api.v1.deps import get_db, CurrentUser
+from app.infrastructure.api.v1.deps import get_db, get_read_db, CurrentUser
 from app.domain.schemas.client import (
     Client as ClientSchema,
     ClientCreate,
@@ -11,15 +11,20 @@ from app.domain.schemas.client import (
     ClientNote as ClientNoteSchema,
     ClientNoteCreate
 )
+from app.domain.schemas.visit import VisitPublic
+from app.domain.schemas.operation import OperationPublic
 from app.infrastructure.database.models.client import Client
 from app.infrastructure.repositories.client_repository import ClientRepository
+from app.infrastructure.repositories.visit_repository import VisitRepository
+from app.infrastructure.repositories.operation_repository import OperationRepository
+from app.infrastructure.database.unit_of_work import unit_of_work
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ClientSchema])
 def read_clients(
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100
 ) -> Any:
@@ -48,12 +53,13 @@ def create_client(
         responsible_agent_id=client_in.responsible_agent_id,
         is_active=client_in.is_active
     )
-    return repo.create(db=db, client_obj=client)
+    with unit_of_work(db):
+        return repo.create(db=db, client_obj=client)
 
 @router.get("/{client_id}", response_model=ClientDetailSchema)
 def read_client(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID,
     current_user: CurrentUser
 ) -> Any:
@@ -87,7 +93,8 @@ def update_client(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
         )
-    client = repo.update(db=db, client_obj=client, client_in=client_in)
+    with unit_of_work(db):
+        client = repo.update(db=db, client_obj=client, client_in=client_in)
     return client
 
 @router.delete("/{client_id}", response_model=ClientSchema)
@@ -111,7 +118,8 @@ def delete_client(
     # For now, allow responsible agent or admin.
     # In future iterations, add permission checks.
     
-    repo.delete(db=db, client_id=client_id)
+    with unit_of_work(db):
+        repo.delete(db=db, client_id=client_id)
     return client
 
 @router.post("/{client_id}/notes", response_model=ClientNoteSchema)
@@ -133,9 +141,66 @@ def create_client_note(
             detail="Client not found"
         )
     
-    return repo.create_note(
-        db=db,
-        note_in=note_in,
-        client_id=client_id,
-        author_id=current_user.id
-    )
+    with unit_of_work(db):
+        return repo.create_note(
+            db=db,
+            note_in=note_in,
+            client_id=client_id,
+            author_id=current_user.id
+        )
+
+# ─────────────────────────────────────────────────────────────
+# DETAIL TABS: one page of a client's collection at a time
+# ─────────────────────────────────────────────────────────────
+
+def _ensure_client(db: Session, client_id: uuid.UUID) -> None:
+    if not ClientRepository().exists(db, client_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
+@router.get("/{client_id}/notes", response_model=List[ClientNoteSchema])
+def read_client_notes(
+    *,
+    db: Session = Depends(get_read_db),
+    client_id: uuid.UUID,
+    current_user: CurrentUser,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200)
+) -> Any:
+    """
+    Notes of a client, newest first.
+    """
+    _ensure_client(db, client_id)
+    return ClientRepository().list_notes(db, client_id=client_id, skip=skip, limit=limit)
+
+@router.get("/{client_id}/visits", response_model=List[VisitPublic])
+def read_client_visits(
+    *,
+    db: Session = Depends(get_read_db),
+    client_id: uuid.UUID,
+    current_user: CurrentUser,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200)
+) -> Any:
+    """
+    Visits of a client, latest scheduled first.
+    """
+    _ensure_client(db, client_id)
+    return VisitRepository().list_all(db, skip=skip, limit=limit, client_id=client_id)
+
+@router.get("/{client_id}/operations", response_model=List[OperationPublic])
+def read_client_operations(
+    *,
+    db: Session = Depends(get_read_db),
+    client_id: uuid.UUID,
+    current_user: CurrentUser,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200)
+) -> Any:
+    """
+    Active operations of a client, newest first.
+    """
+    _ensure_client(db, client_id)
+    return OperationRepository().list_all(db, skip=skip, limit=limit, client_id=client_id)
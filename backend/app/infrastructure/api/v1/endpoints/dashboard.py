@@ -1,16 +1,32 @@
-from typing import Any
-from fastapi import APIRouter, Depends
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+import asyncio
+import json
+import uuid
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime, timezone, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select, true
+from datetime import date, datetime, timezone, timedelta
 from pydantic import BaseModel, ConfigDict
 
-from app.infrastructure.api.v1.deps import get_db, CurrentUser
-from app.infrastructure.database.models import Property, Client, Visit, Operation
+from app.core.config import settings
+from app.infrastructure.api.v1.deps import get_read_db, get_async_read_db, CurrentUser
+from app.infrastructure.database.async_session import AsyncSessionLocal
+from app.infrastructure.events.change_bus import change_bus, RESYNC
+from app.infrastructure.database.models import Property, Client, Visit, Operation, DailyMetricsSnapshot
+from app.infrastructure.repositories.metrics_snapshot_repository import MetricsSnapshotRepository
+from app.infrastructure.cache.response_cache import dashboard_cache, agent_dashboard_tag, DASHBOARD_GLOBAL_TAG
 from app.domain.enums import VisitStatus, OperationStatus, PropertyStatus
 
 router = APIRouter()
 
+DASHBOARD_GLOBAL_KEY = "dashboard:global"
+
+# Dashboard builds in flight by cache key, with the dashboard_cache generation
+# they started at: concurrent misses on a key await the same build.
+_builds: Dict[str, Tuple[int, "asyncio.Future[DashboardResponse]"]] = {}
+
 
 class DashboardStats(BaseModel):
     total_properties: int
@@ -58,6 +74,24 @@ class RecentOperation(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DailyMetrics(BaseModel):
+    day: date
+    total_properties: int
+    available_properties: int
+    sold_properties: int
+    rented_properties: int
+    total_clients: int
+    pending_visits: int
+    active_operations: int
+    operations_interest: int
+    operations_negotiation: int
+    operations_reserved: int
+    operations_closed: int
+    operations_cancelled: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DashboardResponse(BaseModel):
     stats: DashboardStats
     upcoming_visits: list[UpcomingVisit]
@@ -65,60 +99,101 @@ class DashboardResponse(BaseModel):
     recent_operations: list[RecentOperation]
 
 
-@router.get("/", response_model=DashboardResponse)
-def get_dashboard(
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
-) -> Any:
+def build_dashboard(db: Session, agent_id: Optional[uuid.UUID] = None) -> DashboardResponse:
     """
-    Get dashboard data: stats, upcoming visits, recent properties and operations.
+    Stats, upcoming visits, recent properties and operations. With `agent_id`,
+    everything is scoped to that agent: captured properties, clients they are
+    responsible for, and their own visits and operations.
     """
-    # --- Stats ---
-    total_properties = db.query(func.count(Property.id)).filter(Property.is_active == True).scalar() or 0
-    available_properties = db.query(func.count(Property.id)).filter(
-        Property.is_active == True, Property.status == PropertyStatus.AVAILABLE
-    ).scalar() or 0
-    sold_properties = db.query(func.count(Property.id)).filter(
-        Property.is_active == True, Property.status == PropertyStatus.SOLD
-    ).scalar() or 0
-    rented_properties = db.query(func.count(Property.id)).filter(
-        Property.is_active == True, Property.status == PropertyStatus.RENTED
-    ).scalar() or 0
-    total_clients = db.query(func.count(Client.id)).filter(Client.is_active == True).scalar() or 0
-    pending_visits = db.query(func.count(Visit.id)).filter(Visit.status == VisitStatus.PENDING).scalar() or 0
-    active_operations = db.query(func.count(Operation.id)).filter(
-        Operation.status.in_([OperationStatus.INTEREST, OperationStatus.NEGOTIATION, OperationStatus.RESERVED])
-    ).scalar() or 0
-
-    # --- Tendencias (Comparativa última semana) ---
+    def owned(column: Any) -> list:
+        return [column == agent_id] if agent_id is not None else []
+
+    # --- Stats + Tendencias (Comparativa última semana) ---
+    # One statement: a single-row aggregate per table using COUNT(*) FILTER,
+    # cross-joined. Each trend compares the current count with the daily
+    # snapshot of a week ago; without a snapshot (not backfilled yet, or an
+    # agent-scoped dashboard: snapshots are company-wide) it falls back to the
+    # rows that match the same criteria and already existed then.
     today = datetime.now(timezone.utc)
     one_week_ago = today - timedelta(days=7)
-    two_weeks_ago = today - timedelta(days=14)
-
-    def get_trend(model: Any, filter_criteria: Any = None) -> float:
-        query_current = db.query(func.count(model.id))
-        query_previous = db.query(func.count(model.id))
-        
-        if filter_criteria is not None:
-            query_current = query_current.filter(filter_criteria)
-            query_previous = query_previous.filter(filter_criteria)
-            
-        current_count = query_current.scalar() or 0
-        previous_count = query_previous.filter(model.created_at <= one_week_ago).scalar() or 0
-        
+    active_operation_statuses = [OperationStatus.INTEREST, OperationStatus.NEGOTIATION, OperationStatus.RESERVED]
+
+    property_active = and_(Property.is_active == True, *owned(Property.captor_agent_id))
+    client_active = and_(Client.is_active == True, *owned(Client.responsible_agent_id))
+    visit_pending = and_(Visit.status == VisitStatus.PENDING, *owned(Visit.agent_id))
+    operation_active = and_(Operation.status.in_(active_operation_statuses), *owned(Operation.agent_id))
+
+    def previous(snapshot_column: Any, fallback: Any) -> Any:
+        if agent_id is not None:
+            return fallback
+        snapshot_value = (
+            select(snapshot_column)
+            .where(DailyMetricsSnapshot.day == one_week_ago.date())
+            .scalar_subquery()
+        )
+        return func.coalesce(snapshot_value, fallback)
+
+    property_stats = select(
+        func.count().filter(property_active).label("total"),
+        previous(
+            DailyMetricsSnapshot.total_properties,
+            func.count().filter(property_active, Property.created_at <= one_week_ago),
+        ).label("total_prev"),
+        func.count().filter(property_active, Property.status == PropertyStatus.AVAILABLE).label("available"),
+        func.count().filter(property_active, Property.status == PropertyStatus.SOLD).label("sold"),
+        func.count().filter(property_active, Property.status == PropertyStatus.RENTED).label("rented"),
+    ).subquery("property_stats")
+    client_stats = select(
+        func.count().filter(client_active).label("total"),
+        previous(
+            DailyMetricsSnapshot.total_clients,
+            func.count().filter(client_active, Client.created_at <= one_week_ago),
+        ).label("total_prev"),
+    ).subquery("client_stats")
+    visit_stats = select(
+        func.count().filter(visit_pending).label("pending"),
+        previous(
+            DailyMetricsSnapshot.pending_visits,
+            func.count().filter(visit_pending, Visit.created_at <= one_week_ago),
+        ).label("pending_prev"),
+    ).subquery("visit_stats")
+    operation_stats = select(
+        func.count().filter(operation_active).label("active"),
+        previous(
+            DailyMetricsSnapshot.operations_interest
+            + DailyMetricsSnapshot.operations_negotiation
+            + DailyMetricsSnapshot.operations_reserved,
+            func.count().filter(operation_active, Operation.created_at <= one_week_ago),
+        ).label("active_prev"),
+    ).subquery("operation_stats")
+
+    # Single-row subqueries: joined on TRUE, explicitly, so it isn't linted as a cartesian product
+    row = db.execute(
+        select(property_stats, client_stats, visit_stats, operation_stats).select_from(
+            property_stats.join(client_stats, true()).join(visit_stats, true()).join(operation_stats, true())
+        )
+    ).one()
+    (
+        total_properties, previous_properties, available_properties, sold_properties, rented_properties,
+        total_clients, previous_clients,
+        pending_visits, previous_pending_visits,
+        active_operations, previous_active_operations,
+    ) = row
+
+    def get_trend(current_count: int, previous_count: int) -> float:
         if previous_count == 0:
             return 100.0 if current_count > 0 else 0.0
         return round(((current_count - previous_count) / previous_count) * 100, 1)
 
     stats = DashboardStats(
         total_properties=total_properties,
-        total_properties_trend=get_trend(Property, Property.is_active == True),
+        total_properties_trend=get_trend(total_properties, previous_properties),
         total_clients=total_clients,
-        total_clients_trend=get_trend(Client, Client.is_active == True),
+        total_clients_trend=get_trend(total_clients, previous_clients),
         pending_visits=pending_visits,
-        pending_visits_trend=get_trend(Visit, Visit.status == VisitStatus.PENDING),
+        pending_visits_trend=get_trend(pending_visits, previous_pending_visits),
         active_operations=active_operations,
-        active_operations_trend=get_trend(Operation, Operation.status.in_([OperationStatus.INTEREST, OperationStatus.NEGOTIATION, OperationStatus.RESERVED])),
+        active_operations_trend=get_trend(active_operations, previous_active_operations),
         available_properties=available_properties,
         sold_properties=sold_properties,
         rented_properties=rented_properties,
@@ -136,6 +211,7 @@ def get_dashboard(
             Visit.status == VisitStatus.PENDING,
             Visit.scheduled_at >= now,
             Visit.scheduled_at <= week_ahead,
+            *owned(Visit.agent_id),
         )
         .order_by(Visit.scheduled_at.asc())
         .limit(5)
@@ -156,7 +232,7 @@ def get_dashboard(
     # --- Recent Properties (last 5 created) ---
     recent_props = (
         db.query(Property)
-        .filter(Property.is_active == True)
+        .filter(Property.is_active == True, *owned(Property.captor_agent_id))
         .order_by(Property.created_at.desc())
         .limit(5)
         .all()
@@ -179,6 +255,7 @@ def get_dashboard(
         db.query(Operation, Client.full_name, Property.title)
         .join(Client, Operation.client_id == Client.id)
         .join(Property, Operation.property_id == Property.id)
+        .filter(*owned(Operation.agent_id))
         .order_by(Operation.created_at.desc())
         .limit(5)
         .all()
@@ -202,3 +279,152 @@ def get_dashboard(
         recent_properties=recent_properties,
         recent_operations=recent_operations,
     )
+
+
+async def cached_dashboard(db: AsyncSession, agent_id: Optional[uuid.UUID] = None) -> DashboardResponse:
+    """
+    `build_dashboard` behind dashboard_cache (company-wide or per agent).
+    Hits never leave the event loop; misses run it through run_sync, on the
+    async driver. Concurrent misses share one build (after a commit, every
+    open stream asks at once), unless the cache was invalidated since that
+    build started: its result could predate the write, so it is neither
+    joined nor cached.
+    """
+    if agent_id is None:
+        key, tag = DASHBOARD_GLOBAL_KEY, DASHBOARD_GLOBAL_TAG
+    else:
+        key = tag = agent_dashboard_tag(agent_id)
+    while True:
+        dashboard = dashboard_cache.get(key)
+        if dashboard is not None:
+            return dashboard
+        generation = dashboard_cache.generation
+        build = _builds.get(key)
+        if build is None or build[0] != generation:
+            break
+        try:
+            return await asyncio.shield(build[1])
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates; a failed build is retried
+            if not build[1].cancelled():
+                raise
+
+    future = asyncio.get_running_loop().create_future()
+    _builds[key] = (generation, future)
+    try:
+        dashboard = await db.run_sync(build_dashboard, agent_id=agent_id)
+        if dashboard_cache.generation == generation:
+            dashboard_cache.set(key, dashboard, tags=[tag])
+        future.set_result(dashboard)
+        return dashboard
+    except BaseException:
+        # Waiters build it themselves (this session may be gone, e.g. a closed stream)
+        future.cancel()
+        raise
+    finally:
+        if _builds.get(key, (None, None))[1] is future:
+            del _builds[key]
+
+
+@router.get("/", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Any:
+    """
+    Get dashboard data: stats, upcoming visits, recent properties and operations.
+    Company-wide; cached briefly and invalidated by visit, operation, property
+    and client writes.
+    """
+    return await cached_dashboard(db)
+
+
+@router.get("/me", response_model=DashboardResponse)
+async def get_my_dashboard(
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Any:
+    """
+    Dashboard scoped to the current agent. Cached per agent and invalidated
+    by writes touching that agent's visits, operations, properties or clients.
+    """
+    return await cached_dashboard(db, agent_id=current_user.id)
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _current_stats(agent_id: Optional[uuid.UUID]) -> dict:
+    # Own session: the request's one is released once the streaming response starts
+    async with AsyncSessionLocal() as db:
+        return (await cached_dashboard(db, agent_id=agent_id)).stats.model_dump()
+
+
+async def dashboard_events(request: Request, agent_id: Optional[uuid.UUID]) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for one dashboard tab: the current stats, then every
+    visit/operation/property/client change in scope followed by the updated stats.
+    Idle tabs only receive a keep-alive comment, no queries.
+    """
+    subscription = change_bus.subscribe(agent_id)
+    try:
+        last_stats = await _current_stats(agent_id)
+        yield _sse("stats", last_stats)
+        while not await request.is_disconnected():
+            try:
+                change = await asyncio.wait_for(
+                    subscription.get(), timeout=settings.DASHBOARD_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if change is RESYNC:
+                # Too far behind: the client refetches the full dashboard
+                yield _sse("resync", {})
+                continue
+            yield _sse(change["type"], change)
+            # Send the rest of a burst before recomputing counters once
+            while not subscription.queue.empty():
+                change = await subscription.get()
+                yield _sse(change["type"], change) if change is not RESYNC else _sse("resync", {})
+            stats = await _current_stats(agent_id)
+            if stats != last_stats:
+                last_stats = stats
+                yield _sse("stats", stats)
+    finally:
+        change_bus.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_dashboard(
+    request: Request,
+    current_user: CurrentUser,
+    scope: str = Query("me", pattern="^(me|global)$", description="me: own dashboard, global: company-wide"),
+) -> StreamingResponse:
+    """
+    Live dashboard (text/event-stream). Events: `stats`, `visit`,
+    `operation`, `property`, `client` (deltas with action
+    created/updated/deleted)
+    and `resync` (refetch /dashboard/). Replaces polling.
+    """
+    agent_id = current_user.id if scope == "me" else None
+    return StreamingResponse(
+        dashboard_events(request, agent_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/metrics", response_model=list[DailyMetrics])
+def get_dashboard_metrics(
+    current_user: CurrentUser,
+    days: int = Query(30, ge=1, le=366, description="Number of days up to today"),
+    db: Session = Depends(get_read_db),
+) -> Any:
+    """
+    Daily KPI time series from the pre-aggregated snapshots (one row per day).
+    Days without a snapshot are omitted; run the backfill script to fill them.
+    """
+    today = datetime.now(timezone.utc).date()
+    return MetricsSnapshotRepository().list_range(db, today - timedelta(days=days - 1), today)
@@ -1,19 +1,45 @@
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Any, Optional, Tuple
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.core import security
 from app.core.config import settings
+from app.core.password_pool import password_pool, PasswordPoolSaturated
 from app.domain.schemas.token import Token
+from app.domain.schemas.user import Principal
+from app.infrastructure.api.v1.deps import CurrentAdmin
 from app.infrastructure.database.session import get_db
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.database.unit_of_work import unit_of_work
 
 router = APIRouter()
 
+def _find_user(db: Session, repo: UserRepository, email: str) -> Tuple[Optional[Principal], Optional[str]]:
+    """
+    Snapshot and password hash of the user with `email`. Ends the transaction
+    so the connection goes back to the pool before the bcrypt check, which may
+    wait in the password pool queue.
+    """
+    try:
+        user = repo.get_by_email(db, email=email)
+        if user is None:
+            return None, None
+        return Principal.model_validate(user), user.password_hash
+    finally:
+        db.rollback()
+
+def _save_password_hash(db: Session, repo: UserRepository, user_id: uuid.UUID, password_hash: str) -> None:
+    with unit_of_work(db):
+        user = repo.get_by_id(db, user_id)
+        if user is not None:
+            repo.update(db, db_obj=user, obj_in={"password_hash": password_hash})
+
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
+async def login_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     remember: Annotated[bool, Form()] = False,
     db: Session = Depends(get_db)
@@ -21,11 +47,28 @@ def login_access_token(
     """
     OAuth2 compatible token login, get an access token for future requests.
     Note: The 'username' field expects the user's email.
+
+    The bcrypt check runs on the dedicated password pool; when its queue is
+    full the login is rejected with 503 instead of waiting.
     """
     repo = UserRepository()
-    user = repo.get_by_email(db, email=form_data.username)
-    
-    if not user or not security.verify_password(form_data.password, user.password_hash):
+    # A detached snapshot: nothing below touches the session on the event loop
+    user, password_hash = await run_in_threadpool(_find_user, db, repo, form_data.username)
+
+    valid, new_hash = False, None
+    if user:
+        try:
+            valid, new_hash = await password_pool.run(
+                security.verify_and_update_password, form_data.password, password_hash
+            )
+        except PasswordPoolSaturated:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many login attempts in progress, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password",
@@ -33,6 +76,10 @@ def login_access_token(
     
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+
+    if new_hash:
+        # Hashed with an older cost factor: store it with the current one
+        await run_in_threadpool(_save_password_hash, db, repo, user.id, new_hash)
         
     if remember:
         access_token_expires = timedelta(days=7)
@@ -47,3 +94,10 @@ def login_access_token(
     )
     
     return Token(access_token=access_token, token_type="bearer")
+
+@router.get("/login/password-pool/stats")
+def read_password_pool_stats(current_admin: CurrentAdmin) -> Any:
+    """
+    Load of the password hashing pool: queue depth, waits and rejections (Admin only).
+    """
+    return password_pool.stats()
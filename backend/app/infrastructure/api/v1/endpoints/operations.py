@@ -1,9 +1,12 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 import uuid
-from app.infrastructure.api.v1.deps import CurrentAgent, get_db
-from app.domain.schemas.operation import OperationPublic, OperationCreate, OperationUpdate, OperationNotePublic, OperationNoteCreate
+from app.infrastructure.api.v1.deps import CurrentAgent, get_db, get_read_db
+from app.domain.schemas.operation import (
+    OperationPublic, OperationCreate, OperationUpdate, OperationNotePublic, OperationNoteCreate, OperationStatusHistoryPublic
+)
+from app.domain.schemas.visit import VisitPublic
 from app.infrastructure.repositories.operation_repository import OperationRepository
 from app.infrastructure.repositories.property_repository import PropertyRepository
 from app.application.use_cases.operation_use_case import OperationUseCase
@@ -19,7 +22,7 @@ def get_operation_use_case():
 @router.get("/", response_model=List[OperationPublic])
 def read_operations(
     current_agent: CurrentAgent,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     use_case: OperationUseCase = Depends(get_operation_use_case)
@@ -48,7 +51,7 @@ def create_operation(
 def read_operation(
     id: uuid.UUID,
     current_agent: CurrentAgent,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     use_case: OperationUseCase = Depends(get_operation_use_case)
 ) -> Any:
     """
@@ -59,6 +62,57 @@ def read_operation(
         raise HTTPException(status_code=404, detail="Operation not found")
     return operation
 
+@router.get("/{id}/notes", response_model=List[OperationNotePublic])
+def read_operation_notes(
+    id: uuid.UUID,
+    current_agent: CurrentAgent,
+    db: Session = Depends(get_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    use_case: OperationUseCase = Depends(get_operation_use_case)
+) -> Any:
+    """
+    Notes of an operation, oldest first.
+    """
+    notes = use_case.list_notes(db, operation_id=id, skip=skip, limit=limit)
+    if notes is None:
+        raise HTTPException(status_code=404, detail="Operation not found")
+    return notes
+
+@router.get("/{id}/visits", response_model=List[VisitPublic])
+def read_operation_visits(
+    id: uuid.UUID,
+    current_agent: CurrentAgent,
+    db: Session = Depends(get_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    use_case: OperationUseCase = Depends(get_operation_use_case)
+) -> Any:
+    """
+    Visits of the operation's client to its property, latest scheduled first.
+    """
+    visits = use_case.list_visits(db, operation_id=id, skip=skip, limit=limit)
+    if visits is None:
+        raise HTTPException(status_code=404, detail="Operation not found")
+    return visits
+
+@router.get("/{id}/status-history", response_model=List[OperationStatusHistoryPublic])
+def read_operation_status_history(
+    id: uuid.UUID,
+    current_agent: CurrentAgent,
+    db: Session = Depends(get_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    use_case: OperationUseCase = Depends(get_operation_use_case)
+) -> Any:
+    """
+    Status changes of an operation, oldest first.
+    """
+    history = use_case.list_status_history(db, operation_id=id, skip=skip, limit=limit)
+    if history is None:
+        raise HTTPException(status_code=404, detail="Operation not found")
+    return history
+
 @router.patch("/{id}", response_model=OperationPublic)
 def update_operation_status(
     *,
@@ -1,37 +1,102 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
+import json
+import math
 import uuid
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Form, Query
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Form, Query, Response, Header
 from sqlalchemy.orm import Session
-from app.infrastructure.api.v1.deps import get_db, CurrentUser, CurrentAdmin, CurrentAgent, get_storage_service
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.api.v1.deps import get_db, get_read_db, get_async_read_db, CurrentUser, CurrentAdmin, CurrentAgent, get_storage_service
 from app.domain.schemas.property_image import PropertyImage as PropertyImageSchema, ReorderImages
-from app.domain.schemas.property import Property, PropertyCreate, PropertyUpdate, PropertyPublic, PropertyNote, PropertyNoteCreate, PropertyPublicList
+from app.domain.schemas.property import Property, PropertyCreate, PropertyUpdate, PropertyPublic, PropertyNote, PropertyNoteCreate, PropertyPublicList, PropertyFacets, PropertyClusterList, PropertyStatusHistory
+from app.domain.schemas.visit import VisitPublic
+from app.domain.schemas.operation import OperationPublic
 from app.application.use_cases.property_images import PropertyImageUseCase
 from app.infrastructure.repositories.property_image_repository import PropertyImageRepository
-from app.infrastructure.repositories.property_repository import PropertyRepository
+from app.infrastructure.repositories.property_repository import PropertyRepository, AsyncPropertyRepository, parse_bbox, parse_point
+from app.infrastructure.repositories.visit_repository import VisitRepository
+from app.infrastructure.repositories.operation_repository import OperationRepository
 from app.infrastructure.database.models.property import Property as PropertyModel
 from app.domain.services.storage_service import StorageService
-from app.domain.enums import PropertyStatus, PropertyType, OperationType
+from app.domain.enums import PropertyType, OperationType
+from app.core.config import settings
+from app.infrastructure.cache.response_cache import showcase_cache, property_tag, SHOWCASE_LIST_TAG
+from app.infrastructure.database.unit_of_work import unit_of_work
 
 router = APIRouter()
 
 def get_property_repository(db: Session = Depends(get_db)) -> PropertyRepository:
     return PropertyRepository()
 
+def get_async_property_repository() -> AsyncPropertyRepository:
+    return AsyncPropertyRepository()
+
 def get_property_image_use_case(
     storage_service: StorageService = Depends(get_storage_service),
     repository: PropertyImageRepository = Depends(PropertyImageRepository)
 ) -> PropertyImageUseCase:
     return PropertyImageUseCase(storage_service, repository)
 
+def _showcase_cache_key(prefix: str, params: Dict[str, Any]) -> str:
+    """
+    Builds a cache key that is identical for equivalent filter sets
+    (parameter order, repeated types, trailing zeros in prices...).
+    """
+    normalized = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, Decimal):
+            value = str(value.normalize())
+        elif isinstance(value, list):
+            value = sorted({str(getattr(v, "value", v)) for v in value})
+        elif hasattr(value, "value"):
+            value = value.value
+        normalized[name] = value
+    return f"{prefix}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+def _cached_json(body: bytes, hit: bool, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": "HIT" if hit else "MISS", **(headers or {})},
+    )
+
+def _public_etag(property: PropertyModel) -> str:
+    """
+    Weak validator derived from updated_at. Gallery edits don't touch the
+    property row, so the newest image timestamp and image count are folded in.
+    """
+    stamps = [property.updated_at] + [img.updated_at for img in property.images]
+    version = max(stamps).timestamp()
+    return f'W/"{property.id}-{version:.6f}-{len(property.images)}"'
+
+def _detail_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": f"public, max-age={int(settings.SHOWCASE_CACHE_TTL_SECONDS)}"}
+
+def _cluster_tile_ranges(bbox: Tuple[float, float, float, float], tile_size: float) -> Tuple[range, range]:
+    """
+    x and y ranges of the square-degree tiles covering `bbox`, clamped to
+    the world; tile (x, y) spans lon [x*size, (x+1)*size) and
+    lat [y*size, (y+1)*size).
+    """
+    west, south, east, north = bbox
+    first_x, last_x = math.floor(-180 / tile_size), math.ceil(180 / tile_size) - 1
+    first_y, last_y = math.floor(-90 / tile_size), math.ceil(90 / tile_size) - 1
+    xs = range(max(math.floor(west / tile_size), first_x), min(math.floor(east / tile_size), last_x) + 1)
+    ys = range(max(math.floor(south / tile_size), first_y), min(math.floor(north / tile_size), last_y) + 1)
+    return xs, ys
+
 
 # ─────────────────────────────────────────────────────────────
 # PUBLIC SHOWCASE ENDPOINT (No auth required)
 # ─────────────────────────────────────────────────────────────
 
 @router.get("/public", response_model=PropertyPublicList)
-def list_public_properties(
-    city: Optional[str] = Query(None, description="Filter by city (case-insensitive)"),
+async def list_public_properties(
+    q: Optional[str] = Query(None, min_length=2, max_length=200, description="Full-text search (Spanish), ranked by relevance"),
+    city: Optional[str] = Query(None, description="Filter by city or postal code (substring)"),
+    city_fuzzy: bool = Query(False, description="Also match misspelled cities (trigram similarity)"),
     price_min: Optional[Decimal] = Query(None, ge=0, description="Minimum price"),
     price_max: Optional[Decimal] = Query(None, ge=0, description="Maximum price"),
     sqm_min: Optional[int] = Query(None, ge=0, description="Minimum square meters"),
@@ -42,19 +107,28 @@ def list_public_properties(
     operation_type: Optional[OperationType] = Query(None, description="Type of operation (SALE/RENT)"),
     has_elevator: Optional[bool] = Query(None, description="Filter by elevator presence"),
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
-    sort: Optional[str] = Query(None, description="Sorting field: price_asc, price_desc, newest"),
+    bbox: Optional[str] = Query(None, description="Map bounds: min_lon,min_lat,max_lon,max_lat"),
+    near: Optional[str] = Query(None, description="Center point for radius search: lat,lon"),
+    radius_km: Optional[float] = Query(None, gt=0, le=200, description="Radius around `near` in km (default 5)"),
+    sort: Optional[str] = Query(None, description="Sorting field: price_asc, price_desc, newest, relevance (default when q is set)"),
     limit: int = Query(50, ge=1, le=100, description="Max results per page"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
-    db: Session = Depends(get_db),
-    repo: PropertyRepository = Depends(get_property_repository),
+    offset: int = Query(0, ge=0, description="Number of results to skip (ignored when cursor is set)"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from the previous page (keyset pagination)"),
+    include_total: bool = Query(True, description="Compute total; set to false to skip counting"),
+    db: AsyncSession = Depends(get_async_read_db),
+    repo: AsyncPropertyRepository = Depends(get_async_property_repository),
 ) -> Any:
     """
     Public showcase: list available properties with optional filters.
     No authentication required.
+    Pass the returned next_cursor back as `cursor` (with the same filters and sort)
+    to walk the catalogue at constant cost per page.
+    With include_total=false the total is not computed and comes back as null.
     """
-    return repo.list_published(
-        db=db,
+    filters = dict(
+        q=q,
         city=city,
+        city_fuzzy=city_fuzzy,
         price_min=price_min,
         price_max=price_max,
         sqm_min=sqm_min,
@@ -65,27 +139,204 @@ def list_public_properties(
         operation_type=operation_type,
         has_elevator=has_elevator,
         is_featured=is_featured,
-        offset=offset,
-        limit=limit,
-        sort=sort,
     )
+    try:
+        geo = dict(
+            bbox=parse_bbox(bbox) if bbox else None,
+            near=parse_point(near) if near else None,
+            radius_km=radius_km,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cache_key = _showcase_cache_key("list", {
+        **filters, **geo, "sort": sort, "limit": limit, "offset": None if cursor else offset,
+        "cursor": cursor, "include_total": include_total,
+    })
+    if settings.SHOWCASE_CACHE_ENABLED:
+        cached = showcase_cache.get(cache_key)
+        if cached is not None:
+            return _cached_json(cached, hit=True)
+
+    try:
+        result = await repo.list_published(
+            db,
+            **filters,
+            **geo,
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    body = result.model_dump_json().encode()
+    if settings.SHOWCASE_CACHE_ENABLED:
+        tags = [SHOWCASE_LIST_TAG] + [property_tag(p.id) for p in result.items]
+        showcase_cache.set(cache_key, body, tags=tags)
+    return _cached_json(body, hit=False)
+
+@router.get("/public/facets", response_model=PropertyFacets)
+def read_public_facets(
+    q: Optional[str] = Query(None, min_length=2, max_length=200, description="Full-text search (Spanish)"),
+    city: Optional[str] = Query(None, description="Filter by city or postal code (substring)"),
+    city_fuzzy: bool = Query(False, description="Also match misspelled cities (trigram similarity)"),
+    price_min: Optional[Decimal] = Query(None, ge=0, description="Minimum price"),
+    price_max: Optional[Decimal] = Query(None, ge=0, description="Maximum price"),
+    sqm_min: Optional[int] = Query(None, ge=0, description="Minimum square meters"),
+    sqm_max: Optional[int] = Query(None, ge=0, description="Maximum square meters"),
+    rooms: Optional[int] = Query(None, ge=1, description="Minimum number of rooms (1+)"),
+    baths: Optional[int] = Query(None, ge=1, description="Minimum number of baths (1+)"),
+    property_type: Optional[List[PropertyType]] = Query(None, description="Type of property"),
+    operation_type: Optional[OperationType] = Query(None, description="Type of operation (SALE/RENT)"),
+    has_elevator: Optional[bool] = Query(None, description="Filter by elevator presence"),
+    is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
+    price_buckets: int = Query(10, ge=1, le=50, description="Number of price histogram buckets"),
+    db: Session = Depends(get_read_db),
+    repo: PropertyRepository = Depends(get_property_repository),
+) -> Any:
+    """
+    Public showcase facets: counts per property type, operation type, rooms,
+    baths, elevator and a price histogram for the given filter set.
+    No authentication required.
+    """
+    filters = dict(
+        q=q,
+        city=city,
+        city_fuzzy=city_fuzzy,
+        price_min=price_min,
+        price_max=price_max,
+        sqm_min=sqm_min,
+        sqm_max=sqm_max,
+        rooms=rooms,
+        baths=baths,
+        property_type=property_type,
+        operation_type=operation_type,
+        has_elevator=has_elevator,
+        is_featured=is_featured,
+    )
+    cache_key = _showcase_cache_key("facets", {**filters, "price_buckets": price_buckets})
+    if settings.SHOWCASE_CACHE_ENABLED:
+        cached = showcase_cache.get(cache_key)
+        if cached is not None:
+            return _cached_json(cached, hit=True)
+
+    result = repo.published_facets(db=db, price_buckets=price_buckets, **filters)
+    body = PropertyFacets.model_validate(result).model_dump_json().encode()
+    if settings.SHOWCASE_CACHE_ENABLED:
+        # Facets depend on every matching property, so any property write purges them
+        showcase_cache.set(cache_key, body, tags=[SHOWCASE_LIST_TAG])
+    return _cached_json(body, hit=False)
+
+@router.get("/public/clusters", response_model=PropertyClusterList)
+def read_public_clusters(
+    bbox: str = Query(..., description="Map bounds: min_lon,min_lat,max_lon,max_lat"),
+    zoom: int = Query(..., ge=0, le=20, description="Map zoom level"),
+    price_min: Optional[Decimal] = Query(None, ge=0, description="Minimum price"),
+    price_max: Optional[Decimal] = Query(None, ge=0, description="Maximum price"),
+    property_type: Optional[List[PropertyType]] = Query(None, description="Type of property"),
+    operation_type: Optional[OperationType] = Query(None, description="Type of operation (SALE/RENT)"),
+    db: Session = Depends(get_read_db),
+    repo: PropertyRepository = Depends(get_property_repository),
+) -> Any:
+    """
+    Public map clusters: published properties grouped into grid cells
+    (a tile of 360/2^zoom degrees split into SHOWCASE_CLUSTER_CELLS_PER_TILE
+    cells per side). Each cell has a count, price range, centroid and a
+    representative property id. Tiles are cached individually, so panning
+    only computes the newly visible ones. No authentication required.
+    """
+    try:
+        bounds = parse_bbox(bbox)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    tile_size = 360 / 2 ** zoom
+    cells_per_tile = settings.SHOWCASE_CLUSTER_CELLS_PER_TILE
+    xs, ys = _cluster_tile_ranges(bounds, tile_size)
+    # Checked on the range sizes: at high zoom a large bbox spans billions of tiles
+    if len(xs) * len(ys) > settings.SHOWCASE_CLUSTER_MAX_TILES:
+        raise HTTPException(status_code=400, detail="bbox is too large for this zoom level")
+    tiles = [(x, y) for x in xs for y in ys]
+
+    filters = dict(
+        price_min=price_min,
+        price_max=price_max,
+        property_type=property_type,
+        operation_type=operation_type,
+    )
+    key_prefix = _showcase_cache_key(f"clusters:{zoom}", filters)
+    clusters_by_tile: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    missing = []
+    for tile in tiles:
+        cached = showcase_cache.get(f"{key_prefix}:{tile[0]}:{tile[1]}") if settings.SHOWCASE_CACHE_ENABLED else None
+        if cached is None:
+            missing.append(tile)
+        else:
+            clusters_by_tile[tile] = cached
+
+    if missing:
+        # One grouped query over the box enclosing every uncached tile
+        query_bbox = (
+            max(min(x for x, _ in missing) * tile_size, -180.0),
+            max(min(y for _, y in missing) * tile_size, -90.0),
+            min((max(x for x, _ in missing) + 1) * tile_size, 180.0),
+            min((max(y for _, y in missing) + 1) * tile_size, 90.0),
+        )
+        fresh: Dict[Tuple[int, int], List[Dict[str, Any]]] = {tile: [] for tile in missing}
+        for cell in repo.published_clusters(db, bbox=query_bbox, cell_size=tile_size / cells_per_tile, **filters):
+            tile = (cell.pop("gx") // cells_per_tile, cell.pop("gy") // cells_per_tile)
+            if tile in fresh:
+                fresh[tile].append(cell)
+        for tile, cells in fresh.items():
+            clusters_by_tile[tile] = cells
+            if settings.SHOWCASE_CACHE_ENABLED:
+                showcase_cache.set(f"{key_prefix}:{tile[0]}:{tile[1]}", cells, tags=[SHOWCASE_LIST_TAG])
+
+    return {"zoom": zoom, "clusters": [cell for tile in tiles for cell in clusters_by_tile[tile]]}
 
 @router.get("/public/{id}", response_model=PropertyPublic)
-def get_public_property(
+async def get_public_property(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     id: uuid.UUID,
-    repo: PropertyRepository = Depends(get_property_repository),
+    if_none_match: Optional[str] = Header(None),
+    repo: AsyncPropertyRepository = Depends(get_async_property_repository),
 ) -> Any:
     """
     Get public property details by ID.
     No authentication required.
     Only returns if is_published=True and status=AVAILABLE.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
     """
-    property = repo.get_by_id(db=db, property_id=id)
-    if not property or not property.is_published or property.status != PropertyStatus.AVAILABLE:
+    cache_key = f"detail:{id}"
+    if settings.SHOWCASE_CACHE_ENABLED:
+        cached = showcase_cache.get(cache_key)
+        if cached is not None:
+            body, etag = cached
+            if if_none_match == etag:
+                return Response(status_code=304, headers=_detail_headers(etag))
+            return _cached_json(body, hit=True, headers=_detail_headers(etag))
+
+    property = await repo.get_public_by_id(db, property_id=id)
+    if not property:
         raise HTTPException(status_code=404, detail="Property not found or not available")
-    return property
+
+    etag = _public_etag(property)
+    body = PropertyPublic.model_validate(property).model_dump_json().encode()
+    if settings.SHOWCASE_CACHE_ENABLED:
+        showcase_cache.set(cache_key, (body, etag), tags=[property_tag(property.id)])
+    if if_none_match == etag:
+        return Response(status_code=304, headers=_detail_headers(etag))
+    return _cached_json(body, hit=False, headers=_detail_headers(etag))
+
+@router.get("/public-cache/stats")
+def read_showcase_cache_stats(current_admin: CurrentAdmin) -> Any:
+    """
+    Hit/miss counters of the public showcase response cache (Admin only).
+    """
+    return showcase_cache.stats()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -96,14 +347,15 @@ def get_public_property(
 def read_properties(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    q: Optional[str] = Query(None, min_length=2, max_length=200, description="Full-text search (Spanish)"),
+    db: Session = Depends(get_read_db),
     repo: PropertyRepository = Depends(get_property_repository),
     current_user: CurrentUser = CurrentUser
 ) -> Any:
     """
     Retrieve properties.
     """
-    properties = repo.list_all(db=db, skip=skip, limit=limit)
+    properties = repo.list_all(db=db, skip=skip, limit=limit, q=q)
     return properties
 
 @router.post("/", response_model=Property)
@@ -123,13 +375,14 @@ def create_property(
         captor_agent_id=current_user.id
     )
     
-    property = repo.create(db=db, property_obj=property_obj)
+    with unit_of_work(db):
+        property = repo.create(db=db, property_obj=property_obj)
     return property
 
 @router.get("/{id}", response_model=Property)
 def read_property(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     id: uuid.UUID,
     repo: PropertyRepository = Depends(get_property_repository),
     current_user: CurrentUser
@@ -158,7 +411,8 @@ def update_property(
     if not property:
         raise HTTPException(status_code=404, detail="Property not found")
         
-    property = repo.update(db=db, property_obj=property, property_in=property_in, user_id=current_user.id)
+    with unit_of_work(db):
+        property = repo.update(db=db, property_obj=property, property_in=property_in, user_id=current_user.id)
     return property
 
 @router.post("/{id}/notes", response_model=PropertyNote)
@@ -177,9 +431,80 @@ def create_property_note(
     if not property:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    note = repo.create_note(db=db, property_id=id, note_in=note_in, author_id=current_user.id)
+    with unit_of_work(db):
+        note = repo.create_note(db=db, property_id=id, note_in=note_in, author_id=current_user.id)
     return note
 
+# Detail tabs: one page of a property's collection at a time
+
+def _ensure_property(db: Session, repo: PropertyRepository, property_id: uuid.UUID) -> None:
+    if not repo.exists(db, property_id):
+        raise HTTPException(status_code=404, detail="Property not found")
+
+@router.get("/{id}/notes", response_model=List[PropertyNote])
+def read_property_notes(
+    *,
+    db: Session = Depends(get_read_db),
+    id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    repo: PropertyRepository = Depends(get_property_repository),
+    current_user: CurrentUser
+) -> Any:
+    """
+    Notes of a property, newest first.
+    """
+    _ensure_property(db, repo, id)
+    return repo.list_notes(db, property_id=id, skip=skip, limit=limit)
+
+@router.get("/{id}/status-history", response_model=List[PropertyStatusHistory])
+def read_property_status_history(
+    *,
+    db: Session = Depends(get_read_db),
+    id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    repo: PropertyRepository = Depends(get_property_repository),
+    current_user: CurrentUser
+) -> Any:
+    """
+    Status and price changes of a property, oldest first.
+    """
+    _ensure_property(db, repo, id)
+    return repo.list_status_history(db, property_id=id, skip=skip, limit=limit)
+
+@router.get("/{id}/visits", response_model=List[VisitPublic])
+def read_property_visits(
+    *,
+    db: Session = Depends(get_read_db),
+    id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    repo: PropertyRepository = Depends(get_property_repository),
+    current_user: CurrentUser
+) -> Any:
+    """
+    Visits to a property, latest scheduled first.
+    """
+    _ensure_property(db, repo, id)
+    return VisitRepository().list_all(db, skip=skip, limit=limit, property_id=id)
+
+@router.get("/{id}/operations", response_model=List[OperationPublic])
+def read_property_operations(
+    *,
+    db: Session = Depends(get_read_db),
+    id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    repo: PropertyRepository = Depends(get_property_repository),
+    current_user: CurrentUser
+) -> Any:
+    """
+    Active operations on a property, newest first.
+    """
+    _ensure_property(db, repo, id)
+    return OperationRepository().list_all(db, skip=skip, limit=limit, property_id=id)
+
 @router.post("/{property_id}/images", response_model=PropertyImageSchema)
 async def upload_property_image(
     *,
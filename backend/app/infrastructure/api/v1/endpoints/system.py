@@ -0,0 +1,66 @@
+import os
+from typing import Any, Literal
+from fastapi import APIRouter, Query
+
+from app.infrastructure.api.v1.deps import CurrentAdmin
+from app.infrastructure.database.session import engine
+from app.infrastructure.database.async_session import async_engine
+from app.infrastructure.database.replicas import read_replicas
+from app.infrastructure.database.query_stats import compiled_cache, compiled_cache_usage
+from app.infrastructure.database.slow_queries import slow_queries
+
+router = APIRouter()
+
+@router.get("/db-pool")
+def read_db_pool_stats(current_admin: CurrentAdmin) -> Any:
+    """
+    Connection pools of the worker serving the request (sync engine and the
+    async one behind the hot read endpoints): connections checked out,
+    overflow in use, checkout waits and hold times. `read_replicas` has the
+    same for each replica, their health, and how many reads stayed on the
+    primary and why (Admin only).
+    """
+    return {
+        "sync": engine.pool.stats(),
+        "async": async_engine.pool.stats(),
+        "read_replicas": read_replicas.stats(),
+    }
+
+@router.get("/compiled-cache")
+def read_compiled_cache_stats(current_admin: CurrentAdmin) -> Any:
+    """
+    Compiled statement cache of the worker serving the request: hits and
+    misses since it started and how full each engine's cache is. A falling
+    hit rate with full caches means DB_QUERY_CACHE_SIZE is too small for
+    the statement variants in use (Admin only).
+    """
+    return {
+        "pid": os.getpid(),
+        **compiled_cache.snapshot(),
+        "sync": compiled_cache_usage(engine),
+        "async": compiled_cache_usage(async_engine.sync_engine),
+        "read_replicas": [
+            {"name": replica.name, "sync": compiled_cache_usage(replica.engine),
+             "async": compiled_cache_usage(replica.async_engine.sync_engine)}
+            for replica in read_replicas.replicas
+        ],
+    }
+
+@router.get("/slow-queries")
+def read_slow_queries(
+    current_admin: CurrentAdmin,
+    limit: int = Query(20, ge=1, le=200),
+    order_by: Literal["total_ms", "max_ms", "avg_ms", "count"] = "total_ms",
+) -> Any:
+    """
+    Top offenders among the statements slower than DB_SLOW_QUERY_MS seen by
+    the worker serving the request: timings, the endpoints that ran them,
+    their last (redacted) parameters and EXPLAIN (ANALYZE, BUFFERS) plan.
+    The rotating slow query log has every execution of every worker
+    (Admin only).
+    """
+    return {
+        "pid": os.getpid(),
+        "threshold_ms": slow_queries.threshold_ms,
+        "queries": slow_queries.top(limit, order_by),
+    }
@@ -2,14 +2,23 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 import uuid
-from app.infrastructure.api.v1.deps import CurrentUser, CurrentAdmin, get_db
+from app.infrastructure.api.v1.deps import CurrentUser, CurrentAdmin, get_db, get_read_db
 from app.domain.schemas.user import User, UserCreate, UserUpdate
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.database.unit_of_work import unit_of_work
 from app.core import security
+from app.core.password_pool import password_pool, PasswordPoolSaturated
 from app.domain.enums import UserRole
 
 router = APIRouter()
 
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Password hashing is saturated, please retry",
+        headers={"Retry-After": "1"},
+    )
+
 @router.get("/me", response_model=User)
 def read_user_me(current_user: CurrentUser) -> Any:
     """
@@ -20,7 +29,7 @@ def read_user_me(current_user: CurrentUser) -> Any:
 @router.get("/", response_model=list[User])
 def read_users(
     current_admin: CurrentAdmin,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100
 ) -> Any:
@@ -50,23 +59,28 @@ def create_user(
         )
     
     # Hash password and force role to AGENT
-    user_obj = repo.create(
-        db, 
-        obj_in={
-            "email": user_in.email,
-            "full_name": user_in.full_name,
-            "password_hash": security.get_password_hash(user_in.password),
-            "role": UserRole.AGENT,
-            "is_active": user_in.is_active
-        }
-    )
+    try:
+        password_hash = password_pool.call(security.get_password_hash, user_in.password)
+    except PasswordPoolSaturated:
+        raise _password_pool_busy()
+    with unit_of_work(db):
+        user_obj = repo.create(
+            db,
+            obj_in={
+                "email": user_in.email,
+                "full_name": user_in.full_name,
+                "password_hash": password_hash,
+                "role": UserRole.AGENT,
+                "is_active": user_in.is_active
+            }
+        )
     return user_obj
 
 @router.get("/{user_id}", response_model=User)
 def read_user_by_id(
     user_id: uuid.UUID,
     current_admin: CurrentAdmin,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> Any:
     """
     Get a specific user by ID (Admin only).
@@ -98,5 +112,9 @@ def update_user(
             status_code=404,
             detail="User not found",
         )
-    user = repo.update(db, db_obj=user, obj_in=user_in)
+    try:
+        with unit_of_work(db):
+            user = repo.update(db, db_obj=user, obj_in=user_in)
+    except PasswordPoolSaturated:
+        raise _password_pool_busy()
     return user
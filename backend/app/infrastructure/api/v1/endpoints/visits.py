@@ -2,7 +2,7 @@ from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 import uuid
-from app.infrastructure.api.v1.deps import CurrentAgent, get_db
+from app.infrastructure.api.v1.deps import CurrentAgent, get_db, get_read_db
 from app.domain.schemas.visit import VisitPublic, VisitCreate, VisitUpdate, VisitNotePublic, VisitNoteCreate
 from app.infrastructure.repositories.visit_repository import VisitRepository
 from app.infrastructure.repositories.calendar_event_repository import CalendarEventRepository
@@ -24,7 +24,7 @@ def get_visit_use_case(db: Session = Depends(get_db)):
 @router.get("/", response_model=List[VisitPublic])
 def read_visits(
     current_agent: CurrentAgent,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     agent_id: Optional[uuid.UUID] = Query(None),
@@ -78,7 +78,7 @@ def create_visit(
 def read_visit(
     id: uuid.UUID,
     current_agent: CurrentAgent,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     use_case: VisitUseCase = Depends(get_visit_use_case)
 ) -> Any:
     """
@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from app.core.config import settings
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of serialized responses with TTL and tag invalidation.
+
+    Each entry is stored with a set of tags (e.g. "property:<id>"). Writers call
+    `invalidate(*tags)` to purge every entry carrying any of those tags, so
+    readers never need to know which writes affect them.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any, Set[str]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Bumped by every invalidate() call, even one removing nothing: lets a
+        # reader tell whether a value it is computing may already be stale
+        self.generation = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = ()) -> None:
+        tag_set = set(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, tag_set)
+            for tag in tag_set:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        Drops every entry tagged with any of `tags`. Returns how many were removed.
+        """
+        removed = 0
+        with self._lock:
+            self.generation += 1
+            for tag in tags:
+                for key in self._tags.pop(tag, set()):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _remove(self, key: str) -> None:
+        # Caller must hold the lock
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+# Tag carried by every cached showcase listing. Any property create/update may
+# change which properties match a filter set, so it purges all listings.
+SHOWCASE_LIST_TAG = "showcase:list"
+
+
+def property_tag(property_id: Any) -> str:
+    return f"property:{property_id}"
+
+
+showcase_cache = ResponseCache(
+    max_entries=settings.SHOWCASE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SHOWCASE_CACHE_TTL_SECONDS,
+)
+
+
+# Dashboards: the company-wide one carries DASHBOARD_GLOBAL_TAG, each agent's
+# own dashboard its agent tag. Writers invalidate both for the agents involved.
+DASHBOARD_GLOBAL_TAG = "dashboard:global"
+
+
+def agent_dashboard_tag(agent_id: Any) -> str:
+    return f"dashboard:agent:{agent_id}"
+
+
+dashboard_cache = ResponseCache(
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_dashboards(*agent_ids: Any) -> int:
+    """
+    Drops the company-wide dashboard and those of `agent_ids` (None ignored).
+    """
+    tags = {agent_dashboard_tag(agent_id) for agent_id in agent_ids if agent_id is not None}
+    return dashboard_cache.invalidate(DASHBOARD_GLOBAL_TAG, *tags)
+
+
+# Authenticated principals, keyed by token subject and tagged by user id so an
+# update drops the entry even when it changes the email.
+principal_cache = ResponseCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def principal_key(subject: str) -> str:
+    return f"principal:{subject}"
+
+
+def user_tag(user_id: Any) -> str:
+    return f"user:{user_id}"
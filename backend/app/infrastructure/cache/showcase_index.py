@@ -0,0 +1,547 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+import uuid
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency: without NumPy the index stays disabled
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; snapshots are then single-writer
+    fcntl = None
+
+from app.core.config import settings
+from app.domain.enums import PropertyStatus, PropertyType, OperationType
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PROPERTY_TYPES = list(PropertyType)
+_OPERATION_TYPES = list(OperationType)
+
+# Column name -> dtype. Every column is a flat array indexed by row slot.
+COLUMNS = {
+    "id_hi": "<u8",
+    "id_lo": "<u8",
+    "created_at": "<i8",    # microseconds since epoch (UTC)
+    "price": "<i8",         # cents; meaningless where has_price is False
+    "has_price": "?",
+    "sqm": "<i4",
+    "rooms": "<i2",
+    "baths": "<i2",
+    "property_type": "i1",
+    "operation_type": "i1",
+    "has_elevator": "?",
+    "is_featured": "?",
+    "city": "<i4",          # code into the city dictionary
+    "postal_code": "<i4",   # code into the postal code dictionary (0 = none)
+    "alive": "?",
+}
+
+# Properties attributes the index needs, in the order `build` expects them
+INDEXED_ATTRIBUTES = (
+    "id", "created_at", "price_amount", "sqm", "rooms", "baths", "property_type",
+    "operation_type", "has_elevator", "is_featured", "city", "postal_code",
+)
+
+# Detached copy of those attributes, safe to keep past the write's session
+IndexedRow = namedtuple("IndexedRow", INDEXED_ATTRIBUTES)
+
+
+def is_showcase_eligible(prop: Any) -> bool:
+    return bool(prop.is_active and prop.is_published and prop.status == PropertyStatus.AVAILABLE)
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _to_cents(value: Decimal) -> int:
+    return int(Decimal(value).scaleb(2).to_integral_value())
+
+
+def _trigrams(text: str) -> set:
+    # Same extraction as pg_trgm: lower-cased alphanumeric words padded with
+    # two leading blanks and one trailing blank.
+    grams = set()
+    for word in re.findall(r"\w+", text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """
+    Python equivalent of pg_trgm's similarity(), used on the city dictionary.
+    """
+    ta, tb = _trigrams(a), _trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    common = len(ta & tb)
+    return common / (len(ta) + len(tb) - common)
+
+
+class ShowcaseIndex:
+    """
+    In-process columnar copy of the published, available properties.
+
+    Holds the columns `list_published` filters and sorts on as NumPy arrays
+    (cities and postal codes dictionary-encoded), evaluates filters as boolean
+    masks and returns the ordered page ids; the caller hydrates only those rows.
+
+    Writes go through `apply`, which upserts or removes a single row. With a
+    snapshot path, the writer also dumps the columns to one flat file that the
+    other workers memory-map read-only and pick up on their next search.
+    Without one, a worker never sees the others' writes, so its copy is
+    rebuilt from the database every `rebuild_seconds`.
+    """
+
+    def __init__(self, snapshot_path: Optional[str] = None, rebuild_seconds: float = 0.0):
+        self.snapshot_path = snapshot_path
+        self.rebuild_seconds = rebuild_seconds
+        self._built_at = float("-inf")  # time.monotonic() of the last build
+        self._lock = threading.RLock()
+        self._columns: Optional[Dict[str, Any]] = None
+        self._size = 0
+        self._rows: Dict[uuid.UUID, int] = {}
+        self._cities: List[str] = []
+        self._city_codes: Dict[str, int] = {}
+        self._postal_codes: List[Optional[str]] = [None]
+        self._postal_code_codes: Dict[str, int] = {}
+        self._writable = False
+        self._snapshot_version: Optional[int] = None
+        self._snapshot_stat: Optional[Tuple[int, int]] = None  # (st_ino, st_mtime_ns) of the meta file last read
+        # Writes applied while a rebuild is loading rows, replayed on its result
+        self._pending: Optional[List[Tuple[uuid.UUID, Optional[IndexedRow]]]] = None
+
+    @property
+    def available(self) -> bool:
+        return np is not None
+
+    @property
+    def loaded(self) -> bool:
+        return self._columns is not None
+
+    # Loading
+
+    def build(self, rows: Iterable[Any]) -> None:
+        """
+        Replaces the index content with `rows` (objects exposing INDEXED_ATTRIBUTES).
+        The columns are filled in a separate index and swapped in, so searches
+        keep running on the current copy meanwhile.
+        """
+        rows = list(rows)
+        fresh = ShowcaseIndex()
+        fresh._reset(capacity=max(len(rows), 16))
+        for row in rows:
+            fresh._upsert(row)
+        with self._lock:
+            for property_id, row in self._pending or ():
+                fresh._apply_row(property_id, row)
+            self._pending = None
+            self._adopt(fresh)
+            self._built_at = time.monotonic()
+            self._save_snapshot()
+
+    def ensure_loaded(self, load_rows) -> None:
+        """
+        Makes the index ready: from the shared snapshot when there is one,
+        otherwise from `load_rows()` (a callable hitting the database), again
+        whenever a rebuild is due.
+        """
+        with self._lock:
+            if self.loaded:
+                if not self._rebuild_due():
+                    self._reload_if_stale()
+                    return
+                # This thread rebuilds; the others keep searching the current copy
+                self._built_at = time.monotonic()
+                self._pending = []
+            else:
+                if self._load_snapshot():
+                    return
+                with self._file_lock():
+                    if self._load_snapshot():
+                        return
+                    self.build(load_rows())
+                return
+        try:
+            self.build(load_rows())
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def _rebuild_due(self) -> bool:
+        return (
+            not self.snapshot_path
+            and self.rebuild_seconds > 0
+            and time.monotonic() - self._built_at >= self.rebuild_seconds
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._columns = None
+            self._size = 0
+            self._rows = {}
+            self._snapshot_version = None
+            self._snapshot_stat = None
+
+    def _adopt(self, other: "ShowcaseIndex") -> None:
+        (
+            self._columns, self._size, self._rows, self._cities, self._city_codes,
+            self._postal_codes, self._postal_code_codes, self._writable,
+        ) = (
+            other._columns, other._size, other._rows, other._cities, other._city_codes,
+            other._postal_codes, other._postal_code_codes, other._writable,
+        )
+
+    def _reset(self, capacity: int) -> None:
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._size = 0
+        self._rows = {}
+        self._cities = []
+        self._city_codes = {}
+        self._postal_codes = [None]
+        self._postal_code_codes = {}
+        self._writable = True
+
+    # Writes
+
+    def apply(self, prop: Any) -> None:
+        """
+        Mirrors a committed property write: upserts it while it belongs to the
+        showcase, removes it otherwise. No-op until the index has been loaded.
+        """
+        if not self.available:
+            return
+        row = IndexedRow(*(getattr(prop, name) for name in INDEXED_ATTRIBUTES)) if is_showcase_eligible(prop) else None
+        with self._lock:
+            if not self.loaded and not self._load_snapshot():
+                return
+            with self._file_lock():
+                self._reload_if_stale()
+                self._apply_row(prop.id, row)
+                self._save_snapshot()
+            if self._pending is not None:
+                # A rebuild may have read the rows before this write
+                self._pending.append((prop.id, row))
+
+    def _apply_row(self, property_id: uuid.UUID, row: Optional[IndexedRow]) -> None:
+        if row is not None:
+            self._upsert(row)
+        else:
+            self._remove(property_id)
+
+    def _upsert(self, row: Any) -> None:
+        self._ensure_writable()
+        slot = self._rows.get(row.id)
+        if slot is None:
+            if self._size == len(self._columns["alive"]):
+                self._grow()
+            slot = self._size
+            self._size += 1
+            self._rows[row.id] = slot
+        cols = self._columns
+        id_int = row.id.int
+        cols["id_hi"][slot] = id_int >> 64
+        cols["id_lo"][slot] = id_int & 0xFFFFFFFFFFFFFFFF
+        cols["created_at"][slot] = _to_micros(row.created_at)
+        cols["has_price"][slot] = row.price_amount is not None
+        cols["price"][slot] = _to_cents(row.price_amount) if row.price_amount is not None else 0
+        cols["sqm"][slot] = row.sqm
+        cols["rooms"][slot] = row.rooms
+        cols["baths"][slot] = row.baths
+        cols["property_type"][slot] = _PROPERTY_TYPES.index(PropertyType(row.property_type))
+        cols["operation_type"][slot] = _OPERATION_TYPES.index(OperationType(row.operation_type))
+        cols["has_elevator"][slot] = bool(row.has_elevator)
+        cols["is_featured"][slot] = bool(row.is_featured)
+        cols["city"][slot] = self._encode(row.city, self._cities, self._city_codes)
+        cols["postal_code"][slot] = (
+            self._encode(row.postal_code, self._postal_codes, self._postal_code_codes)
+            if row.postal_code else 0
+        )
+        cols["alive"][slot] = True
+
+    def _remove(self, property_id: uuid.UUID) -> None:
+        slot = self._rows.get(property_id)
+        if slot is None:
+            return
+        self._ensure_writable()
+        del self._rows[property_id]
+        self._columns["alive"][slot] = False
+        if len(self._rows) * 2 < self._size:
+            self._compact()
+
+    @staticmethod
+    def _encode(value: str, values: List[Optional[str]], codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = len(values)
+            values.append(value)
+            codes[value] = code
+        return code
+
+    def _grow(self) -> None:
+        capacity = max(16, len(self._columns["alive"]) * 2)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._columns["alive"][:self._size])
+        capacity = max(16, len(keep) * 2)
+        for name, column in self._columns.items():
+            packed = np.zeros(capacity, dtype=column.dtype)
+            packed[:len(keep)] = column[keep]
+            self._columns[name] = packed
+        self._size = len(keep)
+        self._rows = {self._slot_id(slot): slot for slot in range(self._size)}
+
+    def _ensure_writable(self) -> None:
+        # Snapshot columns are read-only memory maps: copy before the first write
+        if not self._writable:
+            capacity = max(16, self._size * 2)
+            for name, column in self._columns.items():
+                copy = np.zeros(capacity, dtype=column.dtype)
+                copy[:self._size] = column[:self._size]
+                self._columns[name] = copy
+            self._writable = True
+
+    def _slot_id(self, slot: int) -> uuid.UUID:
+        return uuid.UUID(int=(int(self._columns["id_hi"][slot]) << 64) | int(self._columns["id_lo"][slot]))
+
+    # Reads
+
+    def search(
+        self,
+        *,
+        sort: str,
+        cursor: Optional[Tuple[str, Any, uuid.UUID]] = None,
+        offset: int = 0,
+        limit: int = 50,
+        city: Optional[str] = None,
+        city_fuzzy: bool = False,
+        price_min: Optional[Decimal] = None,
+        price_max: Optional[Decimal] = None,
+        sqm_min: Optional[int] = None,
+        sqm_max: Optional[int] = None,
+        rooms: Optional[int] = None,
+        baths: Optional[int] = None,
+        property_type: Optional[List[PropertyType]] = None,
+        operation_type: Optional[OperationType] = None,
+        has_elevator: Optional[bool] = None,
+        is_featured: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ordered ids of the requested page (up to `limit + 1`, the extra one
+        signalling a next page) and the total number of matches.
+        `cursor` is a decoded keyset cursor (see `decode_showcase_cursor`).
+        """
+        with self._lock:
+            self._reload_if_stale()
+            n = self._size
+            c = {name: column[:n] for name, column in self._columns.items()}
+
+            mask = c["alive"].copy()
+            if city is not None:
+                mask &= self._city_mask(city, city_fuzzy, c)
+            if price_min is not None:
+                mask &= c["has_price"] & (c["price"] >= math.ceil(Decimal(price_min) * 100))
+            if price_max is not None:
+                mask &= c["has_price"] & (c["price"] <= math.floor(Decimal(price_max) * 100))
+            if sqm_min is not None:
+                mask &= c["sqm"] >= sqm_min
+            if sqm_max is not None:
+                mask &= c["sqm"] <= sqm_max
+            if rooms is not None:
+                mask &= c["rooms"] >= rooms
+            if baths is not None:
+                mask &= c["baths"] >= baths
+            if property_type:
+                codes = [_PROPERTY_TYPES.index(PropertyType(t)) for t in property_type]
+                mask &= np.isin(c["property_type"], codes)
+            if operation_type is not None:
+                mask &= c["operation_type"] == _OPERATION_TYPES.index(OperationType(operation_type))
+            if has_elevator is not None:
+                mask &= c["has_elevator"] == has_elevator
+            if is_featured is not None:
+                mask &= c["is_featured"] == is_featured
+
+            total = int(np.count_nonzero(mask))
+            if cursor is not None:
+                mask &= self._after_cursor(sort, cursor, c)
+                offset = 0
+
+            selected = np.flatnonzero(mask)
+            order = selected[self._sort_order(sort, selected, c)]
+            page = order[offset:offset + limit + 1]
+            ids = [self._slot_id(slot) for slot in page]
+        return {"ids": ids, "total": total}
+
+    def _city_mask(self, term: str, fuzzy: bool, c: Dict[str, Any]):
+        # Same semantics as the SQL filter (substring on city or postal code,
+        # plus trigram similarity on city when fuzzy), evaluated once per
+        # dictionary entry.
+        needle = term.lower()
+        threshold = settings.SHOWCASE_CITY_SIMILARITY_THRESHOLD
+        city_hits = np.fromiter(
+            (
+                needle in value.lower() or (fuzzy and trigram_similarity(value, term) >= threshold)
+                for value in self._cities
+            ),
+            dtype=bool, count=len(self._cities),
+        )
+        postal_hits = np.fromiter(
+            (value is not None and needle in value.lower() for value in self._postal_codes),
+            dtype=bool, count=len(self._postal_codes),
+        )
+        return city_hits[c["city"]] | postal_hits[c["postal_code"]]
+
+    @staticmethod
+    def _sort_order(sort: str, selected, c: Dict[str, Any]):
+        # np.lexsort sorts by the last key first; ids break every tie like in SQL
+        id_hi, id_lo = c["id_hi"][selected], c["id_lo"][selected]
+        if sort == "price_asc":
+            # Unpriced properties last
+            return np.lexsort((id_lo, id_hi, c["price"][selected], ~c["has_price"][selected]))
+        if sort == "price_desc":
+            return np.lexsort((id_lo, id_hi, c["price"][selected], c["has_price"][selected]))[::-1]
+        return np.lexsort((id_lo, id_hi, c["created_at"][selected]))[::-1]
+
+    @staticmethod
+    def _after_cursor(sort: str, cursor: Tuple[str, Any, uuid.UUID], c: Dict[str, Any]):
+        _, key, last_id = cursor
+        hi, lo = np.uint64(last_id.int >> 64), np.uint64(last_id.int & 0xFFFFFFFFFFFFFFFF)
+        id_lt = (c["id_hi"] < hi) | ((c["id_hi"] == hi) & (c["id_lo"] < lo))
+        id_gt = (c["id_hi"] > hi) | ((c["id_hi"] == hi) & (c["id_lo"] > lo))
+
+        if sort == "newest":
+            created = _to_micros(key)
+            return (c["created_at"] < created) | ((c["created_at"] == created) & id_lt)
+
+        unpriced = ~c["has_price"]
+        if key is None:
+            return unpriced & (id_gt if sort == "price_asc" else id_lt)
+        price = _to_cents(key)
+        if sort == "price_asc":
+            after_key = (c["price"] > price) | ((c["price"] == price) & id_gt)
+        else:
+            after_key = (c["price"] < price) | ((c["price"] == price) & id_lt)
+        return (c["has_price"] & after_key) | unpriced
+
+    # Snapshots
+
+    def _meta_path(self) -> str:
+        return f"{self.snapshot_path}.json"
+
+    def _save_snapshot(self) -> None:
+        if not self.snapshot_path:
+            return
+        version = (self._snapshot_version or 0) + 1
+        data_path = f"{self.snapshot_path}.{version}.bin"
+        layout = {}
+        offset = 0
+        with open(data_path, "wb") as f:
+            for name, column in self._columns.items():
+                f.write(np.ascontiguousarray(column[:self._size]).tobytes())
+                layout[name] = offset
+                offset += column.dtype.itemsize * self._size
+        meta = {
+            "version": version,
+            "data": os.path.basename(data_path),
+            "rows": self._size,
+            "columns": layout,
+            "cities": self._cities,
+            "postal_codes": self._postal_codes,
+        }
+        tmp_path = f"{self._meta_path()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path())
+        self._snapshot_stat = self._stat_meta()
+
+        # Readers still mapping the previous file keep it alive after unlink
+        previous = f"{self.snapshot_path}.{self._snapshot_version}.bin"
+        if self._snapshot_version is not None and os.path.exists(previous):
+            os.unlink(previous)
+        self._snapshot_version = version
+
+    def _load_snapshot(self) -> bool:
+        if not self.snapshot_path or not self.available:
+            return False
+        try:
+            with open(self._meta_path()) as f:
+                stat = os.fstat(f.fileno())
+                meta = json.load(f)
+        except FileNotFoundError:
+            return False
+        if meta["version"] == self._snapshot_version:
+            self._snapshot_stat = (stat.st_ino, stat.st_mtime_ns)
+            return True
+
+        data_path = os.path.join(os.path.dirname(self._meta_path()), meta["data"])
+        rows = meta["rows"]
+        try:
+            columns = {
+                name: np.memmap(data_path, dtype=dtype, mode="r", offset=meta["columns"][name], shape=(rows,))
+                if rows else np.zeros(0, dtype=dtype)
+                for name, dtype in COLUMNS.items()
+            }
+        except FileNotFoundError:
+            # Superseded while we were reading the metadata; next search retries
+            return self.loaded
+
+        self._columns = columns
+        self._size = rows
+        self._writable = False
+        self._cities = meta["cities"]
+        self._city_codes = {value: code for code, value in enumerate(self._cities)}
+        self._postal_codes = meta["postal_codes"]
+        self._postal_code_codes = {value: code for code, value in enumerate(self._postal_codes) if value is not None}
+        self._rows = {self._slot_id(slot): slot for slot in np.flatnonzero(columns["alive"])}
+        self._snapshot_version = meta["version"]
+        self._snapshot_stat = (stat.st_ino, stat.st_mtime_ns)
+        return True
+
+    def _stat_meta(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._meta_path())
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _reload_if_stale(self) -> None:
+        # The meta file is replaced on every save (new inode): only parse it
+        # again when it is not the one read last
+        if self.snapshot_path and self._stat_meta() != self._snapshot_stat:
+            self._load_snapshot()
+
+    @contextmanager
+    def _file_lock(self):
+        if not self.snapshot_path or fcntl is None:
+            yield
+            return
+        with open(f"{self.snapshot_path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+showcase_index = ShowcaseIndex(
+    snapshot_path=settings.SHOWCASE_INDEX_SNAPSHOT_PATH,
+    rebuild_seconds=settings.SHOWCASE_INDEX_REBUILD_SECONDS,
+)
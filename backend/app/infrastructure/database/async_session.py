@@ -0,0 +1,30 @@
+from typing import AsyncIterator
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool, engine_options
+
+
+def async_database_url(url: str) -> URL:
+    """
+    `url` with the asyncpg driver. asyncpg spells libpq's sslmode as ssl.
+    """
+    url = make_url(url).set(drivername="postgresql+asyncpg")
+    if "sslmode" in url.query:
+        url = url.update_query_dict({"ssl": url.query["sslmode"]}).difference_update_query(["sslmode"])
+    return url
+
+
+# Alongside the sync engine, for the hot read endpoints: their I/O is awaited
+# on the event loop instead of holding a threadpool thread per request.
+async_engine = create_async_engine(
+    async_database_url(settings.ASYNC_DATABASE_URL or settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,
+    **engine_options(asyncpg=True),
+)
+# Objects stay readable after commit: lazy loads are not possible outside run_sync
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
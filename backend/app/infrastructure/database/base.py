@@ -1,3 +1,11 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+# Extensions the schema depends on (pg_trgm: trigram indexes / similarity)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
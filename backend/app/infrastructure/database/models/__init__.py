@@ -12,3 +12,4 @@ from app.infrastructure.database.models.client_note import ClientNote
 from app.infrastructure.database.models.property_note import PropertyNote
 from app.infrastructure.database.models.visit_note import VisitNote
 from app.infrastructure.database.models.property_status_history import PropertyStatusHistory
+from app.infrastructure.database.models.daily_metrics_snapshot import DailyMetricsSnapshot
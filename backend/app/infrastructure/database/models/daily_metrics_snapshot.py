@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Date, DateTime, Integer
+from app.infrastructure.database.base import Base
+
+class DailyMetricsSnapshot(Base):
+    """
+    Dashboard KPIs as of the end of `day` (UTC), one row per day.
+    Filled by the daily metrics job; past days can be rebuilt from history.
+    """
+    __tablename__ = "daily_metrics_snapshots"
+
+    day = Column(Date, primary_key=True)
+
+    # Properties (active)
+    total_properties = Column(Integer, nullable=False, default=0)
+    available_properties = Column(Integer, nullable=False, default=0)
+    sold_properties = Column(Integer, nullable=False, default=0)
+    rented_properties = Column(Integer, nullable=False, default=0)
+
+    # Clients (active) and pending visits
+    total_clients = Column(Integer, nullable=False, default=0)
+    pending_visits = Column(Integer, nullable=False, default=0)
+
+    # Operations by status
+    operations_interest = Column(Integer, nullable=False, default=0)
+    operations_negotiation = Column(Integer, nullable=False, default=0)
+    operations_reserved = Column(Integer, nullable=False, default=0)
+    operations_closed = Column(Integer, nullable=False, default=0)
+    operations_cancelled = Column(Integer, nullable=False, default=0)
+
+    computed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    @property
+    def active_operations(self) -> int:
+        return self.operations_interest + self.operations_negotiation + self.operations_reserved
@@ -1,13 +1,28 @@
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Numeric, Text, Enum as SqlEnum, and_
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Float, Numeric, Text, Enum as SqlEnum, Computed, Index, and_, func
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from app.infrastructure.database.base import Base
 from app.domain.enums import PropertyStatus, PropertyType, OperationType
 
+# Spanish full-text document, maintained by Postgres as a generated column.
+# Weights: title (A) > city (B) > address (C) > description (D).
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('spanish', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(city, '')), 'B') || "
+    "setweight(to_tsvector('spanish', coalesce(address_line1, '')), 'C') || "
+    "setweight(to_tsvector('spanish', coalesce(public_description, '')), 'D')"
+)
+
 class Property(Base):
     __tablename__ = "properties"
+    __table_args__ = (
+        Index("ix_properties_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram indexes (pg_trgm) behind ILIKE '%x%' and similarity matching
+        Index("ix_properties_city_trgm", "city", postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
+        Index("ix_properties_postal_code_trgm", "postal_code", postgresql_using="gin", postgresql_ops={"postal_code": "gin_trgm_ops"}),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -16,6 +31,8 @@ class Property(Base):
     address_line2 = Column(String, nullable=True)
     city = Column(String, nullable=False)
     postal_code = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     sqm = Column(Integer, nullable=False)
     rooms = Column(Integer, nullable=False)
     baths = Column(Integer, default=1, nullable=False)
@@ -42,6 +59,9 @@ class Property(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
 
+    # Full-text search (deferred: only loaded when explicitly queried)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
+
     # Relationships
     owner_client = relationship("Client", back_populates="owned_properties")
     captor_agent = relationship("User", back_populates="captured_properties")
@@ -57,3 +77,11 @@ class Property(Base):
     calendar_events = relationship("CalendarEvent", back_populates="property")
     notes = relationship("PropertyNote", back_populates="property", cascade="all, delete-orphan", order_by="desc(PropertyNote.created_at)")
     status_history = relationship("PropertyStatusHistory", back_populates="property", cascade="all, delete-orphan", order_by="PropertyStatusHistory.changed_at")
+
+
+# GiST index on the (longitude, latitude) point behind bbox and radius searches
+Index(
+    "ix_properties_location",
+    func.point(Property.longitude, Property.latitude),
+    postgresql_using="gist",
+)
@@ -0,0 +1,161 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Set on a connection record while it is checked out
+_CHECKED_OUT_AT = "pool_checked_out_at"
+
+
+class PoolMetrics:
+    """
+    Counters of one connection pool: how long checkouts waited for a
+    connection, how long connections were held, and how far the pool went
+    into overflow.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._held = 0
+        self._hold_total = 0.0
+        self._hold_max = 0.0
+
+    def record_checkout(self, waited: float, checked_out: int, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+            slow = waited * 1000 >= settings.DB_POOL_SLOW_CHECKOUT_MS
+            if slow:
+                self.slow_checkouts += 1
+        if slow:
+            logger.warning(
+                "Waited %.0f ms for a database connection (%d checked out, %d overflow)",
+                waited * 1000, checked_out, overflow,
+            )
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_checkin(self, held: float) -> None:
+        with self._lock:
+            self._held += 1
+            self._hold_total += held
+            self._hold_max = max(self._hold_max, held)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "slow_checkouts": self.slow_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "avg_wait_ms": round(self._wait_total / self.checkouts * 1000, 2) if self.checkouts else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 2),
+                "avg_hold_ms": round(self._hold_total / self._held * 1000, 2) if self._held else 0.0,
+                "max_hold_ms": round(self._hold_max * 1000, 2),
+            }
+
+
+class InstrumentedPoolMixin:
+    """
+    Times QueuePool checkouts (including the wait for a free connection when
+    the pool and its overflow are exhausted) and how long each connection is
+    held, into `self.metrics`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError as e:
+            # QueuePool may retry through _do_get itself: count the timeout once
+            if not getattr(e, "_pool_counted", False):
+                e._pool_counted = True
+                self.metrics.record_timeout()
+            raise
+        if _CHECKED_OUT_AT not in record.info:
+            record.info[_CHECKED_OUT_AT] = time.perf_counter()
+            self.metrics.record_checkout(
+                record.info[_CHECKED_OUT_AT] - started, self.checkedout(), max(0, self.overflow()),
+            )
+        return record
+
+    def _do_return_conn(self, record) -> None:
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            self.metrics.record_checkin(time.perf_counter() - checked_out_at)
+        super()._do_return_conn(record)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(asyncpg: bool = False) -> Dict[str, Any]:
+    """
+    create_engine() / create_async_engine() pool, compiled cache and
+    connection arguments from Settings. Session parameters are set once per
+    connection, at connect time: asyncpg takes them as `server_settings`,
+    libpq as `-c` options.
+    """
+    # pg_trgm's `%` operator reads its threshold from the session
+    parameters = {"pg_trgm.similarity_threshold": str(settings.SHOWCASE_CITY_SIMILARITY_THRESHOLD)}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        parameters["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    if asyncpg:
+        connect_args: Dict[str, Any] = {
+            "server_settings": {"application_name": settings.DB_APPLICATION_NAME, **parameters},
+        }
+    else:
+        connect_args = {
+            "application_name": settings.DB_APPLICATION_NAME,
+            "options": " ".join(f"-c {name}={value}" for name, value in parameters.items()),
+        }
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "connect_args": connect_args,
+    }
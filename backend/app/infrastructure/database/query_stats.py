@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Set on the execution context while its statement runs
+_STARTED_AT = "_query_stats_started_at"
+# Longest statement text written to the log
+_LOGGED_STATEMENT_CHARS = 300
+
+
+class QueryStats:
+    """
+    Statements run on behalf of one request (or any block wrapped in
+    track_queries), on every engine: primary, async and replicas.
+    """
+
+    def __init__(self, scope: Optional[Scope] = None):
+        self._scope = scope
+        self._lock = threading.Lock()
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    @property
+    def endpoint(self) -> str:
+        """
+        "METHOD /route/{template}" once routed, the raw path before.
+        """
+        if self._scope is None:
+            return ""
+        route = self._scope.get("route")
+        return f"{self._scope['method']} {getattr(route, 'path', self._scope['path'])}"
+
+    def record(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements run at least `threshold` times with identical SQL (only the
+        parameters changing): the signature of a lazy load per row, N+1.
+        """
+        with self._lock:
+            return [(statement, times) for statement, times in self.statements.most_common() if times >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+class CompiledCacheStats:
+    """
+    How often statements found their SQL in the engines' compiled cache,
+    for the whole worker. Misses come from statements seen for the first
+    time, or evicted by a cache (DB_QUERY_CACHE_SIZE) too small for the
+    statement variants in use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.outcomes: Counter = Counter()
+
+    def record(self, outcome: Any) -> None:
+        with self._lock:
+            self.outcomes[outcome.name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes = dict(self.outcomes)
+        hits = outcomes.pop("CACHE_HIT", 0)
+        misses = outcomes.pop("CACHE_MISS", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            # Raw SQL, and statements that opted out of caching
+            "uncached": outcomes,
+        }
+
+
+def compiled_cache_usage(engine: Engine) -> Dict[str, int]:
+    # LRUCache behind create_engine(query_cache_size=...), None when disabled
+    cache = engine._compiled_cache
+    if cache is None:
+        return {"entries": 0, "capacity": 0}
+    return {"entries": len(cache), "capacity": cache.capacity}
+
+
+compiled_cache = CompiledCacheStats()
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# Lists filled by open capture_requests() blocks
+_captures: List[List[QueryStats]] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(scope: Optional[Scope] = None) -> Iterator[QueryStats]:
+    """
+    Counts the statements run inside the block, including those run from
+    the threadpool and the async engine's greenlets, which inherit it.
+    """
+    stats = QueryStats(scope)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def capture_requests() -> Iterator[List[QueryStats]]:
+    """
+    Collects the QueryStats of every request finished inside the block,
+    whichever thread served it: what query budget tests assert on.
+    """
+    captured: List[QueryStats] = []
+    _captures.append(captured)
+    try:
+        yield captured
+    finally:
+        _captures[:] = [other for other in _captures if other is not captured]
+
+
+def _shorten(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > _LOGGED_STATEMENT_CHARS:
+        return statement[:_LOGGED_STATEMENT_CHARS] + "..."
+    return statement
+
+
+def report(stats: QueryStats) -> None:
+    """
+    Logs a finished request's statement count and DB time, and warns about
+    statements it repeated at least DB_N_PLUS_ONE_THRESHOLD times.
+    """
+    for captured in _captures:
+        captured.append(stats)
+    if not stats.count:
+        return
+    logger.info("%s: %d queries in %.1f ms", stats.endpoint, stats.count, stats.duration * 1000)
+    for statement, times in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+        logger.warning("Possible N+1 in %s, statement ran %d times: %s", stats.endpoint, times, _shorten(statement))
+
+
+class QueryStatsMiddleware:
+    """
+    Tracks the statements of each HTTP request, reports them once it
+    finishes and announces them in a Server-Timing header. The header is
+    sent with the response start, so a streaming response's header only
+    covers what ran before its first chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(scope) as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                report(stats)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if context is not None:
+        compiled_cache.record(context.cache_hit)
+    started = getattr(context, _STARTED_AT, None)
+    stats = _current.get()
+    if started is not None and stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def register_query_stats_hooks() -> None:
+    """
+    Times every statement of every engine against the current QueryStats,
+    if any: outside a tracked block the hooks only read a context variable
+    (and count the compiled cache outcome).
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
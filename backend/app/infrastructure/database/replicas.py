@@ -0,0 +1,317 @@
+import asyncio
+import hashlib
+import hmac
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from asyncpg.exceptions import CannotConnectNowError
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.infrastructure.database.async_session import async_database_url, get_async_db
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, engine_options
+from app.infrastructure.database.session import get_db
+
+logger = logging.getLogger(__name__)
+
+# Session.info flag: the current transaction wrote something
+_WROTE_KEY = "replica_wrote"
+# Response header with the read-your-writes token, sent back by the client
+READ_AFTER_HEADER = "X-Read-After"
+
+# Read-your-writes tokens issued while serving the current request
+_issued: ContextVar[Optional[List[str]]] = ContextVar("read_after_issued", default=None)
+
+
+class Replica:
+    """
+    Sync and async engines of one read replica, with the primary's pool
+    settings. Nothing connects until the first read is routed to it.
+    """
+
+    def __init__(self, url: str):
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine = create_engine(url, poolclass=InstrumentedQueuePool, **engine_options())
+        self.async_engine = create_async_engine(
+            async_database_url(url), poolclass=InstrumentedAsyncQueuePool, **engine_options(asyncpg=True),
+        )
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.AsyncSessionLocal = async_sessionmaker(bind=self.async_engine, autoflush=False, expire_on_commit=False)
+        self.down_until = 0.0
+        self.reads = 0
+        self.failures = 0
+
+
+def connection_failed(error: BaseException) -> bool:
+    """
+    Whether `error` means the database could not be reached, as opposed to a
+    failing statement.
+    """
+    if isinstance(error, exc.DBAPIError):
+        # Connect errors carry no statement
+        return error.connection_invalidated or error.statement is None
+    # asyncpg raises its connect errors unwrapped
+    return isinstance(error, (OSError, asyncio.TimeoutError, CannotConnectNowError))
+
+
+class ReplicaRouter:
+    """
+    Chooses where a read-only request runs: on a replica (round robin over
+    the healthy ones) or on the primary when there is no healthy replica or
+    the replica may not have replayed a recent write yet:
+
+    * read your writes: a commit issues a token (see `note_write`) that
+      the client sends back; reads carrying it stay on the primary for
+      `read_your_writes_seconds`, whichever worker or host serves them;
+    * write grace: for `write_grace_seconds` after any commit in this
+      worker, every read does, so the response caches that commit
+      invalidated (per worker too) are refilled from the primary rather
+      than from a lagging replica.
+
+    A replica that fails to connect is skipped for `retry_seconds`.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        read_your_writes_seconds: float = 5.0,
+        write_grace_seconds: float = 1.0,
+        retry_seconds: float = 30.0,
+        secret: str = "",
+    ):
+        self.replicas = [Replica(url) for url in urls]
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.write_grace_seconds = write_grace_seconds
+        self.retry_seconds = retry_seconds
+        self._secret = secret.encode()
+        self._lock = threading.Lock()
+        self._turn = itertools.count()
+        self._last_write = float("-inf")
+        self.primary_reads = {"read_your_writes": 0, "write_grace": 0, "replicas_down": 0}
+        for replica in self.replicas:
+            for engine in (replica.engine, replica.async_engine.sync_engine):
+                event.listen(engine, "handle_error", self._error_handler(replica))
+
+    def _sign(self, until: str) -> str:
+        return hmac.new(self._secret, until.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def note_write(self) -> Optional[str]:
+        """
+        Records a commit and returns its read-your-writes token: the end of
+        the window (epoch milliseconds, wall clock so that every host agrees)
+        and its signature. None without replicas.
+        """
+        if not self.replicas:
+            return None
+        with self._lock:
+            self._last_write = time.monotonic()
+        until = str(int((time.time() + self.read_your_writes_seconds) * 1000))
+        return f"{until}.{self._sign(until)}"
+
+    def _must_read_own_writes(self, read_after: Optional[str]) -> bool:
+        # Unsigned or tampered tokens are ignored rather than rejected
+        until, _, signature = (read_after or "").partition(".")
+        if not until.isdigit() or not hmac.compare_digest(signature, self._sign(until)):
+            return False
+        return int(until) > time.time() * 1000
+
+    def pick(self, read_after: Optional[str]) -> Optional[Replica]:
+        """
+        The replica to read from, or None for the primary. `read_after` is
+        the token the client got back from its last write, if any.
+        """
+        if not self.replicas:
+            return None
+        own_writes = self._must_read_own_writes(read_after)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_write < self.write_grace_seconds:
+                reason = "write_grace"
+            elif own_writes:
+                reason = "read_your_writes"
+            else:
+                healthy = [replica for replica in self.replicas if replica.down_until <= now]
+                if healthy:
+                    replica = healthy[next(self._turn) % len(healthy)]
+                    replica.reads += 1
+                    return replica
+                reason = "replicas_down"
+            self.primary_reads[reason] += 1
+        return None
+
+    def mark_down(self, replica: Replica, error: BaseException) -> None:
+        now = time.monotonic()
+        with self._lock:
+            was_up = replica.down_until <= now
+            replica.down_until = now + self.retry_seconds
+            replica.failures += 1
+        if was_up:
+            logger.warning(
+                "Read replica %s unavailable, reading from the primary for %.0f s: %s",
+                replica.name, self.retry_seconds, error,
+            )
+
+    def _error_handler(self, replica: Replica):
+        def handle_error(context: Any) -> None:
+            # A failed pre-ping is followed by a reconnect: only its failure counts
+            if context.connection is None or (context.is_disconnect and not context.is_pre_ping):
+                self.mark_down(replica, context.original_exception)
+        return handle_error
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            replicas = [
+                {
+                    "name": replica.name,
+                    "healthy": replica.down_until <= now,
+                    "reads": replica.reads,
+                    "failures": replica.failures,
+                }
+                for replica in self.replicas
+            ]
+            summary = {"primary_reads": dict(self.primary_reads)}
+        for entry, replica in zip(replicas, self.replicas):
+            entry["sync"] = replica.engine.pool.stats()
+            entry["async"] = replica.async_engine.pool.stats()
+        return {"replicas": replicas, **summary}
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            replica.engine.dispose()
+            await replica.async_engine.dispose()
+
+
+read_replicas = ReplicaRouter(
+    settings.DATABASE_REPLICA_URLS,
+    read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    write_grace_seconds=settings.DB_REPLICA_WRITE_GRACE_SECONDS,
+    retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+    secret=settings.SECRET_KEY,
+)
+
+
+def _replica_unavailable() -> HTTPException:
+    # The replica is now skipped: a retry goes to another one or the primary
+    return HTTPException(
+        status_code=503,
+        detail="Read replica unavailable, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)) -> Iterator[Session]:
+    """
+    Session for read-only endpoints: on a replica when ReplicaRouter allows
+    it, otherwise the request's primary session (which only connects if
+    used). Never write through it.
+    """
+    replica = read_replicas.pick(request.headers.get(READ_AFTER_HEADER))
+    if replica is None:
+        yield db
+        return
+    replica_db = replica.SessionLocal()
+    try:
+        yield replica_db
+    except Exception as e:
+        if not connection_failed(e):
+            raise
+        read_replicas.mark_down(replica, e)
+        raise _replica_unavailable() from e
+    finally:
+        replica_db.close()
+
+
+async def get_async_read_db(
+    request: Request, db: AsyncSession = Depends(get_async_db),
+) -> AsyncIterator[AsyncSession]:
+    """
+    Async counterpart of get_read_db.
+    """
+    replica = read_replicas.pick(request.headers.get(READ_AFTER_HEADER))
+    if replica is None:
+        yield db
+        return
+    async with replica.AsyncSessionLocal() as replica_db:
+        try:
+            yield replica_db
+        except Exception as e:
+            if not connection_failed(e):
+                raise
+            read_replicas.mark_down(replica, e)
+            raise _replica_unavailable() from e
+
+
+def _flag_write(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+def _flag_bulk_write(orm_execute_state: Any) -> None:
+    # update()/delete()/insert() executed without a flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+def _note_write(session: Session) -> None:
+    if session.info.pop(_WROTE_KEY, False):
+        token = read_replicas.note_write()
+        issued = _issued.get()
+        if token is not None and issued is not None:
+            issued.append(token)
+
+
+def _discard_write(session: Session, previous_transaction: Any = None) -> None:
+    session.info.pop(_WROTE_KEY, None)
+
+
+def register_replica_hooks() -> None:
+    """
+    Reports every committed write to `read_replicas`, whichever repository
+    or use case wrote it; ReadYourWritesMiddleware hands the token to the
+    client.
+    """
+    if not event.contains(Session, "after_flush", _flag_write):
+        event.listen(Session, "after_flush", _flag_write)
+        event.listen(Session, "do_orm_execute", _flag_bulk_write)
+        event.listen(Session, "after_commit", _note_write)
+        event.listen(Session, "after_soft_rollback", _discard_write)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Sends the read-your-writes token of a request that committed a write
+    back in the X-Read-After response header. Clients echo the last one they
+    got on their next requests, so that get_read_db keeps those on the
+    primary until the replicas have replayed the write.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        issued: List[str] = []
+        token = _issued.set(issued)
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start" and issued:
+                MutableHeaders(scope=message)[READ_AFTER_HEADER] = issued[-1]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            _issued.reset(token)
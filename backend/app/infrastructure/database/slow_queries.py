@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.database.query_stats import current_query_stats
+
+logger = logging.getLogger(__name__)
+
+# Set on the execution context while its statement runs
+_STARTED_AT = "_slow_query_started_at"
+_SAVEPOINT = "slow_query_explain"
+# Longest statement text kept per entry
+_STATEMENT_CHARS = 4000
+# Elements of a list parameter kept by redact()
+_LIST_ITEMS = 10
+_WRITE_KEYWORDS = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b")
+# A quoted SQL literal, '' being an escaped quote
+_LITERAL = re.compile(r"'((?:[^']|'')*)'")
+
+
+def redact(value: Any) -> Any:
+    """
+    JSON-safe version of a bind parameter that keeps what shapes a plan
+    (numbers, dates, booleans, NULLs, list sizes) and hides text, which may
+    be names, emails, phones or hashes.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [redact(item) for item in value[:_LIST_ITEMS]]
+        if len(value) > _LIST_ITEMS:
+            items.append(f"<{len(value) - _LIST_ITEMS} more>")
+        return items
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def scrub_plan(plan: str) -> str:
+    """
+    EXPLAIN output with its string literals hidden the way redact() hides
+    text parameters. psycopg2 interpolates parameters client-side, so the
+    plan carries their values (`Filter: (email = 'ana@example.com'::text)`).
+    Numbers, which are not quoted, stay.
+    """
+    def hide(match: "re.Match[str]") -> str:
+        text = match.group(1).replace("''", "'")
+        return f"'<str:{len(text)}>'"
+
+    return _LITERAL.sub(hide, plan)
+
+
+def _read_only(statement: str) -> bool:
+    # What EXPLAIN ANALYZE may run again: SELECTs, and CTEs that only select
+    statement = statement.lstrip().upper()
+    if statement.startswith("SELECT"):
+        return True
+    return statement.startswith("WITH") and not _WRITE_KEYWORDS.search(statement)
+
+
+def fingerprint(statement: str) -> str:
+    return hashlib.sha1(" ".join(statement.split()).encode()).hexdigest()[:16]
+
+
+class SlowQuery:
+    """
+    Aggregate of one statement's slow executions in this worker.
+    """
+
+    def __init__(self, statement: str):
+        self.statement = statement[:_STATEMENT_CHARS]
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.endpoints: Counter = Counter()
+        self.last_seen: Optional[datetime] = None
+        self.last_parameters: Any = None
+        self.plan: Optional[str] = None
+        self.plan_at: Optional[datetime] = None
+        self.explained_at = float("-inf")  # time.monotonic() of the last EXPLAIN attempt
+
+    def as_dict(self, key: str) -> Dict[str, Any]:
+        return {
+            "id": key,
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 2),
+            "max_ms": round(self.max_ms, 2),
+            "endpoints": dict(self.endpoints.most_common()),
+            "last_seen": self.last_seen,
+            "last_parameters": self.last_parameters,
+            "plan": self.plan,
+            "plan_at": self.plan_at,
+        }
+
+
+class SlowQueryLog:
+    """
+    Statements slower than `threshold_ms`, whichever engine ran them. Each
+    one is written to a rotating JSON-lines file when `path` is set (shared
+    by the workers of a host, kept across restarts) and aggregated in memory per statement,
+    keeping the `max_entries` costliest ones, for /system/slow-queries.
+
+    Slow SELECTs also get an EXPLAIN (ANALYZE, BUFFERS) plan, run right
+    away on the same connection and transaction so it sees the same data,
+    with its literals scrubbed (see scrub_plan).
+    ANALYZE runs the query again, so each statement is explained at most
+    once per `explain_interval_seconds`. Only reads are explained.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_interval_seconds: float = 300.0,
+        path: Optional[str] = None,
+        max_bytes: int = 10_000_000,
+        backups: int = 5,
+        max_entries: int = 200,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_interval_seconds = explain_interval_seconds
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[str, SlowQuery] = {}
+        self._file_logger: Optional[logging.Logger] = None
+
+    def _file(self) -> Optional[logging.Logger]:
+        if not self.path:
+            return None
+        with self._lock:
+            if self._file_logger is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                file_logger = logging.getLogger(f"{__name__}.file")
+                file_logger.handlers = [handler]
+                file_logger.setLevel(logging.INFO)
+                file_logger.propagate = False
+                self._file_logger = file_logger
+        return self._file_logger
+
+    def _should_explain(self, entry: SlowQuery, statement: str, executemany: bool) -> bool:
+        if executemany or self.explain_interval_seconds <= 0:
+            return False
+        if not _read_only(statement):
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - entry.explained_at < self.explain_interval_seconds:
+                return False
+            entry.explained_at = now
+        return True
+
+    def record(
+        self,
+        conn: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        stats = current_query_stats()
+        endpoint = stats.endpoint if stats is not None else ""
+        key = fingerprint(statement)
+        now = datetime.now(timezone.utc)
+        redacted = redact(parameters[0] if executemany and parameters else parameters)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_entries:
+                    cheapest = min(self._entries, key=lambda other: self._entries[other].total_ms)
+                    del self._entries[cheapest]
+                entry = self._entries[key] = SlowQuery(statement)
+            entry.count += 1
+            entry.total_ms += duration_ms
+            entry.max_ms = max(entry.max_ms, duration_ms)
+            entry.endpoints[endpoint or "-"] += 1
+            entry.last_seen = now
+            entry.last_parameters = redacted
+
+        plan = None
+        if conn.dialect.name == "postgresql" and self._should_explain(entry, statement, executemany):
+            plan = _explain(conn, statement, parameters, context)
+            if plan is not None:
+                with self._lock:
+                    entry.plan = plan
+                    entry.plan_at = now
+
+        logger.warning("Slow query (%.0f ms) in %s: %s", duration_ms, endpoint or "-", " ".join(statement.split())[:300])
+        file_logger = self._file()
+        if file_logger is not None:
+            file_logger.info(json.dumps({
+                "at": now.isoformat(),
+                "pid": os.getpid(),
+                "id": key,
+                "endpoint": endpoint,
+                "duration_ms": round(duration_ms, 2),
+                "statement": statement[:_STATEMENT_CHARS],
+                "parameters": redacted,
+                "plan": plan,
+            }))
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = [entry.as_dict(key) for key, entry in self._entries.items()]
+        return sorted(entries, key=lambda entry: entry[order_by], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _explain(conn: Any, statement: str, parameters: Any, context: Any) -> Optional[str]:
+    """
+    EXPLAIN (ANALYZE, BUFFERS) of a statement that just ran on `conn`, on a
+    raw DBAPI cursor (invisible to the statement hooks) inside a savepoint,
+    so a failing EXPLAIN leaves the caller's transaction usable.
+    """
+    dbapi_connection = conn.connection.dbapi_connection
+    savepoint = not getattr(dbapi_connection, "autocommit", False)
+    cursor = dbapi_connection.cursor()
+    try:
+        if savepoint:
+            cursor.execute(f"SAVEPOINT {_SAVEPOINT}")
+        try:
+            explain = f"EXPLAIN (ANALYZE, BUFFERS) {statement}"
+            if context.no_parameters:
+                cursor.execute(explain)
+            else:
+                cursor.execute(explain, parameters)
+            plan = scrub_plan("\n".join(row[0] for row in cursor.fetchall()))
+        except Exception:
+            if savepoint:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+            raise
+        if savepoint:
+            cursor.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+        return plan
+    except Exception as e:
+        logger.warning("Could not explain slow query: %s", e)
+        return None
+    finally:
+        cursor.close()
+
+
+slow_queries = SlowQueryLog(
+    settings.DB_SLOW_QUERY_MS,
+    explain_interval_seconds=settings.DB_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+    path=settings.DB_SLOW_QUERY_LOG_PATH,
+    max_bytes=settings.DB_SLOW_QUERY_LOG_MAX_BYTES,
+    backups=settings.DB_SLOW_QUERY_LOG_BACKUPS,
+    max_entries=settings.DB_SLOW_QUERY_MAX_ENTRIES,
+)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if context is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    started = getattr(context, _STARTED_AT, None)
+    if started is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    if duration_ms >= slow_queries.threshold_ms:
+        slow_queries.record(conn, statement, parameters, context, executemany, duration_ms)
+
+
+def register_slow_query_hooks() -> None:
+    """
+    Sends statements slower than DB_SLOW_QUERY_MS, on every engine, to
+    `slow_queries`. Register after the query stats hooks, so their request
+    timings do not include the EXPLAIN of a slow statement.
+    """
+    if settings.DB_SLOW_QUERY_MS <= 0:
+        return
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Session.info keys
+_CALLBACKS_KEY = "after_commit_callbacks"
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    Transaction boundary of a use case (or of an endpoint writing through
+    repositories directly): repositories only add and flush, and the
+    outermost unit commits once on success or rolls everything back on
+    error. Nested units, e.g. a use case calling another of its methods,
+    join the enclosing one.
+    """
+    depth = db.info.get(_DEPTH_KEY, 0)
+    db.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except BaseException:
+        if depth == 0:
+            db.rollback()
+            _discard_callbacks(db)
+        raise
+    finally:
+        db.info[_DEPTH_KEY] = depth
+
+
+def after_commit(db: Session, callback: Callable[[], Any]) -> None:
+    """
+    Runs `callback` once the current transaction commits, and drops it if it
+    rolls back. For cache invalidation: purging before the commit would let
+    a concurrent request cache the old rows again. Callbacks must not query.
+    """
+    db.info.setdefault(_CALLBACKS_KEY, []).append(callback)
+
+
+def _run_callbacks(session: Session) -> None:
+    callbacks: List[Callable[[], Any]] = session.info.pop(_CALLBACKS_KEY, None) or []
+    for callback in callbacks:
+        callback()
+
+
+def _discard_callbacks(session: Session, previous_transaction: Any = None) -> None:
+    session.info.pop(_CALLBACKS_KEY, None)
+
+
+def register_unit_of_work_hooks() -> None:
+    if not event.contains(Session, "after_commit", _run_callbacks):
+        event.listen(Session, "after_commit", _run_callbacks)
+        event.listen(Session, "after_soft_rollback", _discard_callbacks)
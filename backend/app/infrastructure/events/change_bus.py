@@ -0,0 +1,268 @@
+import asyncio
+import json
+import logging
+import os
+import queue
+import select
+import threading
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from app.core.config import settings
+from app.infrastructure.cache.response_cache import invalidate_dashboards
+
+logger = logging.getLogger(__name__)
+
+# Queued to a subscriber that fell behind: the client should refetch the dashboard
+RESYNC = {"type": "resync"}
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_NOTIFY_MAX_BYTES = 7999
+# What is left of an event too big for a payload on its own
+_SLIM_KEYS = ("type", "action", "id", "agent_ids")
+
+
+class Subscription:
+    """
+    One live stream. Receives the events concerning `agent_id` (or every
+    event when None) on an asyncio queue owned by the subscriber's loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, agent_id: Optional[str], max_queue: int):
+        self.loop = loop
+        self.agent_id = agent_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        return self.agent_id is None or self.agent_id in event.get("agent_ids", ())
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        # Runs on the subscriber's loop
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self) -> Dict[str, Any]:
+        event = await self.queue.get()
+        if event is RESYNC:
+            self.overflowed = False
+        return event
+
+
+class ChangeBus:
+    """
+    In-process fan-out of data change events to live dashboard streams.
+
+    `publish` may be called from any thread (repositories run in the
+    threadpool); delivery hops onto each subscriber's event loop. With a
+    PostgresNotifyBridge attached, events are also sent to, and received
+    from, the other workers.
+    """
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.bridge: Optional["PostgresNotifyBridge"] = None
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, agent_id: Optional[Any] = None) -> Subscription:
+        sub = Subscription(
+            asyncio.get_running_loop(),
+            str(agent_id) if agent_id is not None else None,
+            self.max_queue,
+        )
+        with self._lock:
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, events: Iterable[Dict[str, Any]]) -> None:
+        events = list(events)
+        if not events:
+            return
+        self.deliver(events)
+        if self.bridge is not None:
+            self.bridge.send(events)
+
+    def deliver(self, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Hands events to the local subscribers only.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for sub in subscribers:
+                if sub.wants(event):
+                    try:
+                        sub.loop.call_soon_threadsafe(sub._put, event)
+                    except RuntimeError:
+                        # Loop already closed: the stream is gone
+                        self.unsubscribe(sub)
+
+
+class PostgresNotifyBridge:
+    """
+    Relays change events between workers through Postgres LISTEN/NOTIFY.
+    Events published locally are queued and NOTIFYed with this worker's
+    origin by a sender thread, so commits never wait on that connection; a
+    listener thread delivers notifications coming from other origins.
+    """
+
+    def __init__(
+        self,
+        bus: ChangeBus,
+        dsn: str,
+        channel: str = "dashboard_changes",
+        max_queue: int = settings.CHANGE_BUS_NOTIFY_QUEUE,
+        connect_timeout: int = settings.CHANGE_BUS_CONNECT_TIMEOUT_SECONDS,
+    ):
+        self.bus = bus
+        self.dsn = dsn
+        self.channel = channel
+        self.connect_timeout = connect_timeout
+        self._outbox: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sender: Optional[threading.Thread] = None
+
+    def _connect(self):
+        import psycopg2
+
+        conn = psycopg2.connect(self.dsn, connect_timeout=self.connect_timeout)
+        conn.autocommit = True
+        return conn
+
+    def _payloads(self, events: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """
+        NOTIFY payloads carrying `events`, as many per payload as fit under
+        the size limit. An event that does not fit on its own is reduced to
+        its type, action, id and agent_ids, enough to invalidate dashboards.
+        """
+        prefix = '{"origin": %s, "events": [' % json.dumps(self.bus.origin)
+        budget = _NOTIFY_MAX_BYTES - len(prefix) - len("]}")
+        batch: List[str] = []
+        size = 0
+        for event in events:
+            encoded = json.dumps(event, default=str)
+            if len(encoded) > budget:
+                encoded = json.dumps({key: event.get(key) for key in _SLIM_KEYS}, default=str)
+            # Plus the separating comma
+            if batch and size + 1 + len(encoded) > budget:
+                yield prefix + ",".join(batch) + "]}"
+                batch, size = [], 0
+            size += len(encoded) + (1 if batch else 0)
+            batch.append(encoded)
+        if batch:
+            yield prefix + ",".join(batch) + "]}"
+
+    def send(self, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Queues `events` for the sender thread. Never blocks: when the queue
+        is full (database unreachable), the events are dropped and the other
+        workers' cached dashboards only refresh when they expire.
+        """
+        events = list(events)
+        try:
+            self._outbox.put_nowait(events)
+        except queue.Full:
+            logger.warning("Dashboard changes NOTIFY queue full, dropping %d events", len(events))
+
+    def start(self) -> None:
+        self.bus.bridge = self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="dashboard-changes-listener", daemon=True)
+        self._thread.start()
+        self._sender = threading.Thread(target=self._send_loop, name="dashboard-changes-notifier", daemon=True)
+        self._sender.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.bus.bridge = None
+        if self._sender is not None:
+            # Wake the sender; it flushes what is already queued, then exits
+            try:
+                self._outbox.put_nowait(None)
+            except queue.Full:
+                pass
+            self._sender.join(timeout=self.connect_timeout + 1)
+            self._sender = None
+
+    def _send_loop(self) -> None:
+        conn = None
+        try:
+            while True:
+                try:
+                    events = self._outbox.get(timeout=1.0)
+                except queue.Empty:
+                    if self._stop.is_set():
+                        return
+                    continue
+                if events is None:
+                    return
+                try:
+                    if conn is None or conn.closed:
+                        conn = self._connect()
+                    with conn.cursor() as cursor:
+                        for payload in self._payloads(events):
+                            cursor.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                except Exception:
+                    # Other workers miss this change; their caches still expire
+                    logger.exception("Could not NOTIFY dashboard changes")
+                    if conn is not None:
+                        conn.close()
+                    conn = None
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn = self._connect()
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(f'LISTEN "{self.channel}"')
+                    while not self._stop.is_set():
+                        if select.select([conn], [], [], 5.0) == ([], [], []):
+                            continue
+                        conn.poll()
+                        while conn.notifies:
+                            self._handle(conn.notifies.pop(0).payload)
+                finally:
+                    conn.close()
+            except Exception:
+                logger.exception("Dashboard changes listener failed, reconnecting")
+                self._stop.wait(5.0)
+
+    def _handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message.get("origin") == self.bus.origin:
+                return
+            events = list(message.get("events", []))
+            agent_ids = {agent_id for event in events for agent_id in event.get("agent_ids", ())}
+        except (ValueError, TypeError, AttributeError):
+            # Anyone can NOTIFY the channel: skip what we did not send
+            logger.warning("Ignoring malformed dashboard change notification: %.200r", payload)
+            return
+        # Another worker wrote: this worker's cached dashboards are stale too
+        invalidate_dashboards(*agent_ids)
+        self.bus.deliver(events)
+
+
+change_bus = ChangeBus(max_queue=settings.CHANGE_BUS_MAX_QUEUE)
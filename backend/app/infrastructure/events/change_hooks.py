@@ -0,0 +1,111 @@
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.infrastructure.database.models import Client, Visit, Operation, Property
+from app.infrastructure.events.change_bus import change_bus
+from app.infrastructure.cache.response_cache import invalidate_dashboards
+
+_PENDING_KEY = "dashboard_changes"
+
+
+def _value(value: Any) -> Any:
+    if value is None:
+        return None
+    if hasattr(value, "value"):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _previous(obj: Any, attr: str) -> Any:
+    history = inspect(obj).attrs[attr].history
+    return _value(history.deleted[0]) if history.deleted else None
+
+
+def describe_change(obj: Any, action: str) -> Optional[Dict[str, Any]]:
+    """
+    Dashboard delta for a flushed Visit, Operation, Property or Client, or
+    None for anything else. `agent_ids` lists the agents whose dashboards it touches
+    (previous owner included on reassignment).
+    """
+    if isinstance(obj, Visit):
+        change = {
+            "type": "visit",
+            "status": _value(obj.status),
+            "scheduled_at": _value(obj.scheduled_at),
+            "property_id": _value(obj.property_id),
+            "client_id": _value(obj.client_id),
+        }
+        owner = "agent_id"
+    elif isinstance(obj, Operation):
+        change = {
+            "type": "operation",
+            "status": _value(obj.status),
+            "operation_type": _value(obj.type),
+            "property_id": _value(obj.property_id),
+        }
+        owner = "agent_id"
+    elif isinstance(obj, Property):
+        change = {
+            "type": "property",
+            "status": _value(obj.status),
+            "title": obj.title,
+        }
+        owner = "captor_agent_id"
+    elif isinstance(obj, Client):
+        change = {
+            "type": "client",
+            "client_type": _value(obj.type),
+            "is_active": obj.is_active,
+        }
+        owner = "responsible_agent_id"
+    else:
+        return None
+
+    agent_ids = [_value(getattr(obj, owner))]
+    if action == "updated":
+        if "status" in change:
+            change["previous_status"] = _previous(obj, "status")
+        previous_owner = _previous(obj, owner)
+        if previous_owner is not None and previous_owner not in agent_ids:
+            agent_ids.append(previous_owner)
+    return {"action": action, "id": _value(obj.id), "agent_ids": agent_ids, **change}
+
+
+def _collect_changes(session: Session, flush_context: Any) -> None:
+    # after_flush still exposes the pre-flush new/dirty/deleted sets and history
+    pending: List[Dict[str, Any]] = session.info.setdefault(_PENDING_KEY, [])
+    for action, objects in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for obj in objects:
+            if action == "updated" and not session.is_modified(obj, include_collections=False):
+                continue
+            change = describe_change(obj, action)
+            if change is not None:
+                pending.append(change)
+
+
+def _publish_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        # Before publishing, so streams recompute stats from fresh data
+        invalidate_dashboards(*{agent_id for change in changes for agent_id in change["agent_ids"]})
+        change_bus.publish(changes)
+
+
+def _discard_changes(session: Session, previous_transaction: Any = None) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_change_hooks() -> None:
+    """
+    Publishes committed Visit/Operation/Property/Client changes on the
+    change bus, whichever repository or use case wrote them, after
+    invalidating the cached dashboards of the agents involved: the one
+    dashboard invalidation path for these writes. Rolled back changes are
+    dropped.
+    """
+    if not event.contains(Session, "after_flush", _collect_changes):
+        event.listen(Session, "after_flush", _collect_changes)
+        event.listen(Session, "after_commit", _publish_changes)
+        event.listen(Session, "after_soft_rollback", _discard_changes)
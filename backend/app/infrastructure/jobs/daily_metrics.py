@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable
+
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.unit_of_work import unit_of_work
+from app.infrastructure.repositories.metrics_snapshot_repository import MetricsSnapshotRepository
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_days(days: Iterable[date]) -> int:
+    """
+    Computes and upserts the snapshot of each day, committing day by day.
+    Idempotent, so several workers running the job at once only repeat work.
+    """
+    repo = MetricsSnapshotRepository()
+    count = 0
+    with SessionLocal() as db:
+        for day in days:
+            with unit_of_work(db):
+                repo.snapshot(db, day)
+            count += 1
+    return count
+
+
+def refresh_recent_snapshots() -> int:
+    # Yesterday is recomputed too, so its row is final once the day is over
+    today = datetime.now(timezone.utc).date()
+    return snapshot_days([today - timedelta(days=1), today])
+
+
+async def run_daily_metrics_job(interval_seconds: float) -> None:
+    """
+    Background loop started with the app: refreshes today's (and
+    yesterday's) snapshot every `interval_seconds` until cancelled.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(refresh_recent_snapshots)
+        except Exception:
+            logger.exception("Daily metrics snapshot failed")
+        await asyncio.sleep(interval_seconds)
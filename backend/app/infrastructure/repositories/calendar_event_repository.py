@@ -2,11 +2,36 @@ from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, lambda_stmt
 
 from app.infrastructure.database.models.calendar_event import CalendarEvent
 from app.domain.schemas.calendar_event import CalendarEventCreate, CalendarEventUpdate
 
+def _events_query(
+    *,
+    skip: int,
+    limit: int,
+    agent_id: Optional[UUID],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+):
+    # Lambda statement: each combination of filters is built and compiled
+    # once, later calls only bind the values
+    query = lambda_stmt(lambda: select(CalendarEvent))
+
+    if agent_id:
+        query += lambda s: s.where(CalendarEvent.agent_id == agent_id)
+
+    if start_date:
+        query += lambda s: s.where(CalendarEvent.starts_at >= start_date)
+
+    if end_date:
+        query += lambda s: s.where(CalendarEvent.ends_at <= end_date)
+
+    query += lambda s: s.offset(skip).limit(limit).order_by(CalendarEvent.starts_at.asc())
+    return query
+
 class CalendarEventRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -18,8 +43,7 @@ class CalendarEventRepository:
         
         db_obj = CalendarEvent(**data)
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
     def get(self, id: UUID) -> Optional[CalendarEvent]:
@@ -34,23 +58,7 @@ class CalendarEventRepository:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[CalendarEvent]:
-        query = select(CalendarEvent)
-        
-        conditions = []
-        if agent_id:
-            conditions.append(CalendarEvent.agent_id == agent_id)
-        
-        if start_date:
-            conditions.append(CalendarEvent.starts_at >= start_date)
-            
-        if end_date:
-            conditions.append(CalendarEvent.ends_at <= end_date)
-            
-        if conditions:
-            query = query.where(and_(*conditions))
-            
-        query = query.offset(skip).limit(limit).order_by(CalendarEvent.starts_at.asc())
-        
+        query = _events_query(skip=skip, limit=limit, agent_id=agent_id, start_date=start_date, end_date=end_date)
         result = self.db.execute(query)
         return result.scalars().all()
 
@@ -60,13 +68,36 @@ class CalendarEventRepository:
             setattr(db_obj, field, value)
         
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
     def delete(self, id: UUID) -> Optional[CalendarEvent]:
         obj = self.db.get(CalendarEvent, id)
         if obj:
             self.db.delete(obj)
-            self.db.commit()
+            self.db.flush()
         return obj
+
+
+class AsyncCalendarEventRepository:
+    """
+    Read side of CalendarEventRepository for the async endpoints.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, id: UUID) -> Optional[CalendarEvent]:
+        return await self.db.get(CalendarEvent, id)
+
+    async def get_multi(
+        self, 
+        *, 
+        skip: int = 0, 
+        limit: int = 100, 
+        agent_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[CalendarEvent]:
+        query = _events_query(skip=skip, limit=limit, agent_id=agent_id, start_date=start_date, end_date=end_date)
+        result = await self.db.execute(query)
+        return result.scalars().all()
@@ -1,17 +1,27 @@
 from typing import List, Optional, Union, Dict, Any
 import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.infrastructure.database.models.client import Client
 from app.infrastructure.database.models.client_note import ClientNote
-from app.infrastructure.database.models.visit import Visit
-from app.infrastructure.database.models.operation import Operation
 from app.domain.schemas.client import ClientUpdate, ClientNoteCreate
+from app.infrastructure.repositories.visit_repository import visit_public_loads
+from app.infrastructure.repositories.operation_repository import operation_public_loads
+from app.infrastructure.repositories.property_repository import property_detail_loads
+
+# What ClientDetail shows, one SELECT ... IN per collection: joining them
+# returned a row per note x visit x operation x owned property
+_CLIENT_DETAIL = (
+    joinedload(Client.responsible_agent),
+    selectinload(Client.notes),
+    visit_public_loads(Client.visits),
+    operation_public_loads(Client.operations),
+    property_detail_loads(Client.owned_properties),
+)
 
 class ClientRepository:
     def create(self, db: Session, client_obj: Client) -> Client:
         db.add(client_obj)
-        db.commit()
-        db.refresh(client_obj)
+        db.flush()
         return client_obj
 
     def create_note(self, db: Session, note_in: ClientNoteCreate, client_id: uuid.UUID, author_id: uuid.UUID) -> ClientNote:
@@ -21,17 +31,22 @@ class ClientRepository:
             author_user_id=author_id
         )
         db.add(db_note)
-        db.commit()
-        db.refresh(db_note)
+        db.flush()
         return db_note
 
     def get_by_id(self, db: Session, client_id: uuid.UUID) -> Optional[Client]:
-        return db.query(Client).options(
-            joinedload(Client.notes),
-            joinedload(Client.visits).joinedload(Visit.property),
-            joinedload(Client.operations).joinedload(Operation.property),
-            joinedload(Client.owned_properties)
-        ).filter(Client.id == client_id, Client.is_active == True).first()
+        return db.query(Client).options(*_CLIENT_DETAIL).filter(Client.id == client_id, Client.is_active == True).first()
+
+    def exists(self, db: Session, client_id: uuid.UUID) -> bool:
+        return db.query(Client.id).filter(Client.id == client_id, Client.is_active == True).first() is not None
+
+    def list_notes(self, db: Session, client_id: uuid.UUID, skip: int = 0, limit: int = 50) -> List[ClientNote]:
+        return (
+            db.query(ClientNote)
+            .filter(ClientNote.client_id == client_id)
+            .order_by(ClientNote.created_at.desc(), ClientNote.id.desc())
+            .offset(skip).limit(limit).all()
+        )
 
     def list_all(
         self, 
@@ -59,13 +74,12 @@ class ClientRepository:
                 setattr(client_obj, field, update_data[field])
                 
         db.add(client_obj)
-        db.commit()
-        db.refresh(client_obj)
+        db.flush()
         return client_obj
 
     def delete(self, db: Session, *, client_id: uuid.UUID) -> Optional[Client]:
         obj = db.get(Client, client_id)
         if obj:
             db.delete(obj)
-            db.commit()
+            db.flush()
         return obj
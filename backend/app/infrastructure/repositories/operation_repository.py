@@ -1,50 +1,101 @@
 from typing import List, Optional, Union, Dict, Any
 import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_
+from sqlalchemy.orm import Load, Session, joinedload, selectinload
 from app.infrastructure.database.models.operation import Operation
 from app.infrastructure.database.models.operation_status_history import OperationStatusHistory
 from app.infrastructure.database.models.operation_note import OperationNote
 from app.infrastructure.database.models.visit import Visit
+from app.infrastructure.repositories.visit_repository import visit_public_loads
 from app.domain.schemas.operation import OperationUpdate
 from app.domain.enums import OperationStatus
 
+# What OperationPublic shows: related rows joined, each collection in its own SELECT
+_OPERATION_PUBLIC = (
+    joinedload(Operation.client),
+    joinedload(Operation.property),
+    joinedload(Operation.agent),
+    selectinload(Operation.status_history),
+    selectinload(Operation.notes).joinedload(OperationNote.author),
+    visit_public_loads(Operation.visits),
+)
+
+def operation_public_loads(relationship: Any) -> Load:
+    """
+    Loads the operations of a collection `relationship` as OperationPublic
+    shows them, one SELECT ... IN per collection level.
+    """
+    return selectinload(relationship).options(*_OPERATION_PUBLIC)
+
 class OperationRepository:
     def create(self, db: Session, operation_obj: Operation) -> Operation:
         db.add(operation_obj)
-        db.commit()
-        db.refresh(operation_obj)
+        db.flush()
         return operation_obj
 
     def get_by_id(self, db: Session, operation_id: uuid.UUID) -> Optional[Operation]:
+        # Collections are loaded with SELECT ... IN: joining them all would
+        # return one row per history entry x note x visit x visit note
         return (
             db.query(Operation)
-            .options(
-                joinedload(Operation.client),
-                joinedload(Operation.property),
-                joinedload(Operation.agent),
-                joinedload(Operation.status_history),
-                joinedload(Operation.notes).joinedload(OperationNote.author),
-                joinedload(Operation.visits).joinedload(Visit.notes)
-            )
+            .options(*_OPERATION_PUBLIC)
             .filter(Operation.id == operation_id, Operation.is_active == True)
             .first()
         )
 
+    def exists(self, db: Session, operation_id: uuid.UUID) -> bool:
+        return db.query(Operation.id).filter(Operation.id == operation_id, Operation.is_active == True).first() is not None
+
     def list_all(
         self, 
         db: Session, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        client_id: Optional[uuid.UUID] = None,
+        property_id: Optional[uuid.UUID] = None
     ) -> List[Operation]:
+        query = db.query(Operation).options(*_OPERATION_PUBLIC).filter(Operation.is_active == True)
+        if client_id:
+            query = query.filter(Operation.client_id == client_id)
+        if property_id:
+            query = query.filter(Operation.property_id == property_id)
+        return query.order_by(Operation.created_at.desc(), Operation.id.desc()).offset(skip).limit(limit).all()
+
+    def list_notes(self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50) -> List[OperationNote]:
         return (
-            db.query(Operation)
+            db.query(OperationNote)
+            .options(joinedload(OperationNote.author))
+            .filter(OperationNote.operation_id == operation_id)
+            .order_by(OperationNote.created_at, OperationNote.id)
+            .offset(skip).limit(limit).all()
+        )
+
+    def list_visits(self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50) -> List[Visit]:
+        """
+        Visits between the operation's client and property (Operation.visits),
+        latest scheduled first.
+        """
+        return (
+            db.query(Visit)
+            .join(Operation, and_(Operation.client_id == Visit.client_id, Operation.property_id == Visit.property_id))
             .options(
-                joinedload(Operation.client),
-                joinedload(Operation.property),
-                joinedload(Operation.agent)
+                joinedload(Visit.client),
+                joinedload(Visit.property),
+                joinedload(Visit.agent),
+                selectinload(Visit.notes)
             )
-            .filter(Operation.is_active == True)
-            .order_by(Operation.created_at.desc())
+            .filter(Operation.id == operation_id)
+            .order_by(Visit.scheduled_at.desc(), Visit.id.desc())
+            .offset(skip).limit(limit).all()
+        )
+
+    def list_status_history(
+        self, db: Session, operation_id: uuid.UUID, skip: int = 0, limit: int = 50
+    ) -> List[OperationStatusHistory]:
+        return (
+            db.query(OperationStatusHistory)
+            .filter(OperationStatusHistory.operation_id == operation_id)
+            .order_by(OperationStatusHistory.changed_at, OperationStatusHistory.id)
             .offset(skip).limit(limit).all()
         )
 
@@ -82,15 +133,14 @@ class OperationRepository:
             db.add(history)
 
         db.add(operation_obj)
-        db.commit()
-        db.refresh(operation_obj)
+        db.flush()
         return operation_obj
 
     def soft_delete(self, db: Session, operation_id: uuid.UUID) -> bool:
         operation = db.query(Operation).filter(Operation.id == operation_id).first()
         if operation:
             operation.is_active = False
-            db.commit()
+            db.flush()
             return True
         return False
 
@@ -101,6 +151,5 @@ class OperationRepository:
             text=text
         )
         db.add(note)
-        db.commit()
-        db.refresh(note)
+        db.flush()
         return note
@@ -6,8 +6,7 @@ from app.infrastructure.database.models.property_image import PropertyImage
 class PropertyImageRepository:
     def create(self, db: Session, image: PropertyImage) -> PropertyImage:
         db.add(image)
-        db.commit()
-        db.refresh(image)
+        db.flush()
         return image
 
     def get_by_id(self, db: Session, image_id: uuid.UUID) -> Optional[PropertyImage]:
@@ -24,7 +23,6 @@ class PropertyImageRepository:
             PropertyImage.property_id == property_id,
             PropertyImage.is_cover == True
         ).update({"is_cover": False})
-        db.commit()
 
     def count_by_property(self, db: Session, property_id: uuid.UUID) -> int:
         return db.query(PropertyImage).filter(
@@ -34,7 +32,7 @@ class PropertyImageRepository:
 
     def delete(self, db: Session, image: PropertyImage):
         db.delete(image)
-        db.commit()
+        db.flush()
 
     def set_as_cover(self, db: Session, property_id: uuid.UUID, image_id: uuid.UUID):
         # 1. Unset all current covers for this property
@@ -47,9 +45,6 @@ class PropertyImageRepository:
         db.query(PropertyImage).filter(
             PropertyImage.id == image_id
         ).update({"is_cover": True})
-        
-        db.commit()
 
     def update_position(self, db: Session, image_id: uuid.UUID, position: int):
         db.query(PropertyImage).filter(PropertyImage.id == image_id).update({"position": position})
-        db.commit()
@@ -1,20 +1,245 @@
-from typing import List, Optional, Union, Dict, Any
+import asyncio
+from typing import Callable, List, Optional, Union, Dict, Any, Tuple
+from datetime import datetime
 from decimal import Decimal
+import base64
+import binascii
+import html
+import json
+import math
 import uuid
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, and_, tuple_, func, literal_column, select, true, desc, lambda_stmt
+from sqlalchemy.orm import Load, Session, joinedload, load_only, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.infrastructure.database.models.property import Property
 from app.infrastructure.database.models.property_note import PropertyNote
 from app.infrastructure.database.models.property_status_history import PropertyStatusHistory
-from app.infrastructure.database.models import Visit, Operation, Client
-from app.domain.schemas.property import PropertyUpdate, PropertyNoteCreate
+from app.infrastructure.database.models import Visit, Operation, Client, User
+from app.domain.schemas.property import PropertyUpdate, PropertyNoteCreate, PropertyPublicList
 from app.domain.enums import PropertyStatus, PropertyType, OperationType
+from app.core.config import settings
+from app.infrastructure.cache.response_cache import showcase_cache, property_tag, SHOWCASE_LIST_TAG
+from app.infrastructure.cache.showcase_index import showcase_index, INDEXED_ATTRIBUTES
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.unit_of_work import after_commit
+from app.infrastructure.repositories.visit_repository import visit_public_loads
+from app.infrastructure.repositories.operation_repository import operation_public_loads
+
+SHOWCASE_SORTS = ("newest", "price_asc", "price_desc")
+
+
+def _normalize_sort(sort: Optional[str], rankable: bool = False, default: str = "newest") -> str:
+    if sort in SHOWCASE_SORTS or (sort == "relevance" and rankable):
+        return sort
+    return default
+
+
+SEARCH_CONFIG = literal_column("'spanish'::regconfig")
+
+
+def _search_query(q: str):
+    """
+    Spanish tsquery from free user input ("piso centro -bajo", "ático terraza"...).
+    """
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def _text_rank(q: str):
+    return func.ts_rank_cd(Property.search_vector, _search_query(q))
+
+
+# Private-use characters around matches in ts_headline output, turned into
+# <mark> tags by render_headline once the listing text has been escaped
+_MATCH_START = "\ue000"
+_MATCH_STOP = "\ue001"
+
+
+def _text_headline(q: str):
+    return func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(Property.public_description, Property.title),
+        _search_query(q),
+        f"StartSel={_MATCH_START}, StopSel={_MATCH_STOP}, MaxFragments=2, MaxWords=25, MinWords=8",
+    )
+
+
+def render_headline(headline: Optional[str]) -> Optional[str]:
+    """
+    HTML-safe search_headline: the agent-written text is escaped, and only
+    the markers placed by ts_headline become <mark> tags.
+    """
+    if headline is None:
+        return None
+    return (
+        html.escape(headline)
+        .replace(_MATCH_START, "<mark>")
+        .replace(_MATCH_STOP, "</mark>")
+    )
+
+
+def _city_rank(city: str):
+    return func.greatest(func.similarity(Property.city, city), func.similarity(Property.postal_code, city))
+
+
+def _published():
+    return and_(
+        Property.is_active == True,
+        Property.is_published == True,
+        Property.status == PropertyStatus.AVAILABLE,
+    )
+
+
+# A showcase filter: `lambda s: s.where(...)`, see PropertyRepository._published_filters
+Filter = Callable[[Any], Any]
+
+
+def encode_showcase_cursor(sort: str, prop: Property) -> str:
+    """
+    Builds the opaque keyset token pointing right after `prop` for the given sort.
+    """
+    if sort == "newest":
+        key = prop.created_at.isoformat()
+    else:
+        key = str(prop.price_amount) if prop.price_amount is not None else None
+    raw = json.dumps({"s": sort, "k": key, "id": str(prop.id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_showcase_cursor(cursor: str) -> Tuple[str, Any, uuid.UUID]:
+    """
+    Inverse of `encode_showcase_cursor`. Raises ValueError on tampered tokens.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort = data["s"]
+        if sort not in SHOWCASE_SORTS:
+            raise ValueError(f"Unknown sort in cursor: {sort}")
+        if sort == "newest":
+            key = datetime.fromisoformat(data["k"])
+        else:
+            key = Decimal(data["k"]) if data["k"] is not None else None
+        return sort, key, uuid.UUID(data["id"])
+    except (KeyError, TypeError, ArithmeticError, binascii.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def parse_bbox(value: str) -> Tuple[float, float, float, float]:
+    """
+    Parses "min_lon,min_lat,max_lon,max_lat" (west, south, east, north).
+    Raises ValueError on malformed or out-of-range boxes.
+    """
+    try:
+        west, south, east, north = (float(part) for part in value.split(","))
+    except ValueError as e:
+        raise ValueError("bbox must be min_lon,min_lat,max_lon,max_lat") from e
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        raise ValueError("bbox is out of range or inverted")
+    return west, south, east, north
+
+
+def parse_point(value: str) -> Tuple[float, float]:
+    """
+    Parses "lat,lon". Raises ValueError on malformed or out-of-range points.
+    """
+    try:
+        lat, lon = (float(part) for part in value.split(","))
+    except ValueError as e:
+        raise ValueError("near must be lat,lon") from e
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("near is out of range")
+    return lat, lon
+
+
+def _radius_bbox(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    # Box enclosing the circle, so the GiST index can prefilter radius searches
+    dlat = radius_km / KM_PER_DEGREE
+    dlon = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return max(lon - dlon, -180.0), max(lat - dlat, -90.0), min(lon + dlon, 180.0), min(lat + dlat, 90.0)
+
+
+def _in_bbox(bbox: Tuple[float, float, float, float]):
+    west, south, east, north = bbox
+    return func.point(Property.longitude, Property.latitude).op("<@")(
+        func.box(func.point(west, south), func.point(east, north))
+    )
+
+
+def _distance_km(lat: float, lon: float, cos_lat: float):
+    """
+    Haversine distance in km from (lat, lon) to each property. The caller
+    passes cos(lat), so that inside a lambda statement it is a bound value.
+    """
+    dlat = func.radians(Property.latitude - lat)
+    dlon = func.radians(Property.longitude - lon)
+    a = (
+        func.power(func.sin(dlat * 0.5), 2)
+        + cos_lat * func.cos(func.radians(Property.latitude)) * func.power(func.sin(dlon * 0.5), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(a))
+
+
+def _public_detail_statement(property_id: uuid.UUID):
+    return select(Property).options(
+        load_only(
+            Property.id, Property.title, Property.address_line1, Property.address_line2,
+            Property.city, Property.postal_code, Property.latitude, Property.longitude, Property.sqm, Property.rooms, Property.baths,
+            Property.floor, Property.has_elevator, Property.status, Property.property_type,
+            Property.operation_type, Property.price_amount, Property.price_currency,
+            Property.public_description, Property.is_featured, Property.created_at,
+            Property.updated_at, Property.captor_agent_id
+        ),
+        joinedload(Property.images),
+        joinedload(Property.captor_agent).load_only(
+            User.id, User.full_name, User.email, User.phone_number
+        )
+    ).where(
+        Property.id == property_id,
+        Property.is_active == True,
+        Property.is_published == True,
+        Property.status == PropertyStatus.AVAILABLE,
+    )
+
+# What the backoffice Property schema shows. Owner and agent are joined (one
+# row each); every collection gets its own SELECT ... IN, so the detail costs
+# one query per collection instead of one row per combination of children.
+_PROPERTY_DETAIL = (
+    joinedload(Property.owner_client),
+    joinedload(Property.captor_agent),
+    selectinload(Property.images),
+    selectinload(Property.notes),
+    selectinload(Property.status_history),
+    visit_public_loads(Property.visits),
+    operation_public_loads(Property.operations),
+)
+
+def property_detail_loads(relationship: Any) -> Load:
+    """
+    Loads the properties of a collection `relationship` as the backoffice
+    Property schema shows them.
+    """
+    return selectinload(relationship).options(*_PROPERTY_DETAIL)
 
 class PropertyRepository:
+    @staticmethod
+    def _on_commit(db: Session, property_obj: Property) -> None:
+        # Showcase cache and in-memory index see the write once committed
+        # (dashboards are invalidated by the change hooks)
+        def publish() -> None:
+            showcase_cache.invalidate(SHOWCASE_LIST_TAG, property_tag(property_obj.id))
+            showcase_index.apply(property_obj)
+
+        after_commit(db, publish)
+
     def create(self, db: Session, property_obj: Property) -> Property:
         db.add(property_obj)
-        db.commit()
-        db.refresh(property_obj)
+        db.flush()
+        self._on_commit(db, property_obj)
         return property_obj
 
     def create_note(
@@ -30,38 +255,68 @@ class PropertyRepository:
             author_user_id=author_id
         )
         db.add(db_note)
-        db.commit()
-        db.refresh(db_note)
+        db.flush()
         return db_note
 
     def get_by_id(self, db: Session, property_id: uuid.UUID) -> Optional[Property]:
-        return db.query(Property).options(
-            joinedload(Property.images),
-            joinedload(Property.notes),
-            joinedload(Property.owner_client),
-            joinedload(Property.visits),
-            joinedload(Property.operations),
-            joinedload(Property.status_history),
-            joinedload(Property.captor_agent)
-        ).filter(Property.id == property_id, Property.is_active == True).first()
+        return db.query(Property).options(*_PROPERTY_DETAIL).filter(
+            Property.id == property_id, Property.is_active == True
+        ).first()
+
+    def exists(self, db: Session, property_id: uuid.UUID) -> bool:
+        return db.query(Property.id).filter(Property.id == property_id, Property.is_active == True).first() is not None
+
+    def list_notes(self, db: Session, property_id: uuid.UUID, skip: int = 0, limit: int = 50) -> List[PropertyNote]:
+        return (
+            db.query(PropertyNote)
+            .filter(PropertyNote.property_id == property_id)
+            .order_by(PropertyNote.created_at.desc(), PropertyNote.id.desc())
+            .offset(skip).limit(limit).all()
+        )
+
+    def list_status_history(
+        self, db: Session, property_id: uuid.UUID, skip: int = 0, limit: int = 50
+    ) -> List[PropertyStatusHistory]:
+        return (
+            db.query(PropertyStatusHistory)
+            .filter(PropertyStatusHistory.property_id == property_id)
+            .order_by(PropertyStatusHistory.changed_at, PropertyStatusHistory.id)
+            .offset(skip).limit(limit).all()
+        )
+
+    def get_public_by_id(self, db: Session, property_id: uuid.UUID) -> Optional[Property]:
+        """
+        Loads only what the public detail page shows: published columns,
+        active images and the captor agent contact. Returns None unless the
+        property is published and available.
+        """
+        return db.execute(_public_detail_statement(property_id)).unique().scalar_one_or_none()
 
     def list_all(
         self, 
         db: Session, 
         skip: int = 0, 
         limit: int = 100,
-        published_only: bool = False
+        published_only: bool = False,
+        q: Optional[str] = None
     ) -> List[Property]:
         query = db.query(Property).options(joinedload(Property.images)).filter(Property.is_active == True)
         if published_only:
             query = query.filter(Property.is_published == True)
+        if q:
+            tsquery = _search_query(q)
+            query = query.filter(Property.search_vector.op("@@")(tsquery)).order_by(
+                func.ts_rank_cd(Property.search_vector, tsquery).desc()
+            )
         return query.order_by(Property.created_at.desc()).offset(skip).limit(limit).all()
 
-    def list_published(
+    def _published_filters(
         self,
         db: Session,
         *,
+        q: Optional[str] = None,
         city: Optional[str] = None,
+        city_fuzzy: bool = False,
         price_min: Optional[Decimal] = None,
         price_max: Optional[Decimal] = None,
         sqm_min: Optional[int] = None,
@@ -72,55 +327,471 @@ class PropertyRepository:
         operation_type: Optional[OperationType] = None,
         has_elevator: Optional[bool] = None,
         is_featured: Optional[bool] = None,
-        offset: int = 0,
-        limit: int = 50,
-        sort: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        query = (
-            db.query(Property)
-            .options(joinedload(Property.images))
-            .filter(
-                Property.is_active == True,
-                Property.is_published == True,
-                Property.status == PropertyStatus.AVAILABLE,
-            )
-        )
-
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+    ) -> List[Filter]:
+        """
+        The showcase filters given, each as `lambda s: s.where(...)`. Added to
+        a lambda_stmt (`stmt += where`), SQLAlchemy builds and compiles each
+        combination of filters once and only binds the values afterwards;
+        called on a Query or select (`where(query)`), they just filter it.
+        Lambdas may only use their closure variables as bound values, so
+        anything derived from them is computed out here.
+        """
+        filters: List[Filter] = []
+        if q:
+            filters.append(lambda s: s.where(Property.search_vector.op("@@")(_search_query(q))))
         if city is not None:
-            query = query.filter(or_(Property.city.ilike(f"%{city}%"), Property.postal_code.ilike(f"%{city}%")))
+            # Substring matches, and with city_fuzzy typo-tolerant city matches
+            # ("Madird"), are served by the pg_trgm GIN indexes on city and
+            # postal_code. The `%` threshold is set per connection (see
+            # engine_options).
+            pattern = f"%{city}%"
+            if city_fuzzy:
+                filters.append(lambda s: s.where(or_(
+                    Property.city.ilike(pattern),
+                    Property.postal_code.ilike(pattern),
+                    Property.city.op("%")(city),
+                )))
+            else:
+                filters.append(lambda s: s.where(or_(
+                    Property.city.ilike(pattern),
+                    Property.postal_code.ilike(pattern),
+                )))
         if price_min is not None:
-            query = query.filter(Property.price_amount >= price_min)
+            filters.append(lambda s: s.where(Property.price_amount >= price_min))
         if price_max is not None:
-            query = query.filter(Property.price_amount <= price_max)
+            filters.append(lambda s: s.where(Property.price_amount <= price_max))
         if sqm_min is not None:
-            query = query.filter(Property.sqm >= sqm_min)
+            filters.append(lambda s: s.where(Property.sqm >= sqm_min))
         if sqm_max is not None:
-            query = query.filter(Property.sqm <= sqm_max)
+            filters.append(lambda s: s.where(Property.sqm <= sqm_max))
         if rooms is not None:
-            query = query.filter(Property.rooms >= rooms) # 1+ logic
+            filters.append(lambda s: s.where(Property.rooms >= rooms)) # 1+ logic
         if baths is not None:
-            query = query.filter(Property.baths >= baths) # 1+ logic
+            filters.append(lambda s: s.where(Property.baths >= baths)) # 1+ logic
         if property_type:
-            query = query.filter(Property.property_type.in_(property_type))
+            filters.append(lambda s: s.where(Property.property_type.in_(property_type)))
         if operation_type is not None:
-            query = query.filter(Property.operation_type == operation_type)
+            filters.append(lambda s: s.where(Property.operation_type == operation_type))
         if has_elevator is not None:
-            query = query.filter(Property.has_elevator == has_elevator)
+            filters.append(lambda s: s.where(Property.has_elevator == has_elevator))
         if is_featured is not None:
-            query = query.filter(Property.is_featured == is_featured)
+            filters.append(lambda s: s.where(Property.is_featured == is_featured))
+        if bbox is not None:
+            west, south, east, north = bbox
+            filters.append(lambda s: s.where(_in_bbox((west, south, east, north))))
+        if near is not None:
+            lat, lon = near
+            radius = radius_km if radius_km is not None else settings.SHOWCASE_DEFAULT_RADIUS_KM
+            box_west, box_south, box_east, box_north = _radius_bbox(lat, lon, radius)
+            cos_lat = math.cos(math.radians(lat))
+            # Index-backed box prefilter, exact great-circle distance on the survivors
+            filters.append(lambda s: s.where(
+                _in_bbox((box_west, box_south, box_east, box_north)),
+                _distance_km(lat, lon, cos_lat) <= radius,
+            ))
+        return filters
 
-        total = query.count()
+    def _published_query(self, db: Session, filters: List[Filter]):
+        """
+        Published, available properties matching `filters`, as a Query.
+        """
+        query = db.query(Property).filter(_published())
+        for where in filters:
+            query = where(query)
+        return query
 
-        # Sorting logic
-        if sort == "price_asc":
-            query = query.order_by(Property.price_amount.asc())
+    def list_published(
+        self,
+        db: Session,
+        *,
+        q: Optional[str] = None,
+        city: Optional[str] = None,
+        city_fuzzy: bool = False,
+        price_min: Optional[Decimal] = None,
+        price_max: Optional[Decimal] = None,
+        sqm_min: Optional[int] = None,
+        sqm_max: Optional[int] = None,
+        rooms: Optional[int] = None,
+        baths: Optional[int] = None,
+        property_type: Optional[List[PropertyType]] = None,
+        operation_type: Optional[OperationType] = None,
+        has_elevator: Optional[bool] = None,
+        is_featured: Optional[bool] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        offset: int = 0,
+        limit: int = 50,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        index_hits: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        One showcase page. `index_hits` is a `search_index()` result for the
+        same arguments, for callers that searched the in-memory index elsewhere.
+        """
+        filters = dict(
+            city=city,
+            city_fuzzy=city_fuzzy,
+            price_min=price_min,
+            price_max=price_max,
+            sqm_min=sqm_min,
+            sqm_max=sqm_max,
+            rooms=rooms,
+            baths=baths,
+            property_type=property_type,
+            operation_type=operation_type,
+            has_elevator=has_elevator,
+            is_featured=is_featured,
+        )
+
+        # Text searches rank by relevance unless an explicit order is requested;
+        # city filters can opt into similarity ranking with sort=relevance.
+        sort = _normalize_sort(
+            sort,
+            rankable=bool(q) or city is not None,
+            default="relevance" if q else "newest",
+        )
+        if sort == "relevance" and cursor is not None:
+            raise ValueError("Cursor pagination is not available when sorting by relevance")
+        # Validate the cursor before touching the database
+        seek = self._after_cursor(sort, cursor) if cursor is not None else None
+
+        request = self.index_request(
+            q=q, sort=sort, cursor=cursor, bbox=bbox, near=near, offset=offset, limit=limit, **filters,
+        )
+        if request is not None:
+            if index_hits is None:
+                index_hits = self.search_index(lambda: self._indexable_rows(db), request)
+            return self._list_from_index(db, index_hits, sort=sort, limit=limit, include_total=include_total)
+
+        where = self._published_filters(db, q=q, bbox=bbox, near=near, radius_km=radius_km, **filters)
+
+        # A lambda statement: built and compiled once per shape (filters,
+        # sort, page mode), later calls only extract the bound values.
+        page = lambda_stmt(lambda: select(Property).options(joinedload(Property.images)).where(_published()))
+        for condition in where:
+            page += condition
+
+        # Offset pages get the total from a window count in the same statement.
+        # Keyset pages can't (the window would only see rows after the cursor),
+        # so they fall back to a capped count.
+        windowed = include_total and seek is None
+        if windowed:
+            page += lambda s: s.add_columns(func.count(Property.id).over().label("total"))
+        if q:
+            page += lambda s: s.add_columns(
+                _text_rank(q).label("search_rank"), _text_headline(q).label("search_headline"),
+            )
+        elif sort == "relevance":
+            page += lambda s: s.add_columns(_city_rank(city).label("search_rank"))
+
+        # Sorting logic: every order ends on Property.id so the keyset is unique.
+        # Properties without price go last in both price orders.
+        if sort == "relevance":
+            page += lambda s: s.order_by(desc("search_rank"), Property.id.desc())
+        elif sort == "price_asc":
+            page += lambda s: s.order_by(Property.price_amount.asc().nulls_last(), Property.id.asc())
         elif sort == "price_desc":
-            query = query.order_by(Property.price_amount.desc())
+            page += lambda s: s.order_by(Property.price_amount.desc().nulls_last(), Property.id.desc())
         else:
-            query = query.order_by(Property.created_at.desc())
+            page += lambda s: s.order_by(Property.created_at.desc(), Property.id.desc())
+
+        if seek is not None:
+            # Keyset mode: seek past the last row of the previous page instead of
+            # scanning and discarding `offset` rows.
+            page += lambda s: s.where(seek)
+        else:
+            page += lambda s: s.offset(offset)
+
+        # Fetch one extra row to know whether there is a next page
+        fetch = limit + 1
+        page += lambda s: s.limit(fetch)
+        rows = db.execute(page).unique().all()
+
+        total: Optional[int] = None
+        total_exact = True
+        if windowed:
+            total = rows[0].total if rows else None
+        props = []
+        for row in rows:
+            prop = row[0]
+            # Transient attributes picked up by PropertyPublic
+            extras = row._mapping
+            if "search_rank" in extras:
+                prop.search_rank = extras["search_rank"]
+            if "search_headline" in extras:
+                prop.search_headline = render_headline(extras["search_headline"])
+            props.append(prop)
+        rows = props
+        if include_total and total is None:
+            if windowed and offset == 0:
+                total = 0
+            else:
+                total, total_exact = self._capped_count(
+                    self._published_query(db, where), settings.SHOWCASE_TOTAL_CAP,
+                )
+
+        items = rows[:limit]
+        has_next = len(rows) > limit and sort != "relevance"
+        next_cursor = encode_showcase_cursor(sort, items[-1]) if has_next else None
+        return {"items": items, "total": total, "total_exact": total_exact, "next_cursor": next_cursor}
+
+    def index_request(
+        self,
+        *,
+        q: Optional[str] = None,
+        city: Optional[str] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        offset: int = 0,
+        limit: int = 50,
+        include_total: bool = True,
+        **filters: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        `showcase_index.search()` arguments for a `list_published()` call
+        (same keywords), or None when the page has to come from Postgres.
+        Does not touch the index or the database.
+        """
+        sort = _normalize_sort(sort, rankable=bool(q) or city is not None, default="relevance" if q else "newest")
+        # Map searches stay on Postgres (GiST index); the in-memory index has no coordinates
+        if q or bbox is not None or near is not None or sort == "relevance":
+            return None
+        if not settings.SHOWCASE_INDEX_ENABLED or not showcase_index.available:
+            return None
+        seek = None
+        if cursor is not None:
+            seek = decode_showcase_cursor(cursor)
+            if seek[0] != sort:
+                raise ValueError("Cursor was issued for a different sort order")
+        return dict(sort=sort, cursor=seek, offset=offset, limit=limit, city=city, **filters)
 
-        items = query.offset(offset).limit(limit).all()
-        return {"items": items, "total": total}
+    def search_index(self, load_rows: Callable[[], Any], request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs an `index_request()` on the in-memory showcase index, loading it
+        through `load_rows` first if needed. Blocking: takes the index locks
+        and may rebuild it.
+        """
+        showcase_index.ensure_loaded(load_rows)
+        return showcase_index.search(**request)
+
+    def _list_from_index(
+        self,
+        db: Session,
+        hits: Dict[str, Any],
+        *,
+        sort: str,
+        limit: int,
+        include_total: bool,
+    ) -> Dict[str, Any]:
+        """
+        Loads the page rows of an in-memory index search from the database.
+        """
+        ids = hits["ids"]
+        props = {}
+        if ids:
+            props = {
+                prop.id: prop
+                for prop in db.query(Property).options(joinedload(Property.images)).filter(
+                    Property.id.in_(ids),
+                    Property.is_active == True,
+                    Property.is_published == True,
+                    Property.status == PropertyStatus.AVAILABLE,
+                ).all()
+            }
+        items = [props[i] for i in ids[:limit] if i in props]
+        has_next = len(ids) > limit and bool(items)
+        return {
+            "items": items,
+            "total": hits["total"] if include_total else None,
+            "total_exact": True,
+            "next_cursor": encode_showcase_cursor(sort, items[-1]) if has_next else None,
+        }
+
+    def _indexable_rows(self, db: Session):
+        return db.query(*(getattr(Property, name) for name in INDEXED_ATTRIBUTES)).filter(
+            Property.is_active == True,
+            Property.is_published == True,
+            Property.status == PropertyStatus.AVAILABLE,
+        ).all()
+
+    def _capped_count(self, query, cap: int) -> Tuple[int, bool]:
+        """
+        Counts at most `cap` matching rows. Returns (count, is_exact).
+        """
+        limited = query.with_entities(Property.id).limit(cap + 1).subquery()
+        count = query.session.query(func.count()).select_from(limited).scalar() or 0
+        if count > cap:
+            return cap, False
+        return count, True
+
+    def published_facets(self, db: Session, *, price_buckets: int = 10, **filters: Any) -> Dict[str, Any]:
+        """
+        Facet counts over the showcase set matching `filters` (same keywords as
+        list_published): property/operation type, rooms (5+), baths (3+),
+        elevator and an equal-width price histogram. One statement, using
+        GROUPING SETS over a CTE of the filtered rows.
+        """
+        query = self._published_query(db, self._published_filters(db, **filters))
+        faceted = query.with_entities(
+            Property.property_type,
+            Property.operation_type,
+            Property.rooms,
+            Property.baths,
+            Property.has_elevator,
+            Property.price_amount,
+        ).cte("faceted")
+        # Literal (not bound) constants so GROUPING() matches the GROUP BY expressions
+        n_buckets = literal_column(str(int(price_buckets)))
+        bounds = select(
+            func.min(faceted.c.price_amount).label("lo"),
+            func.greatest(
+                (func.max(faceted.c.price_amount) - func.min(faceted.c.price_amount)) / n_buckets,
+                literal_column("1"),
+            ).label("step"),
+        ).cte("price_bounds")
+
+        dimensions = {
+            "property_type": faceted.c.property_type,
+            "operation_type": faceted.c.operation_type,
+            "rooms": func.least(faceted.c.rooms, literal_column("5")),
+            "baths": func.least(faceted.c.baths, literal_column("3")),
+            "has_elevator": faceted.c.has_elevator,
+            "price_bucket": func.least(
+                func.floor((faceted.c.price_amount - bounds.c.lo) / bounds.c.step),
+                literal_column(str(int(price_buckets) - 1)),
+            ),
+        }
+        exprs = list(dimensions.values())
+        stmt = (
+            select(
+                *[expr.label(name) for name, expr in dimensions.items()],
+                func.grouping(*exprs).label("grouping_id"),
+                func.count().label("count"),
+                func.min(bounds.c.lo).label("price_lo"),
+                func.min(bounds.c.step).label("price_step"),
+            )
+            .select_from(faceted.join(bounds, true()))
+            .group_by(func.grouping_sets(*[tuple_(expr) for expr in exprs]))
+        )
+
+        names = list(dimensions)
+        all_bits = (1 << len(names)) - 1
+        mask_to_name = {all_bits ^ (1 << (len(names) - 1 - i)): name for i, name in enumerate(names)}
+        counts: Dict[str, Dict[Any, int]] = {name: {} for name in names}
+        price_lo = price_step = None
+        for row in db.execute(stmt):
+            name = mask_to_name.get(row.grouping_id)
+            value = getattr(row, name) if name else None
+            if name is None or value is None:
+                continue
+            counts[name][value] = row.count
+            price_lo, price_step = row.price_lo, row.price_step
+
+        type_counts = counts["property_type"]
+        histogram = []
+        if price_lo is not None:
+            for bucket in sorted(counts["price_bucket"]):
+                start = price_lo + int(bucket) * price_step
+                histogram.append({
+                    "min": start,
+                    "max": start + price_step,
+                    "count": counts["price_bucket"][bucket],
+                })
+
+        return {
+            "total": sum(type_counts.values()),
+            "property_type": [
+                {"value": t.value, "count": type_counts.get(t, 0)} for t in PropertyType
+            ],
+            "operation_type": [
+                {"value": t.value, "count": counts["operation_type"].get(t, 0)} for t in OperationType
+            ],
+            "rooms": [
+                {"value": f"{r}+" if r == 5 else str(r), "count": c}
+                for r, c in sorted(counts["rooms"].items())
+            ],
+            "baths": [
+                {"value": f"{b}+" if b == 3 else str(b), "count": c}
+                for b, c in sorted(counts["baths"].items())
+            ],
+            "has_elevator": [
+                {"value": str(v).lower(), "count": c}
+                for v, c in sorted(counts["has_elevator"].items(), reverse=True)
+            ],
+            "price_histogram": histogram,
+        }
+
+    def published_clusters(
+        self,
+        db: Session,
+        *,
+        bbox: Tuple[float, float, float, float],
+        cell_size: float,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Groups the showcase properties inside `bbox` into square cells of
+        `cell_size` degrees (cell gx, gy covers lon [gx*size, (gx+1)*size)).
+        Each cell carries its count, price range, centroid and a representative
+        property (featured first, then newest). One grouped statement.
+        """
+        query = self._published_query(db, self._published_filters(db, bbox=bbox, **filters))
+        gx = func.floor(Property.longitude / cell_size)
+        gy = func.floor(Property.latitude / cell_size)
+        representative = func.array_agg(
+            aggregate_order_by(Property.id, Property.is_featured.desc(), Property.created_at.desc())
+        )[1]
+        rows = query.with_entities(
+            gx.label("gx"),
+            gy.label("gy"),
+            func.count(Property.id).label("count"),
+            func.min(Property.price_amount).label("price_min"),
+            func.max(Property.price_amount).label("price_max"),
+            func.avg(Property.latitude).label("lat"),
+            func.avg(Property.longitude).label("lon"),
+            representative.label("property_id"),
+        ).group_by(gx, gy).all()
+        return [
+            {
+                "gx": int(row.gx),
+                "gy": int(row.gy),
+                "count": row.count,
+                "price_min": row.price_min,
+                "price_max": row.price_max,
+                "lat": float(row.lat),
+                "lon": float(row.lon),
+                "property_id": row.property_id,
+            }
+            for row in rows
+        ]
+
+    def _after_cursor(self, sort: str, cursor: str):
+        cursor_sort, key, last_id = decode_showcase_cursor(cursor)
+        if cursor_sort != sort:
+            raise ValueError("Cursor was issued for a different sort order")
+
+        if sort == "newest":
+            return tuple_(Property.created_at, Property.id) < tuple_(key, last_id)
+
+        if key is None:
+            # Already inside the trailing block of unpriced properties
+            id_cmp = Property.id > last_id if sort == "price_asc" else Property.id < last_id
+            return and_(Property.price_amount.is_(None), id_cmp)
+
+        if sort == "price_asc":
+            after_key = tuple_(Property.price_amount, Property.id) > tuple_(key, last_id)
+        else:
+            after_key = tuple_(Property.price_amount, Property.id) < tuple_(key, last_id)
+        return or_(after_key, Property.price_amount.is_(None))
 
     def update(
         self,
@@ -160,6 +831,45 @@ class PropertyRepository:
             db.add(history)
 
         db.add(property_obj)
-        db.commit()
-        db.refresh(property_obj)
+        db.flush()
+        self._on_commit(db, property_obj)
         return property_obj
+
+
+class AsyncPropertyRepository:
+    """
+    Showcase reads for the async endpoints, on an AsyncSession.
+
+    The detail page is a single statement awaited directly. Listings reuse
+    PropertyRepository's pipeline (cursor, geo filters) through `run_sync`,
+    whose I/O is still awaited on the async driver; the page is validated
+    into PropertyPublicList there, since lazy loads are not possible once
+    back on the event loop. In-memory index searches (and the rebuilds they
+    may trigger) block on locks and loop over rows, so they run in a worker
+    thread first, with their own sync session for loading the index; only
+    the hits are hydrated on the AsyncSession.
+    """
+
+    def __init__(self, repository: Optional[PropertyRepository] = None):
+        self.repository = repository or PropertyRepository()
+
+    async def get_public_by_id(self, db: AsyncSession, property_id: uuid.UUID) -> Optional[Property]:
+        result = await db.execute(_public_detail_statement(property_id))
+        return result.unique().scalar_one_or_none()
+
+    async def list_published(self, db: AsyncSession, **kwargs: Any) -> PropertyPublicList:
+        request = self.repository.index_request(**kwargs)
+        if request is not None:
+            kwargs["index_hits"] = await asyncio.to_thread(
+                self.repository.search_index, self._indexable_rows, request,
+            )
+
+        def list_page(session: Session) -> PropertyPublicList:
+            return PropertyPublicList.model_validate(self.repository.list_published(session, **kwargs))
+
+        return await db.run_sync(list_page)
+
+    def _indexable_rows(self):
+        # Called from the worker thread, where the AsyncSession can't be used
+        with SessionLocal() as session:
+            return self.repository._indexable_rows(session)
@@ -3,6 +3,9 @@ from typing import Optional, Dict, Any, List, Union
 from sqlalchemy.orm import Session
 from app.infrastructure.database.models.user import User
 from app.core import security
+from app.core.password_pool import password_pool
+from app.infrastructure.cache.response_cache import principal_cache, user_tag
+from app.infrastructure.database.unit_of_work import after_commit
 
 class UserRepository:
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
@@ -17,8 +20,7 @@ class UserRepository:
     def create(self, db: Session, *, obj_in: Dict[str, Any]) -> User:
         db_obj = User(**obj_in)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(
@@ -36,13 +38,15 @@ class UserRepository:
         if "password" in update_data:
             password = update_data.pop("password")
             if password:
-                db_obj.password_hash = security.get_password_hash(password)
+                db_obj.password_hash = password_pool.call(security.get_password_hash, password)
         
         for field in update_data:
             if hasattr(db_obj, field):
                 setattr(db_obj, field, update_data[field])
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
+        # Role, active flag or email may have changed: re-authenticate from the DB
+        tag = user_tag(db_obj.id)
+        after_commit(db, lambda: principal_cache.invalidate(tag))
         return db_obj
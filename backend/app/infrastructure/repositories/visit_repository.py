@@ -1,15 +1,31 @@
 from typing import List, Optional, Union, Dict, Any
 import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import Load, Session, joinedload, selectinload
 from app.infrastructure.database.models.visit import Visit
 from app.infrastructure.database.models.visit_note import VisitNote
 from app.domain.schemas.visit import VisitUpdate, VisitNoteCreate
 
+# What VisitPublic shows: related rows joined (one each), notes in their own SELECT
+_VISIT_PUBLIC = (
+    joinedload(Visit.client),
+    joinedload(Visit.property),
+    joinedload(Visit.agent),
+    selectinload(Visit.notes),
+)
+
+def visit_public_loads(relationship: Any) -> Load:
+    """
+    Loads the visits of a collection `relationship` as VisitPublic shows
+    them, in one SELECT ... IN for all the parents instead of a join that
+    repeats the parent row per visit and per note.
+    """
+    return selectinload(relationship).options(*_VISIT_PUBLIC)
+
 class VisitRepository:
     def create(self, db: Session, visit_obj: Visit) -> Visit:
         db.add(visit_obj)
-        db.commit()
-        db.refresh(visit_obj)
+        db.flush()
         return visit_obj
 
     def get_by_id(self, db: Session, visit_id: uuid.UUID) -> Optional[Visit]:
@@ -34,20 +50,20 @@ class VisitRepository:
         property_id: Optional[uuid.UUID] = None,
         client_id: Optional[uuid.UUID] = None
     ) -> List[Visit]:
-        query = db.query(Visit).options(
-            joinedload(Visit.client),
-            joinedload(Visit.property),
-            joinedload(Visit.agent)
-        )
+        # Lambda statement: built and compiled once per combination of filters.
+        # _VISIT_PUBLIC is a module global, not a closure variable, so the
+        # options are part of the cached statement rather than a bound value.
+        query = lambda_stmt(lambda: select(Visit).options(*_VISIT_PUBLIC))
         
         if agent_id:
-            query = query.filter(Visit.agent_id == agent_id)
+            query += lambda s: s.where(Visit.agent_id == agent_id)
         if property_id:
-            query = query.filter(Visit.property_id == property_id)
+            query += lambda s: s.where(Visit.property_id == property_id)
         if client_id:
-            query = query.filter(Visit.client_id == client_id)
+            query += lambda s: s.where(Visit.client_id == client_id)
             
-        return query.order_by(Visit.scheduled_at.desc()).offset(skip).limit(limit).all()
+        query += lambda s: s.order_by(Visit.scheduled_at.desc(), Visit.id.desc()).offset(skip).limit(limit)
+        return db.execute(query).scalars().all()
 
     def update(
         self,
@@ -66,15 +82,14 @@ class VisitRepository:
                 setattr(visit_obj, field, update_data[field])
 
         db.add(visit_obj)
-        db.commit()
-        db.refresh(visit_obj)
+        db.flush()
         return visit_obj
 
     def delete(self, db: Session, visit_id: uuid.UUID) -> bool:
         visit = db.query(Visit).filter(Visit.id == visit_id).first()
         if visit:
             db.delete(visit)
-            db.commit()
+            db.flush()
             return True
         return False
 
@@ -85,6 +100,5 @@ class VisitRepository:
             text=text
         )
         db.add(note)
-        db.commit()
-        db.refresh(note)
+        db.flush()
         return note
@@ -1,14 +1,51 @@
+from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 from app.core.config import settings
 from app.infrastructure.api.v1.api import api_router
+from app.infrastructure.jobs.daily_metrics import run_daily_metrics_job
+from app.infrastructure.events.change_bus import change_bus, PostgresNotifyBridge
+from app.infrastructure.events.change_hooks import register_change_hooks
+from app.infrastructure.database.async_session import async_engine
+from app.infrastructure.database.replicas import (
+    READ_AFTER_HEADER, ReadYourWritesMiddleware, read_replicas, register_replica_hooks,
+)
+from app.infrastructure.database.unit_of_work import register_unit_of_work_hooks
+from app.infrastructure.database.query_stats import QueryStatsMiddleware, register_query_stats_hooks
+from app.infrastructure.database.slow_queries import register_slow_query_hooks
+
+register_change_hooks()
+register_replica_hooks()
+register_unit_of_work_hooks()
+register_query_stats_hooks()
+register_slow_query_hooks()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Tareas en segundo plano
+    tasks = []
+    if settings.METRICS_SNAPSHOT_JOB_ENABLED:
+        tasks.append(asyncio.create_task(run_daily_metrics_job(settings.METRICS_SNAPSHOT_INTERVAL_SECONDS)))
+    bridge = None
+    if settings.CHANGE_BUS_BACKEND == "postgres":
+        bridge = PostgresNotifyBridge(change_bus, settings.DATABASE_URL)
+        bridge.start()
+    yield
+    for task in tasks:
+        task.cancel()
+    if bridge is not None:
+        bridge.stop()
+    await async_engine.dispose()
+    await read_replicas.dispose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -17,7 +54,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[READ_AFTER_HEADER],
 )
+app.add_middleware(ReadYourWritesMiddleware)
+if settings.DB_QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
 
 # Servir archivos estáticos (imágenes)
 # Asegurarse que el directorio existe
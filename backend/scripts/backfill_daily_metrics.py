@@ -0,0 +1,47 @@
+"""
+Rebuilds daily dashboard KPI snapshots from created_at and the status history tables.
+
+Usage (from backend/):
+    python scripts/backfill_daily_metrics.py              # since the first recorded activity
+    python scripts/backfill_daily_metrics.py --days 90    # last 90 days
+    python scripts/backfill_daily_metrics.py --since 2025-01-01
+
+Existing snapshots in the range are overwritten (the operation is idempotent).
+"""
+import argparse
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.jobs.daily_metrics import snapshot_days
+from app.infrastructure.repositories.metrics_snapshot_repository import MetricsSnapshotRepository
+
+
+def backfill(since: Optional[date] = None, days: Optional[int] = None) -> None:
+    today = datetime.now(timezone.utc).date()
+    if days is not None:
+        since = today - timedelta(days=days - 1)
+    elif since is None:
+        with SessionLocal() as db:
+            since = MetricsSnapshotRepository().first_activity_day(db)
+        if since is None:
+            print("ℹ️  No activity recorded yet, nothing to backfill")
+            return
+
+    total_days = (today - since).days + 1
+    print(f"📊 Backfilling {total_days} daily snapshots from {since} to {today}...")
+    count = snapshot_days(since + timedelta(days=i) for i in range(total_days))
+    print(f"✅ {count} snapshots written")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--days", type=int, help="Number of days back from today")
+    group.add_argument("--since", type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    args = parser.parse_args()
+    backfill(args.since, args.days)
@@ -0,0 +1,91 @@
+"""
+Fills latitude/longitude of properties without coordinates from postal code centroids.
+
+Usage (from backend/):
+    python scripts/backfill_property_coordinates.py [--centroids ES.txt] [--dry-run]
+
+Centroids come, in order of preference, from:
+  1. properties that already have coordinates (average per postal code);
+  2. an optional offline postal code file in the GeoNames dump format
+     (tab-separated: country, postal code, place, ..., latitude, longitude),
+     e.g. https://download.geonames.org/export/zip/ES.zip.
+No external service is called. Properties whose postal code has no centroid
+are left untouched and counted in the summary.
+"""
+import argparse
+import csv
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.infrastructure.database.session import engine
+
+Centroids = Dict[str, Tuple[float, float]]
+
+
+def load_geonames_centroids(path: str) -> Centroids:
+    sums: Dict[str, list] = {}
+    with open(path, encoding="utf-8") as f:
+        for row in csv.reader(f, delimiter="\t"):
+            if len(row) < 11 or not row[9] or not row[10]:
+                continue
+            acc = sums.setdefault(row[1].strip(), [0.0, 0.0, 0])
+            acc[0] += float(row[9])
+            acc[1] += float(row[10])
+            acc[2] += 1
+    # A postal code may span several places: use their mean
+    return {code: (lat / n, lon / n) for code, (lat, lon, n) in sums.items()}
+
+
+def load_known_centroids(conn) -> Centroids:
+    rows = conn.execute(text(
+        "SELECT postal_code, avg(latitude), avg(longitude) FROM properties "
+        "WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND postal_code IS NOT NULL "
+        "GROUP BY postal_code"
+    ))
+    return {code: (lat, lon) for code, lat, lon in rows}
+
+
+def backfill(centroids_file: Optional[str] = None, dry_run: bool = False) -> None:
+    with engine.begin() as conn:
+        centroids: Centroids = load_geonames_centroids(centroids_file) if centroids_file else {}
+        centroids.update(load_known_centroids(conn))
+
+        pending = conn.execute(text(
+            "SELECT postal_code, count(*) FROM properties "
+            "WHERE (latitude IS NULL OR longitude IS NULL) AND postal_code IS NOT NULL "
+            "GROUP BY postal_code"
+        )).all()
+
+        updates = [
+            {"postal_code": code, "lat": centroids[code][0], "lon": centroids[code][1]}
+            for code, _ in pending if code in centroids
+        ]
+        updated = sum(count for code, count in pending if code in centroids)
+        missing = sum(count for code, count in pending if code not in centroids)
+
+        if updates and not dry_run:
+            conn.execute(
+                text(
+                    "UPDATE properties SET latitude = :lat, longitude = :lon "
+                    "WHERE postal_code = :postal_code AND (latitude IS NULL OR longitude IS NULL)"
+                ),
+                updates,
+            )
+
+    action = "Would update" if dry_run else "Updated"
+    print(f"📍 {action} {updated} properties across {len(updates)} postal codes")
+    if missing:
+        print(f"⚠️  {missing} properties have a postal code without known centroid")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--centroids", help="GeoNames-format postal code file")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    backfill(args.centroids, args.dry_run)
@@ -0,0 +1,175 @@
+"""
+Load comparison of the sync stack (psycopg2 Session on Starlette's threadpool)
+and the async stack (asyncpg AsyncSession on the event loop) for the hot read
+paths: showcase list and detail, dashboard and calendar.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.async_stack_load --concurrency 100 --requests 2000
+    python -m scripts.benchmarks.async_stack_load --scenario showcase_list --latency-ms 20
+
+Runs read-only against the configured database, so seed it first
+(scripts/seed.py). Each scenario fires `--requests` calls from
+`--concurrency` concurrent clients through the repository layer, the way the
+endpoints do minus HTTP: sync calls go through anyio's threadpool with
+Starlette's default 40 threads, async calls run on the event loop. Both
+engines use the DB_POOL_* settings. `--latency-ms` adds a pg_sleep to every
+call to emulate a remote database, where the threadpool cap shows the most.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+import anyio
+from anyio.to_thread import current_default_thread_limiter
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.enums import PropertyStatus
+from app.domain.schemas.property import PropertyPublic, PropertyPublicList
+from app.infrastructure.api.v1.endpoints.dashboard import build_dashboard
+from app.infrastructure.database.async_session import AsyncSessionLocal, async_engine
+from app.infrastructure.database.models import Property
+from app.infrastructure.database.session import SessionLocal, engine
+from app.infrastructure.repositories.calendar_event_repository import (
+    CalendarEventRepository, AsyncCalendarEventRepository,
+)
+from app.infrastructure.repositories.property_repository import PropertyRepository, AsyncPropertyRepository
+
+STARLETTE_THREADPOOL_SIZE = 40
+
+
+def scenarios(property_id: Any) -> Dict[str, Dict[str, Callable]]:
+    sync_properties = PropertyRepository()
+    async_properties = AsyncPropertyRepository()
+
+    async def async_detail(db: AsyncSession) -> Any:
+        return PropertyPublic.model_validate(await async_properties.get_public_by_id(db, property_id))
+
+    async def async_dashboard(db: AsyncSession) -> Any:
+        return await db.run_sync(build_dashboard)
+
+    return {
+        "showcase_list": {
+            "sync": lambda db: PropertyPublicList.model_validate(sync_properties.list_published(db, limit=20)),
+            "async": lambda db: async_properties.list_published(db, limit=20),
+        },
+        "showcase_detail": {
+            "sync": lambda db: PropertyPublic.model_validate(sync_properties.get_public_by_id(db, property_id)),
+            "async": async_detail,
+        },
+        "dashboard": {
+            "sync": lambda db: build_dashboard(db),
+            "async": async_dashboard,
+        },
+        "calendar": {
+            "sync": lambda db: CalendarEventRepository(db).get_multi(limit=50),
+            "async": lambda db: AsyncCalendarEventRepository(db).get_multi(limit=50),
+        },
+    }
+
+
+async def drive(call: Callable[[], Awaitable[None]], requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def sync_call(fn: Callable[[Session], Any], latency_ms: float) -> Callable[[], Awaitable[None]]:
+    def run() -> None:
+        with SessionLocal() as db:
+            if latency_ms:
+                db.execute(text("SELECT pg_sleep(:s)"), {"s": latency_ms / 1000})
+            fn(db)
+
+    async def call() -> None:
+        await anyio.to_thread.run_sync(run)
+
+    return call
+
+
+def async_call(fn: Callable[[AsyncSession], Awaitable[Any]], latency_ms: float) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        async with AsyncSessionLocal() as db:
+            if latency_ms:
+                await db.execute(text("SELECT pg_sleep(:s)"), {"s": latency_ms / 1000})
+            await fn(db)
+
+    return call
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    current_default_thread_limiter().total_tokens = STARLETTE_THREADPOOL_SIZE
+    with SessionLocal() as db:
+        property_id = db.execute(
+            select(Property.id).where(
+                Property.is_active == True,
+                Property.is_published == True,
+                Property.status == PropertyStatus.AVAILABLE,
+            ).limit(1)
+        ).scalar()
+    if property_id is None:
+        print("No published property found: seed the database first (scripts/seed.py)")
+        return 1
+
+    selected = scenarios(property_id)
+    if args.scenario != "all":
+        selected = {args.scenario: selected[args.scenario]}
+
+    print(
+        f"{args.requests} requests, {args.concurrency} concurrent clients, "
+        f"threadpool {STARLETTE_THREADPOOL_SIZE}, pool {engine.pool.size()}+{engine.pool._max_overflow}, "
+        f"added latency {args.latency_ms} ms"
+    )
+    print(f"{'scenario':<16} {'stack':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, calls in selected.items():
+        # Warm up both pools and the statement caches
+        await drive(sync_call(calls["sync"], 0), 20, 5)
+        await drive(async_call(calls["async"], 0), 20, 5)
+        for stack, call in (
+            ("sync", sync_call(calls["sync"], args.latency_ms)),
+            ("async", async_call(calls["async"], args.latency_ms)),
+        ):
+            result = await drive(call, args.requests, args.concurrency)
+            print(
+                f"{name:<16} {stack:<6} {result['rps']:9.1f} {result['p50']:9.1f} "
+                f"{result['p95']:9.1f} {result['p99']:9.1f}"
+            )
+    await async_engine.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=["all", "showcase_list", "showcase_detail", "dashboard", "calendar"], default="all")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Measures the authentication overhead per request, with and without the
+verified-token cache.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.auth_overhead --iterations 20000 --requests 2000
+
+Two measurements, neither touching the database:
+  * the token dependency alone: JWT signature check + TokenPayload build
+    versus a verified-token cache hit;
+  * GET /api/v1/users/me through the ASGI stack (in-process, no server),
+    with the principal cache seeded, clearing the token cache before every
+    request (before) or not (after). Both variants run in alternating blocks
+    so that drift affects them equally.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+import httpx
+from jose import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.domain.enums import UserRole
+from app.domain.schemas.token import TokenPayload
+from app.domain.schemas.user import Principal
+from app.infrastructure.api.v1.deps import get_token_payload
+from app.infrastructure.cache.response_cache import principal_cache, principal_key, user_tag
+from app.infrastructure.cache.token_cache import token_cache
+from app.main import app
+
+
+def timed(fn: Callable[[], object], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def measure_requests(headers: dict, requests: int, block: int = 100):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def request(cold: bool) -> float:
+            if cold:
+                token_cache.clear()
+            start = time.perf_counter()
+            response = await client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+            elapsed = time.perf_counter() - start
+            assert response.status_code == 200, response.text
+            return elapsed
+
+        for _ in range(block):
+            await request(cold=False)
+        cold: List[float] = []
+        warm: List[float] = []
+        while len(warm) < requests:
+            cold.extend([await request(cold=True) for _ in range(block)])
+            warm.extend([await request(cold=False) for _ in range(block)])
+        return cold, warm
+
+
+def report(label: str, samples: List[float]) -> float:
+    mean = statistics.fmean(samples) * 1e6
+    p99 = sorted(samples)[int(len(samples) * 0.99) - 1] * 1e6
+    print(f"  {label:<28} mean {mean:9.1f} µs   p99 {p99:9.1f} µs")
+    return mean
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    email = f"bench-{uuid.uuid4()}@example.com"
+    token = security.create_access_token(subject=email, role=UserRole.AGENT.value, full_name="Benchmark Agent")
+
+    def verify() -> TokenPayload:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        return TokenPayload(**payload)
+
+    print("Token dependency")
+    before = report("jwt.decode + TokenPayload", timed(verify, args.iterations))
+    token_cache.clear()
+    get_token_payload(token=token)
+    after = report("verified-token cache hit", timed(lambda: get_token_payload(token=token), args.iterations))
+    print(f"  saved {before - after:.1f} µs per request ({before / after:.1f}x)")
+
+    now = datetime.now(timezone.utc)
+    principal = Principal(
+        id=uuid.uuid4(), email=email, full_name="Benchmark Agent", role=UserRole.AGENT,
+        is_active=True, created_at=now, updated_at=now,
+    )
+    principal_cache.set(principal_key(email), principal, tags=[user_tag(principal.id)])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print("GET /users/me (principal cached, no database)")
+    before, after = asyncio.run(measure_requests(headers, args.requests))
+    before = report("token verified every time", before)
+    after = report("verified-token cache", after)
+    print(f"  saved {before - after:.1f} µs per request ({(before - after) / before:.1%} of the request)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+Measures the Python overhead per call of the hot repository queries
+(PropertyRepository.list_published, CalendarEventRepository.get_multi,
+VisitRepository.list_all): building the statement, deriving its cache key
+and looking its SQL up in the compiled cache. No database is needed.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.statement_cache --iterations 5000
+
+"before" rebuilds the ORM Query / select() on every call, as the
+repositories did until they switched to lambda statements; "after" runs
+the current repository code. Both go through a session that compiles each
+statement against the PostgreSQL dialect, with a shared compiled cache,
+instead of executing it, and rotate over the same parameter sets, so every
+statement shape is compiled once and then served from the cache. The
+compiled cache hit rate of each variant is reported alongside.
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.util import LRUCache
+
+from app.domain.enums import PropertyStatus, PropertyType
+from app.infrastructure.database.models import CalendarEvent, Property, Visit
+from app.infrastructure.repositories.calendar_event_repository import CalendarEventRepository
+from app.infrastructure.repositories.property_repository import (
+    SEARCH_CONFIG, PropertyRepository, _in_bbox, _radius_bbox, _search_query,
+)
+from app.infrastructure.repositories.visit_repository import VisitRepository
+
+
+class _NoRows:
+    # Read by Query.all() to decide whether to unwrap single-entity rows
+    _attributes: Dict[str, Any] = {}
+
+    def unique(self) -> "_NoRows":
+        return self
+
+    def scalars(self) -> "_NoRows":
+        return self
+
+    def all(self) -> List[Any]:
+        return []
+
+
+class CompileOnlySession(Session):
+    """
+    Compiles what it is asked to execute, as Connection.execute would
+    before talking to the database, and returns no rows.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dialect = postgresql.psycopg2.dialect()
+        self.compiled_cache = LRUCache(1000)
+        self.outcomes: Counter = Counter()
+
+    def execute(self, statement: Any, *args: Any, **kwargs: Any) -> _NoRows:
+        _, _, outcome = statement._compile_w_cache(
+            self.dialect, compiled_cache=self.compiled_cache, column_keys=[],
+            for_executemany=False, schema_translate_map=None,
+        )
+        self.outcomes[outcome] += 1
+        return _NoRows()
+
+
+# --- Query construction before lambda statements ---------------------------
+
+def legacy_list_published(db: Session, q=None, city=None, price_min=None, rooms=None,
+                          property_type=None, near=None, radius_km=None, sort="newest", offset=0, limit=50):
+    query = db.query(Property).filter(
+        Property.is_active == True,
+        Property.is_published == True,
+        Property.status == PropertyStatus.AVAILABLE,
+    )
+    tsquery = None
+    if q:
+        tsquery = _search_query(q)
+        query = query.filter(Property.search_vector.op("@@")(tsquery))
+    if city is not None:
+        db.execute(select(func.set_config("pg_trgm.similarity_threshold", "0.25", True)))
+        query = query.filter(or_(
+            Property.city.ilike(f"%{city}%"),
+            Property.postal_code.ilike(f"%{city}%"),
+            Property.city.op("%")(city),
+        ))
+    if price_min is not None:
+        query = query.filter(Property.price_amount >= price_min)
+    if rooms is not None:
+        query = query.filter(Property.rooms >= rooms)
+    if property_type:
+        query = query.filter(Property.property_type.in_(property_type))
+    if near is not None:
+        lat, lon = near
+        radius = radius_km
+        dlat = func.radians(Property.latitude - lat)
+        dlon = func.radians(Property.longitude - lon)
+        import math
+        a = (
+            func.power(func.sin(dlat * 0.5), 2)
+            + math.cos(math.radians(lat)) * func.cos(func.radians(Property.latitude)) * func.power(func.sin(dlon * 0.5), 2)
+        )
+        query = query.filter(_in_bbox(_radius_bbox(lat, lon, radius)), 2 * 6371.0088 * func.asin(func.sqrt(a)) <= radius)
+
+    page_query = query.options(joinedload(Property.images))
+    page_query = page_query.add_columns(func.count(Property.id).over().label("total"))
+    rank = None
+    if tsquery is not None:
+        rank = func.ts_rank_cd(Property.search_vector, tsquery)
+        headline = func.ts_headline(
+            SEARCH_CONFIG,
+            func.coalesce(Property.public_description, Property.title),
+            tsquery,
+            "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8",
+        )
+        page_query = page_query.add_columns(rank.label("search_rank"), headline.label("search_headline"))
+    if sort == "relevance":
+        page_query = page_query.order_by(rank.desc(), Property.id.desc())
+    elif sort == "price_asc":
+        page_query = page_query.order_by(Property.price_amount.asc().nulls_last(), Property.id.asc())
+    else:
+        page_query = page_query.order_by(Property.created_at.desc(), Property.id.desc())
+    return page_query.offset(offset).limit(limit + 1).all()
+
+
+def legacy_get_multi(db: Session, skip=0, limit=100, agent_id=None, start_date=None, end_date=None):
+    query = select(CalendarEvent)
+    conditions = []
+    if agent_id:
+        conditions.append(CalendarEvent.agent_id == agent_id)
+    if start_date:
+        conditions.append(CalendarEvent.starts_at >= start_date)
+    if end_date:
+        conditions.append(CalendarEvent.ends_at <= end_date)
+    if conditions:
+        query = query.where(and_(*conditions))
+    query = query.offset(skip).limit(limit).order_by(CalendarEvent.starts_at.asc())
+    return db.execute(query).scalars().all()
+
+
+def legacy_list_visits(db: Session, skip=0, limit=100, agent_id=None, property_id=None, client_id=None):
+    query = db.query(Visit).options(
+        joinedload(Visit.client),
+        joinedload(Visit.property),
+        joinedload(Visit.agent)
+    )
+    if agent_id:
+        query = query.filter(Visit.agent_id == agent_id)
+    if property_id:
+        query = query.filter(Visit.property_id == property_id)
+    if client_id:
+        query = query.filter(Visit.client_id == client_id)
+    return query.order_by(Visit.scheduled_at.desc()).offset(skip).limit(limit).all()
+
+
+# --- Parameter sets ----------------------------------------------------------
+
+def showcase_params(i: int) -> Dict[str, Any]:
+    variants = [
+        dict(sort="newest"),
+        dict(city=["Madrid", "Sevilla", "Bilbao"][i % 3], price_min=Decimal(100_000 + i % 7 * 10_000)),
+        dict(q=["piso centro", "ático terraza"][i % 2], rooms=1 + i % 4),
+        dict(sort="price_asc", property_type=[PropertyType.HOUSE, PropertyType.APARTMENT][: 1 + i % 2]),
+        dict(near=(40.4 + i % 10 / 100, -3.7), radius_km=2.0 + i % 5),
+    ]
+    params = dict(variants[i % len(variants)])
+    # First pages: with no rows coming back, later pages would fall back to a count
+    params["offset"] = 0
+    params["limit"] = 20
+    return params
+
+
+def calendar_params(i: int) -> Dict[str, Any]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=i % 30)
+    variants = [
+        dict(start_date=start, end_date=start + timedelta(days=7)),
+        dict(agent_id=uuid.uuid4(), start_date=start, end_date=start + timedelta(days=1)),
+        dict(),
+    ]
+    return {**variants[i % len(variants)], "skip": i % 3 * 100}
+
+
+def visit_params(i: int) -> Dict[str, Any]:
+    variants = [dict(), dict(agent_id=uuid.uuid4()), dict(property_id=uuid.uuid4()), dict(client_id=uuid.uuid4())]
+    return {**variants[i % len(variants)], "skip": i % 3 * 100}
+
+
+def measure(call: Callable[[CompileOnlySession, Dict[str, Any]], Any], params: Callable[[int], Dict[str, Any]],
+            iterations: int) -> Dict[str, Any]:
+    db = CompileOnlySession()
+    sets = [params(i) for i in range(iterations)]
+    for kwargs in sets[:50]:  # warm up: first compiles
+        call(db, kwargs)
+    db.outcomes.clear()
+    samples = []
+    for kwargs in sets:
+        start = time.perf_counter()
+        call(db, kwargs)
+        samples.append(time.perf_counter() - start)
+    total = sum(db.outcomes.values())
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p99_us": sorted(samples)[int(len(samples) * 0.99) - 1] * 1e6,
+        "hit_rate": db.outcomes[CACHE_HIT] / total if total else 0.0,
+    }
+
+
+def report(label: str, result: Dict[str, Any]) -> None:
+    print(
+        f"  {label:<8} mean {result['mean_us']:8.1f} µs   p99 {result['p99_us']:8.1f} µs"
+        f"   compiled cache hits {result['hit_rate']:.1%}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args = parser.parse_args()
+
+    properties = PropertyRepository()
+    visits = VisitRepository()
+    cases = [
+        (
+            "PropertyRepository.list_published",
+            legacy_list_published,
+            lambda db, kwargs: properties.list_published(db, include_total=True, **kwargs),
+            showcase_params,
+        ),
+        (
+            "CalendarEventRepository.get_multi",
+            legacy_get_multi,
+            lambda db, kwargs: CalendarEventRepository(db).get_multi(**kwargs),
+            calendar_params,
+        ),
+        (
+            "VisitRepository.list_all",
+            legacy_list_visits,
+            lambda db, kwargs: visits.list_all(db, **kwargs),
+            visit_params,
+        ),
+    ]
+    for name, before_call, after_call, params in cases:
+        print(name)
+        before = measure(lambda db, kwargs: before_call(db, **kwargs), params, args.iterations)
+        after = measure(after_call, params, args.iterations)
+        report("before", before)
+        report("after", after)
+        print(f"  saved {before['mean_us'] - after['mean_us']:.1f} µs per call "
+              f"({before['mean_us'] / after['mean_us']:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
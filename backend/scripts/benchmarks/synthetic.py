@@ -0,0 +1,74 @@
+"""
+Helpers to fill a scratch transaction with a synthetic catalogue.
+
+Everything is inserted with set-based SQL (generate_series) inside the caller's
+transaction, so benchmarks can roll back and leave the database untouched.
+"""
+import uuid
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+CITIES = [
+    "Madrid", "Barcelona", "Valencia", "Sevilla", "Zaragoza", "Málaga", "Murcia",
+    "Palma", "Bilbao", "Alicante", "Córdoba", "Valladolid", "Vigo", "Gijón",
+    "Granada", "Andújar", "Jaén", "Almería", "Cádiz", "Huelva", "Salamanca",
+    "Toledo", "Burgos", "León", "Oviedo", "Santander", "Pamplona", "Logroño",
+]
+
+
+def insert_synthetic_properties(conn: Connection, rows: int) -> None:
+    """
+    Inserts one agent, one owner and `rows` published properties spread over
+    CITIES, with random prices, sizes and creation dates.
+    """
+    agent_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+    conn.execute(text("""
+        INSERT INTO users (id, email, full_name, password_hash, role, is_active, created_at, updated_at)
+        VALUES (:id, :email, 'Benchmark Agent', 'x', 'AGENT', true, now(), now())
+    """), {"id": agent_id, "email": f"bench-{agent_id}@example.com"})
+    conn.execute(text("""
+        INSERT INTO clients (id, full_name, type, responsible_agent_id, is_active, created_at, updated_at)
+        VALUES (:id, 'Benchmark Owner', 'OWNER', :agent_id, true, now(), now())
+    """), {"id": owner_id, "agent_id": agent_id})
+    conn.execute(text("""
+        INSERT INTO properties (
+            id, title, address_line1, city, postal_code, sqm, rooms, baths, has_elevator,
+            status, property_type, operation_type, owner_client_id, captor_agent_id,
+            price_amount, price_currency, public_description,
+            is_published, is_featured, is_active, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(),
+            'Piso ' || g || ' en ' || c.city,
+            'Calle Ejemplo ' || (g % 300),
+            c.city,
+            lpad(((g * 37) % 52000)::text, 5, '0'),
+            40 + (g % 260),
+            1 + (g % 6),
+            1 + (g % 3),
+            (g % 2 = 0),
+            CASE WHEN g % 10 = 0 THEN 'SOLD'::propertystatus ELSE 'AVAILABLE'::propertystatus END,
+            (ARRAY['HOUSE','APARTMENT','OFFICE','LAND'])[1 + g % 4]::propertytype,
+            (ARRAY['SALE','RENT'])[1 + g % 2]::operationtype,
+            :owner_id,
+            :agent_id,
+            CASE WHEN g % 50 = 0 THEN NULL ELSE (50000 + (g * 7919) % 950000)::numeric END,
+            'EUR',
+            'Luminoso inmueble con terraza y vistas, cerca del centro de ' || c.city,
+            (g % 20 <> 0),
+            (g % 100 = 0),
+            true,
+            now() - ((g % 1000) || ' days')::interval,
+            now()
+        FROM generate_series(1, :rows) AS g
+        JOIN LATERAL (
+            SELECT (:cities)[1 + (g % array_length(:cities, 1))] AS city
+        ) c ON true
+    """), {"rows": rows, "owner_id": owner_id, "agent_id": agent_id, "cities": CITIES})
+    conn.execute(text("ANALYZE properties"))
+
+
+def explain(conn: Connection, sql: str, params: dict) -> str:
+    plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params).scalars().all()
+    return "\n".join(plan)
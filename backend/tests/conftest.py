@@ -1,17 +1,22 @@
 import pytest
 import os
 import sys
+from contextlib import contextmanager
 
 # Update path to include backend root
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool, NullPool
 
 from app.core.config import settings
 from app.infrastructure.database.session import SessionLocal, get_db
+from app.infrastructure.database.async_session import AsyncSessionLocal, async_database_url
+from app.infrastructure.database.pool import engine_options
 from app.infrastructure.database.base import Base
+from app.infrastructure.database.query_stats import capture_requests
 from app.main import app
 
 # Force settings to use test database
@@ -59,16 +64,23 @@ def setup_test_database():
 
     # 2. Update Settings to point to test DB
     settings.POSTGRES_DB = TEST_DB_NAME
+    # Tests trigger snapshots explicitly; no background job racing them
+    settings.METRICS_SNAPSHOT_JOB_ENABLED = False
     # Verify the property update
     expected_url = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{TEST_DB_NAME}"
     
     # 3. Create Test Engine
-    # Use NullPool to avoid connection pooling issues during tests
-    test_engine = create_engine(expected_url, poolclass=NullPool)
+    # Use NullPool to avoid connection pooling issues during tests. The
+    # session parameters (pg_trgm threshold, statement timeout) still apply.
+    test_engine = create_engine(expected_url, poolclass=NullPool, connect_args=engine_options()["connect_args"])
     
     # 4. Reconfigure SessionLocal to use test engine
     # This affects all code importing SessionLocal
     SessionLocal.configure(bind=test_engine)
+    # Same for the async endpoints (showcase, dashboard, calendar reads)
+    AsyncSessionLocal.configure(bind=create_async_engine(
+        async_database_url(expected_url), poolclass=NullPool, connect_args=engine_options(asyncpg=True)["connect_args"],
+    ))
     
     # 5. Create Tables
     # Import all models to ensure they are registered with Base
@@ -102,6 +114,18 @@ def db_session(setup_test_database):
     finally:
         session.close()
 
+@pytest.fixture(scope="function", autouse=True)
+def clear_response_caches():
+    """
+    Tests seed rows straight through the session, bypassing the repository
+    invalidation hooks, so start every test with empty caches.
+    """
+    from app.infrastructure.cache.response_cache import showcase_cache, dashboard_cache, principal_cache
+    showcase_cache.clear()
+    dashboard_cache.clear()
+    principal_cache.clear()
+    yield
+
 # Override the app dependency
 @pytest.fixture(scope="function", autouse=True)
 def override_get_db(db_session):
@@ -114,3 +138,29 @@ def override_get_db(db_session):
     app.dependency_overrides[get_db] = _get_db_override
     yield
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Asserts a statement budget on every request made inside the block:
+
+        with query_budget(3):
+            client.get("/api/v1/clients/", headers=headers)
+
+    Fails when a request runs more than `max_queries` statements, or the
+    same statement more than `max_repeats` times (N+1).
+    """
+    @contextmanager
+    def budget(max_queries: int, max_repeats: int = 1):
+        with capture_requests() as requests:
+            yield requests
+        assert requests, "No request finished inside the query budget"
+        for stats in requests:
+            statements = list(stats.statements.elements())
+            assert stats.count <= max_queries, (
+                f"{stats.endpoint} ran {stats.count} statements, budget {max_queries}: {statements}"
+            )
+            repeated = stats.repeated(max_repeats + 1)
+            assert not repeated, f"{stats.endpoint} repeated statements (N+1): {repeated}"
+    return budget
@@ -56,7 +56,7 @@ def clean_clients_db(db: Session):
         db.rollback()
 
 
-def test_read_clients_api(client: TestClient, db: Session):
+def test_read_clients_api(client: TestClient, db: Session, query_budget):
     # 1. Create a test agent
     agent = User(
         id=uuid.uuid4(),
@@ -84,10 +84,12 @@ def test_read_clients_api(client: TestClient, db: Session):
     access_token = security.create_access_token(subject=agent.email)
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    # 4. GET /api/v1/clients/
-    response = client.get("/api/v1/clients/", headers=headers)
+    # 4. GET /api/v1/clients/: user lookup + one page of clients
+    with query_budget(2):
+        response = client.get("/api/v1/clients/", headers=headers)
     
     assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
     data = response.json()
     assert len(data) >= 1
     assert any(c["full_name"] == "AAA Real Client Test" for c in data)
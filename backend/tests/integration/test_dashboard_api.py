@@ -0,0 +1,144 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.infrastructure.database.unit_of_work import unit_of_work
+from app.infrastructure.database.models import User, Client, Property, Visit
+from app.domain.enums import UserRole, ClientType, PropertyStatus, VisitStatus
+from app.core import security
+from app.infrastructure.repositories.metrics_snapshot_repository import MetricsSnapshotRepository
+from app.infrastructure.repositories.client_repository import ClientRepository
+from app.infrastructure.repositories.visit_repository import VisitRepository
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def agent_headers(db_session: Session):
+    agent = User(
+        id=uuid.uuid4(),
+        email=f"agent-dashboard-{uuid.uuid4()}@example.com",
+        password_hash=security.get_password_hash("password123"),
+        role=UserRole.AGENT,
+        full_name="Dashboard Agent",
+        is_active=True,
+    )
+    owner = Client(
+        id=uuid.uuid4(),
+        full_name="Dashboard Owner",
+        type=ClientType.OWNER,
+        responsible_agent_id=agent.id,
+    )
+    db_session.add_all([agent, owner])
+    db_session.flush()
+    prop = Property(
+        id=uuid.uuid4(),
+        title="Dashboard Property",
+        address_line1="Calle Panel 1",
+        city="Madrid",
+        sqm=60,
+        rooms=2,
+        status=PropertyStatus.SOLD,
+        owner_client_id=owner.id,
+        captor_agent_id=agent.id,
+    )
+    db_session.add(prop)
+    db_session.flush()
+    db_session.add(Visit(
+        id=uuid.uuid4(),
+        client_id=owner.id,
+        property_id=prop.id,
+        agent_id=agent.id,
+        scheduled_at=datetime.now(timezone.utc) + timedelta(days=1),
+        status=VisitStatus.PENDING,
+    ))
+    db_session.commit()
+    return {"Authorization": f"Bearer {security.create_access_token(subject=agent.email)}"}
+
+
+def test_dashboard_stats(client: TestClient, agent_headers):
+    response = client.get("/api/v1/dashboard/", headers=agent_headers)
+    assert response.status_code == 200
+    stats = response.json()["stats"]
+    assert stats["total_properties"] >= 1
+    assert stats["sold_properties"] >= 1
+    assert stats["pending_visits"] >= 1
+
+
+def test_dashboard_query_count(client: TestClient, agent_headers, query_budget):
+    # User lookup, then stats + upcoming visits + recent properties + recent operations
+    with query_budget(5):
+        response = client.get("/api/v1/dashboard/", headers=agent_headers)
+    assert response.status_code == 200
+
+
+def test_daily_metrics_snapshots(client: TestClient, db_session: Session, agent_headers):
+    repo = MetricsSnapshotRepository()
+    today = datetime.now(timezone.utc).date()
+    yesterday = today - timedelta(days=1)
+
+    with unit_of_work(db_session):
+        current = repo.snapshot(db_session, today)
+        past = repo.snapshot(db_session, yesterday)
+    # The fixture rows were created today, so they are absent from yesterday's snapshot
+    assert current["total_properties"] > past["total_properties"]
+    assert current["sold_properties"] >= 1
+    assert current["pending_visits"] >= 1
+
+    response = client.get("/api/v1/dashboard/metrics?days=2", headers=agent_headers)
+    assert response.status_code == 200
+    series = response.json()
+    assert [row["day"] for row in series] == [yesterday.isoformat(), today.isoformat()]
+    assert series[1]["total_properties"] == current["total_properties"]
+
+
+def test_agent_dashboard_is_scoped_and_cached(client: TestClient, agent_headers, query_budget):
+    response = client.get("/api/v1/dashboard/me", headers=agent_headers)
+    assert response.status_code == 200
+    data = response.json()
+    # Only the fixture agent's rows
+    assert data["stats"]["total_properties"] == 1
+    assert data["stats"]["sold_properties"] == 1
+    assert data["stats"]["total_clients"] == 1
+    assert data["stats"]["pending_visits"] == 1
+    assert [p["title"] for p in data["recent_properties"]] == ["Dashboard Property"]
+
+    # Served from the dashboard cache (and the user from the principal cache)
+    with query_budget(0):
+        assert client.get("/api/v1/dashboard/me", headers=agent_headers).json() == data
+
+
+def test_agent_dashboard_invalidated_by_repository_writes(client: TestClient, db_session: Session, agent_headers):
+    data = client.get("/api/v1/dashboard/me", headers=agent_headers).json()
+    assert data["stats"]["pending_visits"] == 1
+
+    visit = db_session.query(Visit).join(User, Visit.agent_id == User.id).filter(
+        User.full_name == "Dashboard Agent", Visit.status == VisitStatus.PENDING
+    ).order_by(Visit.created_at.desc()).first()
+    with unit_of_work(db_session):
+        VisitRepository().update(db_session, visit_obj=visit, visit_in={"status": VisitStatus.DONE})
+
+    data = client.get("/api/v1/dashboard/me", headers=agent_headers).json()
+    assert data["stats"]["pending_visits"] == 0
+
+
+def test_agent_dashboard_invalidated_by_client_writes(client: TestClient, db_session: Session, agent_headers):
+    data = client.get("/api/v1/dashboard/me", headers=agent_headers).json()
+    assert data["stats"]["total_clients"] == 1
+
+    agent = db_session.query(User).filter(User.full_name == "Dashboard Agent").order_by(User.created_at.desc()).first()
+    with unit_of_work(db_session):
+        ClientRepository().create(db_session, Client(
+            id=uuid.uuid4(), full_name="Dashboard Buyer", type=ClientType.BUYER, responsible_agent_id=agent.id,
+        ))
+
+    data = client.get("/api/v1/dashboard/me", headers=agent_headers).json()
+    assert data["stats"]["total_clients"] == 2
@@ -0,0 +1,174 @@
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.main import app
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.models import (
+    User, Client, Property, Visit, Operation, ClientNote, OperationNote, OperationStatusHistory, VisitNote, PropertyNote
+)
+from app.domain.enums import UserRole, ClientType, OperationType, OperationStatus
+from app.core import security
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+@pytest.fixture(scope="module")
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def graph(db: Session):
+    """
+    A buyer with 3 operations (one per property, 2 notes and 2 status
+    changes each), 2 visits per property (1 note each) and 5 client notes.
+    """
+    agent = User(
+        id=uuid.uuid4(),
+        email=f"agent-tabs-{uuid.uuid4()}@example.com",
+        password_hash=security.get_password_hash("password123"),
+        role=UserRole.AGENT,
+        full_name="Detail Tabs Agent"
+    )
+    owner = Client(id=uuid.uuid4(), full_name="Tabs Owner", type=ClientType.OWNER, responsible_agent_id=agent.id)
+    buyer = Client(id=uuid.uuid4(), full_name="Tabs Buyer", type=ClientType.BUYER, responsible_agent_id=agent.id)
+    db.add_all([agent, owner, buyer])
+    db.flush()
+
+    start = datetime(2026, 3, 2, 10, tzinfo=timezone.utc)
+    properties, operations = [], []
+    for i in range(3):
+        prop = Property(
+            id=uuid.uuid4(), title=f"Tabs Property {i}", address_line1="Calle Tabs 1", city="Madrid",
+            sqm=80, rooms=3, owner_client_id=owner.id, captor_agent_id=agent.id
+        )
+        db.add(prop)
+        db.flush()
+        db.add(PropertyNote(property_id=prop.id, author_user_id=agent.id, text=f"Property note {i}"))
+        operation = Operation(
+            id=uuid.uuid4(), type=OperationType.SALE, client_id=buyer.id, property_id=prop.id, agent_id=agent.id
+        )
+        db.add(operation)
+        db.flush()
+        for n, status in enumerate((OperationStatus.NEGOTIATION, OperationStatus.RESERVED)):
+            db.add(OperationStatusHistory(
+                operation_id=operation.id, from_status=OperationStatus.INTEREST, to_status=status,
+                changed_by_user_id=agent.id, changed_at=start + timedelta(hours=n)
+            ))
+            db.add(OperationNote(
+                operation_id=operation.id, author_user_id=agent.id, text=f"Operation note {n}",
+                created_at=start + timedelta(hours=n)
+            ))
+        for v in range(2):
+            visit = Visit(
+                id=uuid.uuid4(), client_id=buyer.id, property_id=prop.id, agent_id=agent.id,
+                scheduled_at=start + timedelta(days=i * 2 + v)
+            )
+            db.add(visit)
+            db.flush()
+            db.add(VisitNote(visit_id=visit.id, author_user_id=agent.id, text=f"Visit note {i}-{v}"))
+        properties.append(prop)
+        operations.append(operation)
+    for n in range(5):
+        db.add(ClientNote(
+            client_id=buyer.id, author_user_id=agent.id, text=f"Client note {n}",
+            created_at=start + timedelta(minutes=n)
+        ))
+    db.commit()
+
+    token = security.create_access_token(subject=agent.email)
+    yield {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "buyer": buyer,
+        "properties": properties,
+        "operations": operations,
+    }
+
+    db.query(ClientNote).filter(ClientNote.client_id == buyer.id).delete()
+    db.query(VisitNote).filter(VisitNote.author_user_id == agent.id).delete()
+    db.query(Visit).filter(Visit.client_id == buyer.id).delete()
+    db.query(OperationNote).filter(OperationNote.author_user_id == agent.id).delete()
+    db.query(OperationStatusHistory).filter(OperationStatusHistory.changed_by_user_id == agent.id).delete()
+    db.query(PropertyNote).filter(PropertyNote.author_user_id == agent.id).delete()
+    db.query(Operation).filter(Operation.client_id == buyer.id).delete()
+    db.query(Property).filter(Property.owner_client_id == owner.id).delete()
+    db.query(Client).filter(Client.responsible_agent_id == agent.id).delete()
+    db.query(User).filter(User.id == agent.id).delete()
+    db.commit()
+
+
+def test_client_detail_loads_each_collection_once(client: TestClient, graph, query_budget):
+    buyer_id = graph["buyer"].id
+    # User lookup, client + agent, then one SELECT ... IN per collection level
+    # (notes, visits, visit notes, operations, their history, notes and
+    # visits, those visits' notes, owned properties), whatever the row counts.
+    # Both visit note loads select 6 visits here, hence the same statement twice.
+    with query_budget(11, max_repeats=2):
+        response = client.get(f"/api/v1/clients/{buyer_id}", headers=graph["headers"])
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["notes"]) == 5
+    assert len(data["visits"]) == 6
+    assert all(len(visit["notes"]) == 1 for visit in data["visits"])
+    assert len(data["operations"]) == 3
+    assert all(len(op["visits"]) == 2 and len(op["notes"]) == 2 for op in data["operations"])
+
+
+def test_client_tabs_are_paginated(client: TestClient, graph):
+    buyer_id = graph["buyer"].id
+    headers = graph["headers"]
+
+    response = client.get(f"/api/v1/clients/{buyer_id}/notes", params={"skip": 1, "limit": 2}, headers=headers)
+    assert response.status_code == 200
+    assert [note["text"] for note in response.json()] == ["Client note 3", "Client note 2"]
+
+    response = client.get(f"/api/v1/clients/{buyer_id}/visits", params={"limit": 4}, headers=headers)
+    assert response.status_code == 200
+    visits = response.json()
+    assert len(visits) == 4
+    assert visits[0]["scheduled_at"] > visits[-1]["scheduled_at"]
+    assert visits[0]["notes"][0]["text"] == "Visit note 2-1"
+
+    response = client.get(f"/api/v1/clients/{buyer_id}/operations", params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    response = client.get(f"/api/v1/clients/{buyer_id}/notes", params={"limit": 500}, headers=headers)
+    assert response.status_code == 422
+
+    response = client.get(f"/api/v1/clients/{uuid.uuid4()}/visits", headers=headers)
+    assert response.status_code == 404
+
+
+def test_property_and_operation_tabs(client: TestClient, graph):
+    headers = graph["headers"]
+    prop = graph["properties"][1]
+    operation = graph["operations"][1]
+
+    response = client.get(f"/api/v1/properties/{prop.id}/notes", headers=headers)
+    assert [note["text"] for note in response.json()] == ["Property note 1"]
+    response = client.get(f"/api/v1/properties/{prop.id}/visits", headers=headers)
+    assert len(response.json()) == 2
+    response = client.get(f"/api/v1/properties/{prop.id}/operations", headers=headers)
+    assert [op["id"] for op in response.json()] == [str(operation.id)]
+    response = client.get(f"/api/v1/properties/{prop.id}/status-history", headers=headers)
+    assert response.status_code == 200
+
+    response = client.get(f"/api/v1/operations/{operation.id}/status-history", headers=headers)
+    assert [entry["to_status"] for entry in response.json()] == ["NEGOTIATION", "RESERVED"]
+    response = client.get(f"/api/v1/operations/{operation.id}/notes", params={"limit": 1}, headers=headers)
+    assert [note["text"] for note in response.json()] == ["Operation note 0"]
+    response = client.get(f"/api/v1/operations/{operation.id}/visits", headers=headers)
+    assert {visit["property_id"] for visit in response.json()} == {str(prop.id)}
+
+    response = client.get(f"/api/v1/operations/{uuid.uuid4()}/notes", headers=headers)
+    assert response.status_code == 404
+    response = client.get(f"/api/v1/properties/{uuid.uuid4()}/notes", headers=headers)
+    assert response.status_code == 404
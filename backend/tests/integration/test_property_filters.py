@@ -278,3 +278,220 @@ def test_showcase_limit_validation(client: TestClient, seed_data):
     """Limit cannot exceed 100."""
     response = client.get("/api/v1/properties/public?limit=200")
     assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.parametrize("sort", ["newest", "price_asc", "price_desc"])
+def test_showcase_cursor_pagination(client: TestClient, seed_data, sort):
+    """Walking next_cursor returns the same sequence as offset pagination."""
+    response_all = client.get(f"/api/v1/properties/public?limit=100&sort={sort}")
+    assert response_all.status_code == 200
+    expected_ids = [p["id"] for p in response_all.json()["items"]]
+
+    if len(expected_ids) < 2:
+        pytest.skip("Need at least 2 properties for cursor pagination test")
+
+    walked_ids = []
+    url = f"/api/v1/properties/public?limit=1&sort={sort}"
+    response = client.get(url)
+    while True:
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == len(expected_ids)
+        walked_ids.extend(p["id"] for p in body["items"])
+        if body["next_cursor"] is None:
+            break
+        response = client.get(f"{url}&cursor={body['next_cursor']}")
+
+    assert walked_ids == expected_ids
+
+
+def test_showcase_cursor_last_page_has_no_next(client: TestClient, seed_data):
+    """A page that exhausts the results returns next_cursor=null."""
+    response = client.get("/api/v1/properties/public?limit=100")
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+
+
+def test_showcase_cursor_invalid(client: TestClient, seed_data):
+    """Malformed cursors and cursors from another sort are rejected."""
+    response = client.get("/api/v1/properties/public?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    first = client.get("/api/v1/properties/public?limit=1&sort=newest").json()
+    if first["next_cursor"] is None:
+        pytest.skip("Need at least 2 properties to get a cursor")
+    response = client.get(f"/api/v1/properties/public?limit=1&sort=price_asc&cursor={first['next_cursor']}")
+    assert response.status_code == 400
+
+
+def test_showcase_total_matches_items(client: TestClient, seed_data):
+    """The windowed total equals the number of matching rows."""
+    response = client.get("/api/v1/properties/public?city=Madrid&limit=100")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == len(body["items"])
+    assert body["total_exact"] is True
+
+    # Total is still reported on a page past the end
+    response = client.get(f"/api/v1/properties/public?city=Madrid&limit=1&offset={body['total']}")
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    assert response.json()["total"] == body["total"]
+
+
+def test_showcase_skip_total(client: TestClient, seed_data):
+    """include_total=false returns items without counting."""
+    response = client.get("/api/v1/properties/public?include_total=false")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] is None
+    assert len(body["items"]) > 0
+
+
+def test_showcase_response_cache(client: TestClient, seed_data, db_session: Session):
+    """Repeated listings are served from cache until a property write purges them."""
+    url = "/api/v1/properties/public?city=Madrid&sort=price_asc"
+    first = client.get(url)
+    assert first.headers["X-Cache"] == "MISS"
+    second = client.get(url)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+    from app.infrastructure.database.unit_of_work import unit_of_work
+    from app.infrastructure.repositories.property_repository import PropertyRepository
+    prop = seed_data["properties"][0]
+    db_session.refresh(prop)
+    with unit_of_work(db_session):
+        PropertyRepository().update(
+            db_session, property_obj=prop, property_in={"title": prop.title}, user_id=seed_data["agent"].id
+        )
+    assert client.get(url).headers["X-Cache"] == "MISS"
+
+
+def test_showcase_detail_etag(client: TestClient, seed_data):
+    """Public detail exposes an ETag and honours If-None-Match."""
+    prop = seed_data["properties"][0]
+    response = client.get(f"/api/v1/properties/public/{prop.id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.json()["captor_agent"]["full_name"] == "Filter Test Agent"
+
+    response = client.get(f"/api/v1/properties/public/{prop.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Sold properties are not exposed
+    sold = next(p for p in seed_data["properties"] if p.title == "Vendido en Sevilla")
+    response = client.get(f"/api/v1/properties/public/{sold.id}")
+    assert response.status_code == 404
+
+
+def test_showcase_full_text_search(client: TestClient, seed_data):
+    """q= matches Spanish stems across title/city/address and ranks results."""
+    response = client.get("/api/v1/properties/public?q=ático salamanca")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    titles = [p["title"] for p in items]
+    assert "Ático Salamanca" in titles
+    assert "Piso Eixample" not in titles
+    assert items[0]["search_rank"] is not None
+    assert "<mark>" in items[0]["search_headline"]
+
+    # Address words are searchable too
+    response = client.get("/api/v1/properties/public?q=serrano")
+    assert "Ático Salamanca" in [p["title"] for p in response.json()["items"]]
+
+    # Sold properties stay hidden from search
+    response = client.get("/api/v1/properties/public?q=sevilla")
+    assert "Vendido en Sevilla" not in [p["title"] for p in response.json()["items"]]
+
+
+def test_showcase_filter_city_typo_tolerant(client: TestClient, seed_data):
+    """A misspelled city finds its properties via trigram similarity when city_fuzzy is set."""
+    response = client.get("/api/v1/properties/public?city=Madird")
+    assert response.json()["total"] == 0
+
+    response = client.get("/api/v1/properties/public?city=Madird&city_fuzzy=true&sort=relevance")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    titles = [p["title"] for p in items]
+    assert "Estudio Centro Madrid" in titles
+    assert "Piso Eixample" not in titles
+    assert items[0]["search_rank"] > 0
+
+
+def test_showcase_facets(client: TestClient, seed_data):
+    """Facet counts match the listing for the same filter set."""
+    listing = client.get("/api/v1/properties/public?city=Madrid&limit=100").json()
+    response = client.get("/api/v1/properties/public/facets?city=Madrid")
+    assert response.status_code == 200
+    facets = response.json()
+
+    assert facets["total"] == listing["total"]
+    assert sum(f["count"] for f in facets["property_type"]) == listing["total"]
+    assert sum(f["count"] for f in facets["operation_type"]) == listing["total"]
+    assert sum(f["count"] for f in facets["rooms"]) == listing["total"]
+    assert {f["value"] for f in facets["property_type"]} == {"HOUSE", "APARTMENT", "OFFICE", "LAND"}
+
+    priced = [p for p in listing["items"] if p["price_amount"] is not None]
+    assert sum(b["count"] for b in facets["price_histogram"]) == len(priced)
+    for bucket in facets["price_histogram"]:
+        assert float(bucket["min"]) < float(bucket["max"])
+
+    # Served from cache the second time
+    response = client.get("/api/v1/properties/public/facets?city=Madrid")
+    assert response.headers["X-Cache"] == "HIT"
+
+
+def test_showcase_geo_filters(client: TestClient, db_session: Session, seed_data):
+    """bbox and near/radius_km filters use the property coordinates."""
+    estudio, atico, eixample, ciutat_vella = seed_data["properties"][:4]
+    estudio.latitude, estudio.longitude = 40.4200, -3.7050     # Gran Vía
+    atico.latitude, atico.longitude = 40.4300, -3.6850         # Serrano
+    eixample.latitude, eixample.longitude = 41.3920, 2.1650    # Passeig de Gràcia
+    ciutat_vella.latitude, ciutat_vella.longitude = 39.4740, -0.3760
+    db_session.commit()
+
+    response = client.get("/api/v1/properties/public?bbox=-3.8,40.3,-3.6,40.5")
+    assert response.status_code == 200
+    titles = {p["title"] for p in response.json()["items"]}
+    assert {"Estudio Centro Madrid", "Ático Salamanca"} <= titles
+    assert "Piso Eixample" not in titles
+
+    # Serrano is ~2 km from Gran Vía
+    response = client.get("/api/v1/properties/public?near=40.42,-3.705&radius_km=1")
+    titles = {p["title"] for p in response.json()["items"]}
+    assert "Estudio Centro Madrid" in titles
+    assert "Ático Salamanca" not in titles
+
+    response = client.get("/api/v1/properties/public?near=40.42,-3.705&radius_km=3")
+    item = next(p for p in response.json()["items"] if p["title"] == "Ático Salamanca")
+    assert item["latitude"] == 40.43
+
+    assert client.get("/api/v1/properties/public?bbox=1,2,3").status_code == 400
+    assert client.get("/api/v1/properties/public?near=95,0").status_code == 400
+
+
+def test_showcase_map_clusters(client: TestClient, db_session: Session, seed_data):
+    """Zoomed-out views group nearby properties into one cell per area."""
+    estudio, atico, eixample = seed_data["properties"][:3]
+    estudio.latitude, estudio.longitude = 40.4200, -3.7050
+    atico.latitude, atico.longitude = 40.4300, -3.6850
+    eixample.latitude, eixample.longitude = 41.3920, 2.1650
+    db_session.commit()
+
+    url = "/api/v1/properties/public/clusters?bbox=-10,35,5,44&zoom=5"
+    response = client.get(url)
+    assert response.status_code == 200
+    clusters = response.json()["clusters"]
+
+    madrid = [c for c in clusters if abs(c["lat"] - 40.42) < 0.5 and abs(c["lon"] + 3.7) < 0.5]
+    assert len(madrid) == 1
+    assert madrid[0]["count"] >= 2
+    assert float(madrid[0]["price_min"]) <= 120000 and float(madrid[0]["price_max"]) >= 950000
+    assert any(c["property_id"] == str(eixample.id) or c["count"] > 1 for c in clusters if c["lon"] > 2)
+
+    # Served from the per-tile cache, same payload
+    assert client.get(url).json()["clusters"] == clusters
+
+    assert client.get("/api/v1/properties/public/clusters?bbox=-180,-90,180,90&zoom=12").status_code == 400
+    assert client.get("/api/v1/properties/public/clusters?bbox=-180,-90,180,90&zoom=20").status_code == 400
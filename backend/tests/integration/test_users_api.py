@@ -166,3 +166,74 @@ def test_create_user_short_password(client: TestClient, db: Session):
     # Cleanup
     db.delete(admin)
     db.commit()
+
+def test_deactivated_user_is_rejected_immediately(client: TestClient, db: Session):
+    admin = User(
+        id=uuid.uuid4(),
+        email=f"admin-{uuid.uuid4()}@example.com",
+        password_hash=security.get_password_hash("password123"),
+        role=UserRole.ADMIN,
+        full_name="Admin Test",
+        is_active=True
+    )
+    agent = User(
+        id=uuid.uuid4(),
+        email=f"agent-{uuid.uuid4()}@example.com",
+        password_hash=security.get_password_hash("password123"),
+        role=UserRole.AGENT,
+        full_name="Agent Test",
+        is_active=True
+    )
+    db.add_all([admin, agent])
+    db.commit()
+    admin_headers = {"Authorization": f"Bearer {security.create_access_token(subject=admin.email)}"}
+    agent_headers = {"Authorization": f"Bearer {security.create_access_token(subject=agent.email)}"}
+
+    # Caches the agent's principal
+    assert client.get("/api/v1/users/me", headers=agent_headers).status_code == 200
+
+    response = client.patch(f"/api/v1/users/{agent.id}", json={"is_active": False}, headers=admin_headers)
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/users/me", headers=agent_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+    # Cleanup
+    db.delete(agent)
+    db.delete(admin)
+    db.commit()
+
+def test_login_rehashes_outdated_password_hash(client: TestClient, db: Session):
+    weak_hash = security.pwd_context.hash("password123", rounds=4)
+    user = User(
+        id=uuid.uuid4(),
+        email=f"agent-{uuid.uuid4()}@example.com",
+        password_hash=weak_hash,
+        role=UserRole.AGENT,
+        full_name="Agent Test",
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+
+    response = client.post(
+        "/api/v1/login/access-token",
+        data={"username": user.email, "password": "password123"},
+    )
+    assert response.status_code == 200
+
+    db.refresh(user)
+    assert user.password_hash != weak_hash
+    assert not security.pwd_context.needs_update(user.password_hash)
+    assert security.verify_password("password123", user.password_hash)
+
+    response = client.post(
+        "/api/v1/login/access-token",
+        data={"username": user.email, "password": "wrong-password"},
+    )
+    assert response.status_code == 400
+
+    # Cleanup
+    db.delete(user)
+    db.commit()
@@ -1,7 +1,16 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 import pytest
 from fastapi import HTTPException, status
-from app.infrastructure.api.v1.deps import get_current_active_admin, get_current_active_agent
+from app.core import security
+from app.infrastructure.api.v1.deps import (
+    get_current_active_admin, get_current_active_agent, get_current_user, get_token_payload,
+)
+from app.infrastructure.cache.response_cache import principal_cache, user_tag
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.domain.schemas.token import TokenPayload
 from app.domain.enums import UserRole
 
 def test_get_current_active_admin_success():
@@ -36,3 +45,47 @@ def test_get_current_active_agent_forbidden():
     with pytest.raises(HTTPException) as excinfo:
         get_current_active_agent(current_user=mock_user)
     assert excinfo.value.status_code == status.HTTP_403_FORBIDDEN
+
+def _user_row(**overrides):
+    now = datetime.now(timezone.utc)
+    row = dict(
+        id=uuid.uuid4(), email="cached@example.com", full_name="Cached Agent", phone_number=None,
+        role=UserRole.AGENT, is_active=True, created_at=now, updated_at=now,
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+def test_get_token_payload_reads_login_claims():
+    token = security.create_access_token(subject="a@example.com", role="ADMIN", full_name="Ana")
+    payload = get_token_payload(token=token)
+    assert payload.sub == "a@example.com"
+    assert payload.role == UserRole.ADMIN
+    assert payload.full_name == "Ana"
+    # Verified once: the same token is served from the cache
+    assert get_token_payload(token=token) is payload
+
+def test_get_token_payload_rejects_bad_signature():
+    token = security.create_access_token(subject="a@example.com")
+    with pytest.raises(HTTPException) as excinfo:
+        get_token_payload(token=token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+    assert excinfo.value.status_code == status.HTTP_403_FORBIDDEN
+
+def test_get_current_user_caches_principal(monkeypatch):
+    principal_cache.clear()
+    row = _user_row()
+    lookups = MagicMock(return_value=row)
+    monkeypatch.setattr(UserRepository, "get_by_email", lambda self, db, email: lookups(email))
+    token_data = TokenPayload(sub=row.email)
+
+    first = get_current_user(db=MagicMock(), token_data=token_data)
+    second = get_current_user(db=MagicMock(), token_data=token_data)
+    assert first.id == row.id and second is first
+    assert lookups.call_count == 1
+
+    # A user update drops the entry: the next request sees the new state
+    principal_cache.invalidate(user_tag(row.id))
+    lookups.return_value = _user_row(id=row.id, is_active=False)
+    with pytest.raises(HTTPException) as excinfo:
+        get_current_user(db=MagicMock(), token_data=token_data)
+    assert excinfo.value.status_code == 400
+    assert lookups.call_count == 2
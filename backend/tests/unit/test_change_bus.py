@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+import uuid
+
+import pytest
+
+from app.domain.enums import ClientType, VisitStatus
+from app.infrastructure.database.models import Client, Visit
+from app.infrastructure.events.change_bus import ChangeBus, PostgresNotifyBridge, RESYNC
+from app.infrastructure.events.change_hooks import describe_change
+
+
+@pytest.mark.asyncio
+async def test_change_bus_delivers_from_other_threads_by_scope():
+    bus = ChangeBus(max_queue=10)
+    everyone = bus.subscribe()
+    agent = bus.subscribe("agent-1")
+
+    events = [
+        {"type": "visit", "action": "created", "agent_ids": ["agent-1"]},
+        {"type": "property", "action": "updated", "agent_ids": ["agent-2"]},
+    ]
+    publisher = threading.Thread(target=bus.publish, args=(events,))
+    publisher.start()
+    publisher.join()
+
+    assert await asyncio.wait_for(everyone.get(), 1) == events[0]
+    assert await asyncio.wait_for(everyone.get(), 1) == events[1]
+    assert await asyncio.wait_for(agent.get(), 1) == events[0]
+    await asyncio.sleep(0)
+    assert agent.queue.empty()
+
+    bus.unsubscribe(agent)
+    assert bus.subscriber_count == 1
+
+
+@pytest.mark.asyncio
+async def test_change_bus_slow_subscriber_gets_resync():
+    bus = ChangeBus(max_queue=2)
+    sub = bus.subscribe()
+    bus.publish({"type": "visit", "agent_ids": [], "n": n} for n in range(5))
+    await asyncio.sleep(0)
+
+    assert await sub.get() is RESYNC
+    assert sub.queue.empty()
+    # Back to normal delivery after the resync
+    bus.publish([{"type": "visit", "agent_ids": [], "n": 6}])
+    assert (await asyncio.wait_for(sub.get(), 1))["n"] == 6
+
+
+def test_describe_change_builds_visit_delta():
+    agent_id = uuid.uuid4()
+    visit = Visit(
+        id=uuid.uuid4(),
+        client_id=uuid.uuid4(),
+        property_id=uuid.uuid4(),
+        agent_id=agent_id,
+        status=VisitStatus.PENDING,
+    )
+    created = describe_change(visit, "created")
+    assert created["type"] == "visit"
+    assert created["agent_ids"] == [str(agent_id)]
+    assert created["status"] == "PENDING"
+    assert describe_change(object(), "created") is None
+
+
+def test_describe_change_builds_client_delta():
+    agent_id = uuid.uuid4()
+    client = Client(id=uuid.uuid4(), full_name="Ana", type=ClientType.BUYER, responsible_agent_id=agent_id, is_active=True)
+    created = describe_change(client, "created")
+    assert created["type"] == "client"
+    assert created["agent_ids"] == [str(agent_id)]
+    assert created["client_type"] == "BUYER"
+    assert "previous_status" not in created
+
+
+def test_notify_payloads_stay_under_the_postgres_limit():
+    bridge = PostgresNotifyBridge(ChangeBus(), dsn="")
+    events = [
+        {"type": "visit", "action": "created", "id": str(uuid.uuid4()), "agent_ids": [str(uuid.uuid4())], "status": "PENDING"}
+        for _ in range(200)
+    ]
+    events.append({"type": "property", "action": "updated", "id": "p1", "agent_ids": ["a1"], "title": "x" * 9000})
+
+    payloads = list(bridge._payloads(events))
+    assert len(payloads) > 1
+    assert all(len(payload.encode()) < 8000 for payload in payloads)
+    messages = [json.loads(payload) for payload in payloads]
+    assert {message["origin"] for message in messages} == {bridge.bus.origin}
+    received = [event for message in messages for event in message["events"]]
+    assert received[:-1] == events[:-1]
+    # Too big on its own: only what invalidation and routing need
+    assert received[-1] == {"type": "property", "action": "updated", "id": "p1", "agent_ids": ["a1"]}
+
+
+def test_notify_bridge_sends_from_its_own_thread():
+    sent = []
+
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            sent.append((threading.current_thread().name, json.loads(params[1])))
+
+    class FakeConnection:
+        closed = False
+
+        def cursor(self):
+            return FakeCursor()
+
+        def close(self):
+            self.closed = True
+
+    bridge = PostgresNotifyBridge(ChangeBus(), dsn="", max_queue=1)
+    bridge._connect = FakeConnection
+    bridge.send([{"type": "visit", "id": "v1"}])
+    # Queue full (the sender is not running yet): dropped, not blocking the commit
+    bridge.send([{"type": "visit", "id": "v2"}])
+    assert sent == []
+
+    bridge._listen = lambda: None
+    bridge.start()
+    bridge.stop()
+    assert [(thread, message["events"]) for thread, message in sent] == [
+        ("dashboard-changes-notifier", [{"type": "visit", "id": "v1"}]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notify_bridge_skips_malformed_payloads():
+    bus = ChangeBus()
+    bridge = PostgresNotifyBridge(bus, dsn="")
+    sub = bus.subscribe()
+    event = {"type": "visit", "action": "created", "id": "v1", "agent_ids": ["a1"]}
+
+    for payload in ("not json", "[1, 2]", '{"origin": "x", "events": [1]}', '{"origin": "x", "events": 3}'):
+        bridge._handle(payload)
+    bridge._handle(json.dumps({"origin": "other-worker", "events": [event]}))
+
+    assert await asyncio.wait_for(sub.get(), 1) == event
+    assert sub.queue.empty()
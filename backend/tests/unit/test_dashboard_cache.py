@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.api.v1.endpoints import dashboard
+from app.infrastructure.cache.response_cache import dashboard_cache, invalidate_dashboards
+
+
+class FakeSession:
+    def __init__(self, gate: asyncio.Event):
+        self.gate = gate
+        self.builds = 0
+
+    async def run_sync(self, fn, **kwargs):
+        self.builds += 1
+        build = self.builds
+        await self.gate.wait()
+        return build
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    dashboard_cache.clear()
+    yield
+    dashboard_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dashboard_misses_share_one_build():
+    gate = asyncio.Event()
+    db = FakeSession(gate)
+    waiters = [asyncio.create_task(dashboard.cached_dashboard(db)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(*waiters) == [1] * 5
+    assert db.builds == 1
+    assert dashboard_cache.get(dashboard.DASHBOARD_GLOBAL_KEY) == 1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_build_started_before_invalidation_is_not_reused():
+    gate = asyncio.Event()
+    db = FakeSession(gate)
+    first = asyncio.create_task(dashboard.cached_dashboard(db))
+    await asyncio.sleep(0)
+
+    # A write lands while the first build is running
+    invalidate_dashboards()
+    second = asyncio.create_task(dashboard.cached_dashboard(db))
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await first == 1
+    assert await second == 2
+    assert dashboard_cache.get(dashboard.DASHBOARD_GLOBAL_KEY) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_rebuild_when_the_building_request_is_cancelled():
+    gate = asyncio.Event()
+    db = FakeSession(gate)
+    leader = asyncio.create_task(dashboard.cached_dashboard(db))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(dashboard.cached_dashboard(db))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await follower == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
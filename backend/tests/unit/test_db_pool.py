@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import exc
+from app.infrastructure.database.pool import InstrumentedQueuePool
+
+def make_pool(**kwargs):
+    return InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=1, timeout=0.05, **kwargs)
+
+def test_pool_reports_checkouts_and_overflow():
+    pool = make_pool()
+    first = pool.connect()
+    second = pool.connect()
+    stats = pool.stats()
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["peak_overflow"] == 1
+    assert stats["checkouts"] == 2
+
+    first.close()
+    second.close()
+    stats = pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["overflow"] == 0
+    assert stats["peak_checked_out"] == 2
+    assert stats["max_hold_ms"] >= 0
+
+def test_pool_counts_timeouts_once():
+    pool = make_pool()
+    held = [pool.connect(), pool.connect()]
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["checkouts"] == 2
+    for conn in held:
+        conn.close()
+
+def test_async_database_url_uses_asyncpg():
+    from app.infrastructure.database.async_session import async_database_url
+    url = async_database_url("postgresql://user:secret@db:5432/crm?sslmode=require")
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.database == "crm"
+    assert dict(url.query) == {"ssl": "require"}
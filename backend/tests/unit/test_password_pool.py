@@ -0,0 +1,31 @@
+import asyncio
+import threading
+import pytest
+from app.core.password_pool import PasswordHashingPool, PasswordPoolSaturated
+
+def test_password_pool_runs_calls_and_reports_stats():
+    pool = PasswordHashingPool(workers=2, max_queue=2)
+    assert pool.call(pow, 2, 10) == 1024
+    assert asyncio.run(pool.run(pow, 3, 2)) == 9
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 0
+    assert stats["running"] == stats["queued"] == 0
+
+def test_password_pool_rejects_when_queue_is_full():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+    release = threading.Event()
+    running = pool.submit(release.wait)
+    queued = pool.submit(release.wait)
+
+    with pytest.raises(PasswordPoolSaturated):
+        pool.submit(release.wait)
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["peak_queued"] == 1
+
+    release.set()
+    assert running.result(timeout=5) and queued.result(timeout=5)
+    # Capacity is back once the burst drains
+    assert pool.call(pow, 2, 2) == 4
+    assert pool.stats()["completed"] == 3
@@ -9,7 +9,9 @@ from app.infrastructure.database.models.property_image import PropertyImage
 
 @pytest.fixture
 def mock_db():
-    return MagicMock(spec=Session)
+    db = MagicMock(spec=Session)
+    db.info = {}
+    return db
 
 @pytest.fixture
 def mock_storage():
@@ -62,6 +64,8 @@ async def test_reorder_images(use_case, mock_db, mock_repo):
     mock_repo.update_position.assert_any_call(mock_db, image_ids[0], 0)
     mock_repo.update_position.assert_any_call(mock_db, image_ids[1], 1)
     mock_repo.update_position.assert_any_call(mock_db, image_ids[2], 2)
+    # One transaction for the whole reorder
+    mock_db.commit.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_set_cover_image(use_case, mock_db, mock_repo):
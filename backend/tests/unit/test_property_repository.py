@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from app.infrastructure.database.session import SessionLocal
 from app.infrastructure.database.models import User, Client, Property
 from app.domain.enums import ClientType, PropertyStatus, UserRole
-from app.infrastructure.repositories.property_repository import PropertyRepository
+from app.infrastructure.repositories.property_repository import PropertyRepository, render_headline
 from app.core.security import get_password_hash
 
 @pytest.fixture(scope="module")
@@ -126,3 +126,11 @@ def test_property_repository_update_status(db: Session):
     db.delete(client)
     db.delete(agent)
     db.commit()
+
+def test_search_headline_escapes_listing_text():
+    # ts_headline output: markers around the match, listing text verbatim
+    raw = '<img src=x onerror="alert(1)"> Ático con \ue000terraza\ue001 & vistas'
+    assert render_headline(raw) == (
+        '&lt;img src=x onerror=&quot;alert(1)&quot;&gt; Ático con <mark>terraza</mark> &amp; vistas'
+    )
+    assert render_headline(None) is None
@@ -0,0 +1,54 @@
+import logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.infrastructure.database.query_stats import (
+    QueryStatsMiddleware, capture_requests, register_query_stats_hooks, track_queries,
+)
+
+register_query_stats_hooks()
+engine = create_engine("sqlite://")
+
+def make_app(lookups: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        # Sync endpoint: runs in the threadpool, like the repository endpoints
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            for i in range(lookups):
+                conn.execute(text("SELECT :i"), {"i": i})
+        return {"id": item_id}
+
+    return app
+
+def test_track_queries_counts_only_inside_the_block():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+    assert stats.count == 2
+    assert stats.duration > 0
+    assert stats.repeated(2) == []
+
+def test_middleware_sets_server_timing_and_reports_per_route():
+    client = TestClient(make_app(lookups=1))
+    with capture_requests() as requests:
+        response = client.get("/items/7")
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+    assert [(stats.endpoint, stats.count) for stats in requests] == [("GET /items/{item_id}", 2)]
+
+def test_repeated_statements_are_flagged_as_n_plus_one(caplog):
+    client = TestClient(make_app(lookups=6))
+    with capture_requests() as requests, caplog.at_level(logging.INFO):
+        client.get("/items/1")
+    (stats,) = requests
+    assert stats.repeated(5) == [("SELECT ?", 6)]
+    assert "GET /items/{item_id}: 7 queries" in caplog.text
+    assert "Possible N+1 in GET /items/{item_id}, statement ran 6 times: SELECT ?" in caplog.text
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+from app.infrastructure.cache.response_cache import ResponseCache
+
+def test_response_cache_hit_and_miss():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    assert cache.get("a") is None
+    cache.set("a", b"body", tags=["property:1"])
+    assert cache.get("a") == b"body"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+def test_response_cache_invalidate_by_tag():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    cache.set("list:1", b"page-1", tags=["showcase:list", "property:1", "property:2"])
+    cache.set("list:2", b"page-2", tags=["showcase:list", "property:3"])
+    cache.set("detail:2", b"detail-2", tags=["property:2"])
+
+    assert cache.invalidate("property:2") == 2
+    assert cache.get("list:1") is None
+    assert cache.get("detail:2") is None
+    assert cache.get("list:2") == b"page-2"
+
+    assert cache.invalidate("showcase:list") == 1
+    assert cache.stats()["entries"] == 0
+
+def test_response_cache_ttl_expiry():
+    cache = ResponseCache(max_entries=10, ttl_seconds=5)
+    with patch("app.infrastructure.cache.response_cache.time.monotonic", return_value=100.0):
+        cache.set("a", b"body")
+    with patch("app.infrastructure.cache.response_cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1, tags=["t"])
+    cache.set("b", 2)
+    cache.get("a")  # "b" becomes least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    # Evicted keys are removed from their tags too
+    assert cache.invalidate("t") == 1
+
+def test_invalidate_dashboards_targets_agents_and_global():
+    from app.infrastructure.cache.response_cache import (
+        dashboard_cache, invalidate_dashboards, agent_dashboard_tag, DASHBOARD_GLOBAL_TAG,
+    )
+    dashboard_cache.clear()
+    dashboard_cache.set("global", "g", tags=[DASHBOARD_GLOBAL_TAG])
+    dashboard_cache.set(agent_dashboard_tag("a1"), "a1", tags=[agent_dashboard_tag("a1")])
+    dashboard_cache.set(agent_dashboard_tag("a2"), "a2", tags=[agent_dashboard_tag("a2")])
+
+    assert invalidate_dashboards("a1", None) == 2
+    assert dashboard_cache.get("global") is None
+    assert dashboard_cache.get(agent_dashboard_tag("a1")) is None
+    assert dashboard_cache.get(agent_dashboard_tag("a2")) == "a2"
@@ -0,0 +1,172 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.domain.enums import OperationType, PropertyStatus, PropertyType
+from app.infrastructure.cache.showcase_index import ShowcaseIndex, trigram_similarity
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_row(n, city="Madrid", price=None, **overrides):
+    data = dict(
+        id=uuid.UUID(int=n),
+        created_at=BASE + timedelta(days=n),
+        price_amount=Decimal(price) if price is not None else None,
+        sqm=50 + n,
+        rooms=1 + n % 4,
+        baths=1,
+        property_type=PropertyType.APARTMENT,
+        operation_type=OperationType.SALE,
+        has_elevator=n % 2 == 0,
+        is_featured=False,
+        city=city,
+        postal_code="28001",
+        is_active=True,
+        is_published=True,
+        status=PropertyStatus.AVAILABLE,
+    )
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+@pytest.fixture
+def rows():
+    return [
+        make_row(1, price="300000"),
+        make_row(2, price="150000"),
+        make_row(3, price=None),
+        make_row(4, city="Barcelona", price="150000", postal_code="08001"),
+        make_row(5, price="500000", property_type=PropertyType.HOUSE),
+    ]
+
+
+def test_trigram_similarity_matches_pg_trgm():
+    assert trigram_similarity("Madrid", "Madrid") == 1.0
+    assert round(trigram_similarity("Madrid", "Madird"), 3) == 0.273
+    assert trigram_similarity("Madrid", "Sevilla") == 0.0
+
+
+def test_showcase_index_sorts_like_sql(rows):
+    index = ShowcaseIndex()
+    index.build(rows)
+
+    newest = index.search(sort="newest", limit=10)
+    assert [i.int for i in newest["ids"]] == [5, 4, 3, 2, 1]
+    assert newest["total"] == 5
+
+    price_asc = index.search(sort="price_asc", limit=10)
+    assert [i.int for i in price_asc["ids"]] == [2, 4, 1, 5, 3]
+
+    price_desc = index.search(sort="price_desc", limit=10)
+    assert [i.int for i in price_desc["ids"]] == [5, 1, 4, 2, 3]
+
+
+def test_showcase_index_filters(rows):
+    index = ShowcaseIndex()
+    index.build(rows)
+
+    assert index.search(sort="newest", city="adri")["total"] == 4
+    assert index.search(sort="newest", city="Madird")["total"] == 0
+    assert index.search(sort="newest", city="Madird", city_fuzzy=True)["total"] == 4
+    assert index.search(sort="newest", city="0800")["total"] == 1
+    assert index.search(sort="newest", price_max=Decimal("200000"))["total"] == 2
+    assert index.search(sort="newest", property_type=[PropertyType.HOUSE])["total"] == 1
+    assert index.search(sort="newest", has_elevator=True, rooms=3)["total"] == 1
+
+
+def test_showcase_index_keyset_cursor(rows):
+    index = ShowcaseIndex()
+    index.build(rows)
+
+    page = index.search(sort="price_asc", limit=2)
+    assert [i.int for i in page["ids"]] == [2, 4, 1]
+    # After (150000, id 4): remaining priced rows, then the unpriced one
+    cursor = ("price_asc", Decimal("150000"), uuid.UUID(int=4))
+    after = index.search(sort="price_asc", cursor=cursor, limit=10)
+    assert [i.int for i in after["ids"]] == [1, 5, 3]
+    assert after["total"] == 5
+
+    cursor = ("newest", BASE + timedelta(days=3), uuid.UUID(int=3))
+    assert [i.int for i in index.search(sort="newest", cursor=cursor)["ids"]] == [2, 1]
+
+
+def test_showcase_index_incremental_updates(rows):
+    index = ShowcaseIndex()
+    index.build(rows)
+
+    index.apply(make_row(6, price="100"))
+    index.apply(make_row(1, price="300000", is_published=False))
+    index.apply(make_row(2, price="1000000"))
+
+    result = index.search(sort="price_desc", limit=10)
+    assert [i.int for i in result["ids"]] == [2, 5, 4, 6, 3]
+
+
+def test_showcase_index_snapshot_shared_between_instances(rows, tmp_path):
+    path = str(tmp_path / "showcase")
+    writer = ShowcaseIndex(snapshot_path=path)
+    writer.build(rows)
+
+    reader = ShowcaseIndex(snapshot_path=path)
+    reader.ensure_loaded(lambda: pytest.fail("reader must load the snapshot"))
+    assert reader.search(sort="newest")["total"] == 5
+
+    # A write in one worker is visible to the others on their next search
+    writer.apply(make_row(7, city="Valencia", price="90000"))
+    assert reader.search(sort="newest", city="Valencia")["total"] == 1
+
+    # Readers can write too (copy-on-write of the mapped columns)
+    reader.apply(make_row(5, price="500000", status=PropertyStatus.SOLD))
+    assert writer.search(sort="newest")["total"] == 5
+
+
+def test_showcase_index_without_snapshot_is_rebuilt_periodically(rows):
+    index = ShowcaseIndex(rebuild_seconds=60)
+    index.ensure_loaded(lambda: rows)
+    index.ensure_loaded(lambda: pytest.fail("no rebuild before rebuild_seconds"))
+
+    # Another worker published a property: this copy only sees it once rebuilt
+    index._built_at -= 60
+    index.ensure_loaded(lambda: rows + [make_row(7, city="Valencia", price="90000")])
+    assert index.search(sort="newest", city="Valencia")["total"] == 1
+
+
+def test_showcase_index_rebuild_keeps_writes_made_while_loading(rows):
+    index = ShowcaseIndex(rebuild_seconds=60)
+    index.ensure_loaded(lambda: rows)
+    index._built_at -= 60
+
+    def load_rows():
+        # Committed after the rebuild read its rows
+        index.apply(make_row(7, city="Valencia", price="90000"))
+        index.apply(make_row(1, price="300000", is_published=False))
+        return rows
+
+    index.ensure_loaded(load_rows)
+    assert index.search(sort="newest", city="Valencia")["total"] == 1
+    assert uuid.UUID(int=1) not in index.search(sort="newest", limit=10)["ids"]
+
+
+def test_showcase_index_snapshot_meta_parsed_only_when_replaced(rows, tmp_path, monkeypatch):
+    path = str(tmp_path / "showcase")
+    writer = ShowcaseIndex(snapshot_path=path)
+    writer.build(rows)
+    reader = ShowcaseIndex(snapshot_path=path)
+    reader.ensure_loaded(lambda: pytest.fail("reader must load the snapshot"))
+
+    loads = []
+    original = reader._load_snapshot
+    monkeypatch.setattr(reader, "_load_snapshot", lambda: loads.append(1) or original())
+    reader.search(sort="newest")
+    reader.search(sort="newest")
+    assert loads == []
+
+    writer.apply(make_row(7, city="Valencia", price="90000"))
+    assert reader.search(sort="newest", city="Valencia")["total"] == 1
+    assert loads == [1]
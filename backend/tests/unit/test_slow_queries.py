@@ -0,0 +1,66 @@
+import json
+from datetime import date
+from decimal import Decimal
+import pytest
+from sqlalchemy import create_engine, text
+from app.infrastructure.database import slow_queries as module
+from app.infrastructure.database.query_stats import track_queries
+from app.infrastructure.database.slow_queries import SlowQueryLog, _read_only, redact, register_slow_query_hooks, scrub_plan
+
+@pytest.fixture
+def slow_log(monkeypatch, tmp_path):
+    # Every statement is slow at a 0 ms threshold
+    log = SlowQueryLog(0.0, path=str(tmp_path / "logs" / "slow.log"), max_entries=2)
+    monkeypatch.setattr(module, "slow_queries", log)
+    register_slow_query_hooks()
+    return log
+
+def test_redact_hides_text_and_keeps_plan_shaping_values():
+    assert redact({"email": "ana@example.com", "limit": 20, "price": Decimal("1.5"), "day": date(2026, 1, 2)}) == {
+        "email": "<str:15>", "limit": 20, "price": "1.5", "day": "2026-01-02",
+    }
+    assert redact((None, True, b"hash", list(range(12)))) == [None, True, "<bytes:4>", list(range(10)) + ["<2 more>"]]
+
+def test_plan_literals_are_scrubbed():
+    plan = (
+        "Index Scan using ix_users_email on users  (cost=0.28..8.29 rows=1 width=8)\n"
+        "  Index Cond: ((email)::text = 'o''brien@example.com'::text)\n"
+        "  Filter: ((rooms >= 3) AND (tags && '{piso,centro}'::text[]))"
+    )
+    assert scrub_plan(plan) == (
+        "Index Scan using ix_users_email on users  (cost=0.28..8.29 rows=1 width=8)\n"
+        "  Index Cond: ((email)::text = '<str:19>'::text)\n"
+        "  Filter: ((rooms >= 3) AND (tags && '<str:13>'::text[]))"
+    )
+
+def test_only_reads_are_explained():
+    assert _read_only("  select * from properties")
+    assert _read_only("WITH faceted AS (SELECT 1) SELECT * FROM faceted")
+    assert not _read_only("WITH moved AS (DELETE FROM visits RETURNING *) SELECT * FROM moved")
+    assert not _read_only("UPDATE properties SET title = %(title)s")
+
+def test_slow_statements_are_logged_with_endpoint(slow_log, tmp_path):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with track_queries({"method": "GET", "path": "/api/v1/properties/public"}):
+            conn.execute(text("SELECT :email"), {"email": "ana@example.com"})
+        conn.execute(text("SELECT :email"), {"email": "bob@example.com"})
+
+    (top,) = slow_log.top()
+    assert top["count"] == 2
+    assert top["endpoints"] == {"GET /api/v1/properties/public": 1, "-": 1}
+    assert top["last_parameters"] == ["<str:15>"]  # sqlite binds are positional
+    assert top["plan"] is None  # EXPLAIN is PostgreSQL only
+
+    lines = [json.loads(line) for line in (tmp_path / "logs" / "slow.log").read_text().splitlines()]
+    assert [line["endpoint"] for line in lines] == ["GET /api/v1/properties/public", ""]
+    assert "ana@example.com" not in json.dumps(lines)
+
+def test_cheapest_statement_is_evicted(slow_log):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        for statement in ("SELECT 1", "SELECT 1", "SELECT 2", "SELECT 3"):
+            conn.execute(text(statement))
+    statements = [entry["statement"] for entry in slow_log.top(order_by="count")]
+    assert len(statements) == 2
+    assert statements[0] == "SELECT 1"
@@ -0,0 +1,176 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.orm import Session
+from sqlalchemy.util import LRUCache
+from app.infrastructure.database.models import Property
+from app.infrastructure.database.query_stats import CompiledCacheStats, compiled_cache_usage
+from app.infrastructure.repositories.calendar_event_repository import _events_query
+from app.infrastructure.repositories.property_repository import PropertyRepository, encode_showcase_cursor
+from app.infrastructure.repositories.visit_repository import VisitRepository
+
+# Compiled SQL is cached per dialect instance, as per engine
+dialect = postgresql.psycopg2.dialect()
+
+def compile_with_cache(statement, cache):
+    compiled, extracted, outcome = statement._compile_w_cache(
+        dialect, compiled_cache=cache, column_keys=[],
+        for_executemany=False, schema_translate_map=None,
+    )
+    return compiled, compiled.construct_params(extracted_parameters=extracted, escape_names=False), outcome
+
+class NoRows:
+    def unique(self):
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+class CompileOnlySession(Session):
+    """
+    Compiles what repositories execute, through one compiled cache, and
+    keeps (compiled, params, outcome) of each statement instead of running it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.cache = LRUCache(100)
+        self.executed = []
+
+    def execute(self, statement, *args, **kwargs):
+        self.executed.append(compile_with_cache(statement, self.cache))
+        return NoRows()
+
+def test_events_query_is_compiled_once_and_rebinds_values():
+    cache = LRUCache(10)
+    first_agent, second_agent = uuid.uuid4(), uuid.uuid4()
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    first, first_params, outcome = compile_with_cache(_events_query(skip=0, limit=50, agent_id=first_agent, start_date=start, end_date=None), cache)
+    assert outcome == CACHE_MISS
+    second, second_params, outcome = compile_with_cache(_events_query(skip=100, limit=20, agent_id=second_agent, start_date=None, end_date=None), cache)
+    assert outcome == CACHE_MISS  # another combination of filters
+    third, third_params, outcome = compile_with_cache(_events_query(skip=200, limit=10, agent_id=second_agent, start_date=start.replace(day=9), end_date=None), cache)
+    assert outcome == CACHE_HIT
+    assert third is first
+    assert first_params != third_params
+    assert sorted(map(str, third_params.values())) == sorted(map(str, [second_agent, start.replace(day=9), 10, 200]))
+
+def test_compiled_cache_outcomes_are_counted():
+    stats = CompiledCacheStats()
+    for outcome in (CACHE_MISS, CACHE_HIT, CACHE_HIT, CACHE_HIT):
+        stats.record(outcome)
+    assert stats.snapshot() == {"hits": 3, "misses": 1, "hit_rate": 0.75, "uncached": {}}
+
+def test_compiled_cache_usage():
+    engine = create_engine("sqlite://", query_cache_size=50)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert compiled_cache_usage(engine)["capacity"] == 50
+    assert compiled_cache_usage(create_engine("sqlite://", query_cache_size=0)) == {"entries": 0, "capacity": 0}
+
+def list_published(db, **filters):
+    PropertyRepository().list_published(db, include_total=False, **filters)
+    return db.executed[-1]
+
+def assert_rebinds(db, first_filters, second_filters, expected):
+    first, first_params, outcome = list_published(db, **first_filters)
+    assert outcome == CACHE_MISS
+    second, second_params, outcome = list_published(db, **second_filters)
+    assert outcome == CACHE_HIT
+    assert second is first
+    assert first_params != second_params
+    for value in expected:
+        assert value in second_params.values()
+
+def test_published_query_rebinds_filters():
+    db = CompileOnlySession()
+    assert_rebinds(
+        db,
+        dict(city="Madrid", price_min=Decimal("100000"), rooms=2, offset=0),
+        dict(city="Sevilla", price_min=Decimal("250000"), rooms=3, offset=40),
+        ["%Sevilla%", Decimal("250000"), 3, 40],
+    )
+    assert_rebinds(
+        db,
+        dict(q="piso centro", limit=20),
+        dict(q="ático terraza", limit=10),
+        ["ático terraza", 11],
+    )
+
+def test_published_query_rebinds_geo_filters():
+    db = CompileOnlySession()
+    assert_rebinds(
+        db,
+        dict(near=(40.4168, -3.7038), radius_km=2.0),
+        dict(near=(41.3874, 2.1686), radius_km=5.0),
+        [41.3874, 2.1686, 5.0],
+    )
+    assert_rebinds(
+        db,
+        dict(bbox=(-4.0, 40.0, -3.5, 40.6)),
+        dict(bbox=(2.0, 41.2, 2.3, 41.5)),
+        [2.0, 41.2, 2.3, 41.5],
+    )
+
+def test_published_query_rebinds_cursor_seek():
+    db = CompileOnlySession()
+    first = Property(id=uuid.uuid4(), price_amount=Decimal("120000"), created_at=datetime(2026, 3, 1, tzinfo=timezone.utc))
+    second = Property(id=uuid.uuid4(), price_amount=Decimal("340000"), created_at=datetime(2026, 2, 1, tzinfo=timezone.utc))
+    assert_rebinds(
+        db,
+        dict(sort="price_asc", cursor=encode_showcase_cursor("price_asc", first)),
+        dict(sort="price_asc", cursor=encode_showcase_cursor("price_asc", second)),
+        [Decimal("340000"), second.id],
+    )
+    assert_rebinds(
+        db,
+        dict(sort="newest", cursor=encode_showcase_cursor("newest", first)),
+        dict(sort="newest", cursor=encode_showcase_cursor("newest", second)),
+        [second.created_at, second.id],
+    )
+
+def test_published_query_compiles_each_sort_once():
+    db = CompileOnlySession()
+    statements = {}
+    for sort in ("newest", "price_asc", "price_desc", "newest", "price_asc", "price_desc"):
+        compiled, _, outcome = list_published(db, sort=sort)
+        assert outcome == (CACHE_HIT if sort in statements else CACHE_MISS)
+        assert statements.setdefault(sort, compiled) is compiled
+    assert len({id(compiled) for compiled in statements.values()}) == 3
+    # Relevance ranks on the city, a different shape again
+    _, params, outcome = list_published(db, city="Madird", sort="relevance")
+    assert outcome == CACHE_MISS
+    _, params, outcome = list_published(db, city="Bilbao", sort="relevance")
+    assert outcome == CACHE_HIT
+    assert "Bilbao" in params.values()
+
+def test_visit_list_is_compiled_once_and_rebinds_values():
+    db = CompileOnlySession()
+    repo = VisitRepository()
+    first_agent, second_agent = uuid.uuid4(), uuid.uuid4()
+
+    repo.list_all(db, agent_id=first_agent)
+    first, first_params, outcome = db.executed[-1]
+    assert outcome == CACHE_MISS
+    repo.list_all(db, agent_id=second_agent, skip=100, limit=20)
+    second, second_params, outcome = db.executed[-1]
+    assert outcome == CACHE_HIT
+    assert second is first
+    assert {second_agent, 100, 20} <= set(second_params.values())
+
+    repo.list_all(db, property_id=uuid.uuid4())
+    assert db.executed[-1][2] == CACHE_MISS  # another combination of filters
+    repo.list_all(db, client_id=uuid.uuid4())
+    assert db.executed[-1][2] == CACHE_MISS
+    property_id = uuid.uuid4()
+    repo.list_all(db, property_id=property_id, skip=50)
+    compiled, params, outcome = db.executed[-1]
+    assert outcome == CACHE_HIT
+    assert {property_id, 50} <= set(params.values())
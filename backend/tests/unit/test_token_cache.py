@@ -0,0 +1,29 @@
+from unittest.mock import patch
+from app.infrastructure.cache.token_cache import VerifiedTokenCache
+
+def test_token_cache_hit_until_token_expiry():
+    cache = VerifiedTokenCache(max_entries=10)
+    with patch("app.infrastructure.cache.token_cache.time.time", return_value=1000.0):
+        cache.set("token-a", {"sub": "a@example.com"}, expires_at=1060)
+        assert cache.get("token-a") == {"sub": "a@example.com"}
+        assert cache.get("token-b") is None
+    with patch("app.infrastructure.cache.token_cache.time.time", return_value=1060.0):
+        assert cache.get("token-a") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 2, "hit_ratio": 0.3333}
+
+def test_token_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_entries=2)
+    far = 4_000_000_000
+    cache.set("t1", "c1", expires_at=far)
+    cache.set("t2", "c2", expires_at=far)
+    assert cache.get("t1") == "c1"
+    cache.set("t3", "c3", expires_at=far)
+    assert cache.get("t2") is None
+    assert cache.get("t1") == "c1"
+    assert cache.get("t3") == "c3"
+
+def test_token_cache_skips_tokens_without_expiry():
+    cache = VerifiedTokenCache(max_entries=2)
+    cache.set("t1", "c1", expires_at=None)
+    assert cache.get("t1") is None
+    assert VerifiedTokenCache(max_entries=0).get("t1") is None
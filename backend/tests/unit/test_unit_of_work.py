@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.infrastructure.database.unit_of_work import after_commit, register_unit_of_work_hooks, unit_of_work
+
+@pytest.fixture
+def session():
+    register_unit_of_work_hooks()
+    db = Session(create_engine("sqlite://"))
+    yield db
+    db.close()
+
+def test_nested_units_commit_once():
+    db = MagicMock(spec=Session)
+    db.info = {}
+    with unit_of_work(db):
+        with unit_of_work(db):
+            pass
+        db.commit.assert_not_called()
+    db.commit.assert_called_once()
+    db.rollback.assert_not_called()
+
+def test_error_rolls_back_the_whole_unit():
+    db = MagicMock(spec=Session)
+    db.info = {}
+    with pytest.raises(ValueError):
+        with unit_of_work(db):
+            with unit_of_work(db):
+                raise ValueError("step two failed")
+    db.commit.assert_not_called()
+    db.rollback.assert_called_once()
+    assert db.info["unit_of_work_depth"] == 0
+
+def test_after_commit_callbacks_run_on_commit_only(session):
+    calls = []
+    with unit_of_work(session):
+        after_commit(session, lambda: calls.append("committed"))
+        assert calls == []
+    assert calls == ["committed"]
+
+    with pytest.raises(ValueError):
+        with unit_of_work(session):
+            after_commit(session, lambda: calls.append("rolled back"))
+            raise ValueError
+    with unit_of_work(session):
+        pass
+    assert calls == ["committed"]
@@ -0,0 +1,5 @@
+#!/bin/sh
+# Lets the db-replica service (docker compose --profile replica) stream WAL
+# from this server. Runs on the first start of an empty data volume only.
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -5,11 +5,16 @@ export async function apiRequest<T>(
   options: RequestInit = {}
 ): Promise<T> {
   const token = typeof window !== "undefined" ? localStorage.getItem("token") : null;
+  // Returned by the API after a write: keeps our next reads off lagging replicas
+  const readAfter = typeof window !== "undefined" ? localStorage.getItem("readAfter") : null;
 
   const headers = new Headers(options.headers);
   if (token) {
     headers.set("Authorization", `Bearer ${token}`);
   }
+  if (readAfter) {
+    headers.set("X-Read-After", readAfter);
+  }
   if (!headers.has("Content-Type") && !(options.body instanceof FormData)) {
     headers.set("Content-Type", "application/json");
   }
@@ -21,6 +26,11 @@ export async function apiRequest<T>(
     headers,
   });
 
+  const issuedReadAfter = response.headers.get("X-Read-After");
+  if (issuedReadAfter && typeof window !== "undefined") {
+    localStorage.setItem("readAfter", issuedReadAfter);
+  }
+
   if (!response.ok) {
     const errorData = await response.json().catch(() => ({ detail: "Error desconocido" }));
     // console.error(`❌ API Error [${response.status}]:`, errorData);